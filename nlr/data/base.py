@@ -12,7 +12,7 @@
 # URL      : https://github.com/john-james-sf/nlr                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # Created  : Monday, November 8th 2021, 1:20:26 am                                                                         #
-# Modified : Wednesday, November 10th 2021, 11:20:38 am                                                                    #
+# Modified : Sunday, October 18th 2026, 6:10:45 pm                                                                         #
 # Modifier : John James (john.james.sf@gmail.com)                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # License  : BSD 3-clause "New" or "Revised" License                                                                       #
@@ -21,31 +21,111 @@
 """Defines base classes for workers, managers, jobs, and directors."""
 from datetime import datetime
 from abc import ABC, abstractmethod
+import os
 import logging
+import multiprocessing as mp
+import threading
+import time
+import weakref
+from collections import Counter
 from typing import Callable, Any
 import uuid
-from multiprocessing.Manager import Queue
 
+from nlr.utils.config import Config
 from nlr.utils.system import Profiler
+from nlr.utils.loggers import set_job_context
+from nlr.utils.spans import SpanRecorder, span, recording, current_path
+from nlr.utils.stacks import StackSampler, write_collapsed
+from nlr.utils.history import ProfileHistory, profile_record
+from nlr.utils.accounting import CostLedger
+from nlr.utils.journal import ProjectJournal, SUCCEEDED, COMPLETED, FAILED
+from nlr.utils.incremental import StepInputs, StepCache, params_digest
+from nlr.utils import sharedarray
 
 # ------------------------------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
 # ------------------------------------------------------------------------------------------------------------------------ #
+# Job parameters that distinguish a job from others of the same class across runs, e.g. the category downloaded.
+KEY_PARAMS = ['category', 'filename', 'key']
+# Job parameters that measure the size of a job's work, in order of preference, as in the datasource table.
+SIZE_PARAMS = ['download_size', 'size', 'n']
+# Job parameters giving the bytes a job downloads, as in the datasource table.
+TRANSFER_PARAMS = ['download_size']
+# Execution classes of jobs. I/O-bound jobs run on threads; cpu and mixed jobs run on the process pool.
+EXECUTION_CLASSES = ['io', 'cpu', 'mixed']
+# ------------------------------------------------------------------------------------------------------------------------ #
 
 
 class Job(ABC):
     """Encapsulates the parameters, processes, and results of a job.
 
+    Subclasses declare their execution class: 'io' for jobs that mostly wait on the network, disk or a database, such
+    as downloads and metadata updates, 'cpu' for computation, and 'mixed' for jobs with substantial computation
+    between their I/O. I/O-bound jobs run on threads, many at a time, rather than occupying pool processes.
+
+    Jobs may also declare their peak memory in bytes, where it is known better than it can be estimated from the
+    job's history or size, for admission against the project's memory budget.
+
+    Jobs that are idempotent, whose outputs are committed atomically, as with nlr.utils.file.atomic_output, so that
+    running them twice leaves the same outputs as running them once, may be duplicated when they straggle.
+
     Arguments:
         params: Dictionary containing the parameters of the job
 
     """
 
+    execution = 'cpu'
+    memory = None
+    idempotent = False
+
     def __init__(self, params: dict) -> None:
         # Identifier used by resource and project management.
         self.id = str(uuid.uuid4())
         self.name = self.__class__.__name__
         self.params = params
+        # Identifier of the project to which the job belongs. Assigned by the Manager.
+        self.project_id = None
+        # Path of the span under which the job's spans are recorded. Assigned by the Manager.
+        self.span_parent = ()
+        # Seconds between stack samples, or None if stack sampling is disabled. Assigned by the Manager.
+        self.stack_interval = None
+        # Seconds between Profiler resource samples, or None for the counters alone. Assigned by the Manager.
+        self.profile_interval = None
+
+    def _param(self, names: list) -> Any:
+        get = getattr(self.params, 'get', None)
+        if get is None:
+            return None
+        for name in names:
+            value = get(name)
+            if value is not None:
+                return value
+        return None
+
+    @property
+    def key(self) -> str:
+        """Identifies the job across runs, so its cost can be estimated from its history."""
+        param = self._param(KEY_PARAMS)
+        return self.name if param is None else "{}:{}".format(self.name, param)
+
+    @property
+    def size(self) -> float:
+        """The size of the job's work from its parameters, or None if they do not give one."""
+        size = self._param(SIZE_PARAMS)
+        return None if size is None else float(size)
+
+    @property
+    def transfer_size(self) -> float:
+        """The bytes the job downloads from its parameters, or None if they do not give them."""
+        size = self._param(TRANSFER_PARAMS)
+        return None if size is None else float(size)
+
+    def inputs(self) -> StepInputs:
+        """Returns the job's declared inputs and outputs, or None if the job runs every time.
+
+        A job that declares them is skipped while its inputs and outputs are unchanged since it last succeeded.
+        """
+        return None
 
     def setup(self) -> None:
         pass
@@ -73,38 +153,169 @@ class Project:
         self.worker = worker
         self.first_job_start = None
         self.last_job_end = None
+        # Duration of the run and the cost in dollars of its jobs' resource usage, rolled up as results arrive.
         self.project_duration = None
         self.project_cost = None
+        # The jobs' total resource usage, and its usage and cost by stage and category once the run completes.
+        self.usage = {}
+        self.cost_summary = None
+        self.cost_summary_filepath = None
         self.jobs = []
         self.results = []
+        # If True, jobs run even if their declared inputs and outputs are unchanged since they last succeeded.
+        self.force = False
+        # Ids of the jobs skipped because they were up to date.
+        self.skipped = []
+        # If True, the project and its jobs' states are journaled, so that an interrupted run can be resumed. The
+        # Results of the jobs that succeed are pickled under the journal directory until the project completes, so
+        # journaling takes as much disk as the project's results.
+        self.journal = False
+        # Ids of the jobs that succeeded in an earlier, interrupted run of the project, if it was resumed.
+        self.resumed = []
+        # Estimated resource needs of the jobs, if they were created in plan mode.
+        self.plan = None
+        # Makespan predicted by the scheduler, in seconds, or None if the scheduler had no history to predict it.
+        self.predicted_makespan = None
+        # Jobs that raised, as JobFailure objects collected by the dispatcher.
+        self.failures = []
+        # The Manager that creates the project's jobs and processes their results.
+        self.manager = None
+        # Span tree aggregated across the project's manager and jobs.
+        self.spans = SpanRecorder()
+        # Opt-in stack sampling. Set stack_interval to the seconds between samples to sample the jobs' stacks.
+        self.stack_interval = None
+        self.stacks = Counter()
+        self.stacks_filepath = None
+        # Seconds between Profiler resource samples in each job, each with a full snapshot at its end. None profiles
+        # each job from its CPU, memory and I/O counters alone.
+        self.profile_interval = None
+        # ConcurrencyPolicy bounding the pool workers running the project's jobs. None uses the default policy.
+        self.concurrency = None
+        # Projects sharing the pool service run the jobs of the highest priority first, and share the pool by weight
+        # among projects of equal priority.
+        self.priority = 0
+        self.weight = 1.0
+        # Bytes of estimated peak RSS admitted to the pool at once, when the project runs alone on its pool. Projects on
+        # the pool service share its budget instead. None budgets a fraction of the available memory.
+        self.memory_budget = None
+        # Shared arrays returned by the jobs are released when the project is closed or garbage collected.
+        self._finalizer = weakref.finalize(self, sharedarray.release, self.id)
+
+    def __enter__(self) -> 'Project':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state['_finalizer']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._finalizer = weakref.finalize(self, sharedarray.release, self.id)
+
+    def close(self) -> None:
+        """Releases the shared arrays returned by the project's jobs. Views of them remain valid until released."""
+        self._finalizer()
 
 
 # ------------------------------------------------------------------------------------------------------------------------ #
 
 
+class Results:
+    """Object to capture Job results. This is encapsulated inside the Job object."""
+
+    def __init__(self):
+        self.job_id = None          # Id of the job that produced the results
+        self.job_name = None        # Name of the job that produced the results
+        self.job_key = None         # Key of the job across runs
+        self.job_size = None        # Size of the job's work from its parameters
+        self.worker = None          # Name of worker object assigned during job execution
+        self.process = None         # Process name that executed the job
+        self.start_time = None
+        self.end_time = None
+        self.duration = None
+        # Results are also encapsulated within the job.
+        self.result = None
+        # Spans recorded while executing the job, exported for merging into the project's span tree.
+        self.spans = {}
+        # Stack sample counts, if stack sampling was enabled for the job.
+        self.stacks = {}
+        # Profiler statistics for the job, including the sampling summary if the job was sampled.
+        self.profile = {}
+        # Resources the job used and, once the Manager has priced them, their cost, for cost accounting.
+        self.usage = {}
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
 class Worker(ABC):
-    def __init__(self, job: Job, queue: Queue, configurer: Callable, results: Results):
-        self.job = job
-        self.queue = queue
-        self.configurer = configurer
-        self.results = results
+    """Executes a job in a pool worker process.
 
-    def run(self):
-        self.job.start_time = datetime.now()
+    Logging and configuration for the worker process are set up by the pool initializer. Workers that transfer
+    data over the network add the bytes transferred to net_bytes, to be accounted for in the job's cost.
+    """
+
+    def __init__(self, job: Job):
+        self.job = job
 
-        self.configurer(self.queue)
+    def run(self) -> Results:
+        results = Results()
+        results.job_id = self.job.id
+        results.job_name = self.job.name
+        results.job_key = self.job.key
+        results.job_size = self.job.size
+        results.worker = self.__class__.__name__
+        results.process = mp.current_process().name
+        results.start_time = datetime.now()
+        set_job_context(self.job.id, self.job.project_id)
 
         message = 'Worker {} started.'.format(self.job.name)
         logging.info(message)
 
-        self.job.result = self._run()
+        # Jobs are profiled from their counters alone unless resource sampling is enabled for the project.
+        profiler = Profiler(self.job.name, interval=self.job.profile_interval,
+                            snapshot=bool(self.job.profile_interval))
+        profiler.start()
+
+        sampler = None
+        if self.job.stack_interval:
+            sampler = StackSampler(self.job.stack_interval, threads=[threading.get_ident()])
+            sampler.start()
+
+        recorder = SpanRecorder()
+        self.net_bytes = 0
+        try:
+            with recording(recorder, parent=self.job.span_parent):
+                with span(self.job.name):
+                    results.result = self._run()
+        finally:
+            if sampler:
+                sampler.stop()
+            profiler.end()
+        results.profile = dict(profiler.stats, **profiler.summary())
+        results.spans = recorder.export()
+        if sampler:
+            results.stacks = sampler.export()
+
+        results.end_time = datetime.now()
+        results.duration = results.end_time - results.start_time
+        results.usage = dict(profiler.usage(), wall_time=results.duration.total_seconds(), net_bytes=self.net_bytes)
+        self.job.results = results
 
-        self.job.end_time = datetime.now()
-
-        self.job.duration = self.job.end_time - self.job.start_time
         message = "Worker {} completed in {}.".format(
-            self.job.name, duration)
+            self.job.name, results.duration)
         logging.info(message)
+        return results
+
+    def share(self, array) -> sharedarray.ArrayHandle:
+        """Returns a handle to a copy of the array in shared memory, to return in place of a large array."""
+        return sharedarray.share(array, self.job.project_id)
+
+    def allocate(self, shape: tuple, dtype='float64') -> sharedarray.ArrayHandle:
+        """Returns a handle to a new shared array, to fill through its array attribute and return."""
+        return sharedarray.allocate(shape, dtype, self.job.project_id)
 
     @abstractmethod
     def _run(self):
@@ -113,67 +324,394 @@ class Worker(ABC):
 # ------------------------------------------------------------------------------------------------------------------------ #
 
 
-class Results:
-    """Object to capture Job results. This is encapsulated inside the Job object."""
+class Reducer(ABC):
+    """Streaming aggregation of job results.
 
-    def __init__(self):
-        self.worker = None          # Name of worker object assigned during job execution
-        self.process = None         # Process name that executed the job
-        self.start_time = None
-        self.end_time = None
-        self.duration = None
-        # Results are also encapsulated within the job.
-        self.result = None
-# ------------------------------------------------------------------------------------------------------------------------ #
+    A reducer folds job results into a state as they complete, rather than holding every result until the end of
+    the project. Pool workers accumulate the results of each chunk of jobs into a partial state, and the Manager
+    merges the partial states as chunks complete. Reducers are pickled to the workers, so keep them stateless.
+    """
+
+    @abstractmethod
+    def init(self) -> Any:
+        """Returns an empty state."""
+        pass
+
+    @abstractmethod
+    def accumulate(self, state: Any, result: Any) -> Any:
+        """Folds a job's result into the state and returns the state."""
+        pass
+
+    @abstractmethod
+    def merge(self, left: Any, right: Any) -> Any:
+        """Combines two states and returns the combined state."""
+        pass
+
+    def finalize(self, state: Any) -> Any:
+        """Returns the project result from the final state."""
+        return state
 
 
+class TreeMerge:
+    """Merges partial states pairwise, as a binary counter, so that equal-sized partials are merged together.
+
+    At most log2(n) partial states are held for n partials added, and the cost of merging states that grow with their
+    contents, such as lists or frames, stays proportional to n log n rather than n squared.
+
+    Arguments:
+        reducer: The reducer whose merge combines the partial states.
+    """
+
+    def __init__(self, reducer: Reducer) -> None:
+        self.reducer = reducer
+        self._levels = []
+
+    def add(self, partial: Any) -> None:
+        level = 0
+        while level < len(self._levels) and self._levels[level] is not None:
+            partial = self.reducer.merge(self._levels[level], partial)
+            self._levels[level] = None
+            level += 1
+        if level == len(self._levels):
+            self._levels.append(partial)
+        else:
+            self._levels[level] = partial
+
+    def result(self) -> Any:
+        # Higher levels hold earlier partials.
+        state = self.reducer.init()
+        for partial in reversed(self._levels):
+            if partial is not None:
+                state = self.reducer.merge(state, partial)
+        return state
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
 class Manager(ABC):
-    """Orchestrates the execution of projects containing multiple jobs."""
+    """Orchestrates the execution of projects containing multiple jobs.
+
+    Results may be processed all at once with process_results, or streamed with begin_results, process_result
+    and end_results as jobs complete. A Manager whose _create_reducer returns a Reducer aggregates the results as
+    they arrive and retains none of them; otherwise the results are collected and passed to _process_results.
+    """
+
+    # Profile records appended to the profile history per batch while results are streamed.
+    profile_batch_size = 1000
+    # Seconds between commits of the journal while results are streamed.
+    journal_interval = 1.0
 
     def __init__(self, project: Project, *args, **kwargs):
         self.project = project
-
-    def create_jobs(self):
+        self.project.manager = self
+        self.reducer = self._create_reducer()
+        # Step cache and inputs of the jobs that declared them, set when the jobs are created.
+        self._steps = None
+        self._inputs = {}
+        # The project journal, and whether the results of a resumed run are still to be replayed.
+        self._journal = None
+        self._replay = False
+        # Whether the jobs were created in plan mode, and the project is to be journaled once it runs.
+        self._planned = False
+
+    def create_jobs(self, plan: bool = False):
+        """Creates the project's jobs, leaving out those that are up to date.
+
+        Arguments:
+            plan: If True, the jobs are created but the project is not journaled, and the estimated duration,
+                bytes transferred, disk usage and peak memory of each job and of the project are returned as a
+                ProjectPlan, which is also assigned to the project. The jobs remain, so the project can then be run,
+                and it is journaled when its results begin.
+        """
 
         # Start message
         message = "Project {} creating jobs.".format(self.project.name)
         logger.info(message)
 
         # Create jobs
-        self.project.jobs = self._create_jobs(self.project.params)
+        self.start_time = datetime.now()
+        # The project's spans, including those of its jobs, are rooted under the project name.
+        self._span_root = current_path() + (self.project.name,)
+        with recording(self.project.spans, parent=self._span_root):
+            with span('create_jobs'):
+                self.project.jobs = self._create_jobs(self.project.params)
+        for job in self.project.jobs:
+            if job.execution not in EXECUTION_CLASSES:
+                raise ValueError("Job {} has execution class {}. Expected one of {}.".format(
+                    job.name, job.execution, EXECUTION_CLASSES))
+            job.project_id = self.project.id
+            job.span_parent = self._span_root
+            job.stack_interval = self.project.stack_interval
+            job.profile_interval = self.project.profile_interval
+        self._skip_current_jobs()
+        self._planned = plan
+        if plan:
+            return self._plan_jobs()
+        self._record_project()
 
         message = "{} created {} jobs.".format(
             self.__class__.__name__, len(self.project.jobs))
         logger.info(message)
 
+    def _plan_jobs(self):
+        """Estimates the jobs' resource needs from their sizes and the profile history, and logs the plan."""
+        # Imported here, as nlr.process imports this module.
+        from nlr.process.plan import ProjectPlan
+        self.project.plan = ProjectPlan.from_jobs(self.project.name, self.project.jobs)
+        logger.info(self.project.plan.report())
+        return self.project.plan
+
+    def _record_project(self) -> None:
+        """Records the project and its jobs in the journal, if the project is journaled."""
+        self._journal = None
+        if not self.project.journal:
+            return
+        try:
+            self._journal = ProjectJournal()
+            self._journal.record_project(self.project)
+        except Exception as e:
+            logger.warning("Project {} journal unavailable. It cannot be resumed. {}".format(self.project.name, e))
+            self._journal = None
+
+    def resume_jobs(self) -> None:
+        """Prepares a project loaded from the journal to run only the jobs that have not succeeded.
+
+        The stored results of the jobs that succeeded, and the partial states reduced from them, are replayed into
+        the project's results when results are next processed.
+        """
+        states = self._journal.job_states(self.project.id)
+        self.project.resumed = [job.id for job in self.project.jobs if states.get(job.id) == SUCCEEDED]
+        resumed = set(self.project.resumed)
+        self.project.jobs = [job for job in self.project.jobs if job.id not in resumed]
+        self.project.failures = []
+        self.start_time = datetime.now()
+        self._replay = True
+        logger.info("Project {} resumed with {} of {} jobs complete.".format(
+            self.project.name, len(resumed), len(resumed) + len(self.project.jobs)))
+
+    def _skip_current_jobs(self) -> None:
+        """Removes the jobs that are up to date, and notes the inputs of those to record when they succeed."""
+        self._steps = None
+        self._inputs = {}
+        declared = [(job, job.inputs()) for job in self.project.jobs]
+        declared = [(job, inputs) for job, inputs in declared if inputs is not None]
+        if not declared:
+            return
+        try:
+            self._steps = StepCache()
+        except Exception as e:
+            logger.warning("Project {} step cache unavailable. All jobs will run. {}".format(self.project.name, e))
+            return
+        skipped = set()
+        for job, inputs in declared:
+            key = "{}/{}/{}".format(self.project.name, job.key, params_digest(job.params))
+            if not self.project.force and self._steps.is_current(key, inputs):
+                skipped.add(job.id)
+            else:
+                self._inputs[job.id] = (key, inputs)
+        self.project.skipped = list(skipped)
+        self.project.jobs = [job for job in self.project.jobs if job.id not in skipped]
+        self._steps.save()
+        if skipped:
+            logger.info("Project {} skipped {} jobs that are up to date.".format(self.project.name, len(skipped)))
+
     def process_results(self, results: list):
+        self.begin_results()
+        for result in results:
+            self.process_result(result)
+        self.end_results()
+
+    def begin_results(self) -> None:
+        """Prepares to receive job results as they complete."""
 
         # Start message
         message = "Project {} compiling results.".format(self.project.name)
         logger.info(message)
 
-        self.project.results = self._process_results(results)
+        self._results = [] if self.reducer is None else None
+        self._state = self.reducer.init() if self.reducer is not None else None
+        self._partials = TreeMerge(self.reducer) if self.reducer is not None else None
+        self._profile_records = []
+        self._ledger = CostLedger()
+        self._committed = time.monotonic()
+        if self._planned:
+            # Planned projects are journaled only once they are run.
+            self._planned = False
+            self._record_project()
+        if self._replay:
+            self._replay_results()
+
+    def _replay_results(self) -> None:
+        """Folds in the stored results and partial states of the jobs that succeeded before the project resumed."""
+        self._replay = False
+        for pointer in self._journal.partials(self.project.id):
+            self._partials.add(self._journal.load(pointer))
+        for pointer in self._journal.results(self.project.id):
+            self._fold_result(self._journal.load(pointer))
+
+    def process_result(self, result: Results) -> None:
+        """Folds a completed job's results into the project and journals them."""
+        self._fold_result(result)
+        if getattr(result, 'profile', None):
+            self._profile_records.append(profile_record(
+                self.project.id, self.project.name, result.job_id, result.profile,
+                job_key=result.job_key, size=result.job_size, usage=result.usage))
+            if len(self._profile_records) >= self.profile_batch_size:
+                self._record_profiles()
+        if self._journal is not None:
+            self._journal.succeeded(self.project.id, result.job_id,
+                                    self._journal.store(self.project.id, result.job_id, result))
+            # Results reduced inside a worker are committed with their chunk's partial state.
+            if self.reducer is None or result.result is not None:
+                self._commit_journal()
+
+    def process_failure(self, failure) -> None:
+        """Journals a job that raised, as a JobFailure, so that it runs again if the project is resumed."""
+        if self._journal is not None:
+            self._journal.failed(self.project.id, failure.job_id, failure.error)
+
+    def _commit_journal(self, force: bool = False) -> None:
+        """Commits the journal if journal_interval seconds have passed since the last commit, or if forced."""
+        if self._journal is not None and (force or time.monotonic() - self._committed >= self.journal_interval):
+            self._journal.commit()
+            self._committed = time.monotonic()
+
+    def _fold_result(self, result: Results) -> None:
+        self.project.spans.merge(getattr(result, 'spans', {}))
+        self.project.stacks.update(getattr(result, 'stacks', {}))
+        if result.start_time and (self.project.first_job_start is None
+                                  or result.start_time < self.project.first_job_start):
+            self.project.first_job_start = result.start_time
+        if result.end_time and (self.project.last_job_end is None or result.end_time > self.project.last_job_end):
+            self.project.last_job_end = result.end_time
+        self._ledger.add(result)
+        self.project.project_cost = self._ledger.cost
+        self.project.usage = self._ledger.totals
+
+        if result.job_id in self._inputs:
+            self._steps.record(*self._inputs.pop(result.job_id))
+
+        if self.reducer is None:
+            self._results.append(result)
+        elif result.result is not None:
+            # Results reduced inside a worker arrive with their result already folded into a partial state.
+            self._state = self.reducer.accumulate(self._state, result.result)
+
+    def process_partial(self, partial: Any) -> None:
+        """Merges a partial state reduced by a pool worker and journals it.
+
+        A chunk's partial state arrives before its jobs' results, so the journal is committed here, with the
+        previous chunk's partial state and job states together, before this chunk's are written.
+        """
+        self._partials.add(partial)
+        if self._journal is not None:
+            self._commit_journal(force=True)
+            pointer = self._journal.store(self.project.id, "partial-{}".format(uuid.uuid4().hex), partial)
+            if pointer is None:
+                # Its jobs would be journaled as succeeded without their reduced results, so journaling stops.
+                self._journal = None
+                logger.warning("Project {} journaling stopped.".format(self.project.name))
+            else:
+                self._journal.record_partial(self.project.id, pointer)
+
+    def end_results(self) -> None:
+        """Completes the project once all job results have been received."""
+        if self._steps is not None:
+            self._steps.save()
+        if self.project.stacks:
+            self._write_stacks()
+        self._record_profiles()
+
+        with recording(self.project.spans, parent=self._span_root):
+            with span('process_results'):
+                if self.reducer is None:
+                    self.project.results = self._process_results(self._results)
+                else:
+                    self._partials.add(self._state)
+                    self.project.results = self.reducer.finalize(self._partials.result())
+        self._results = self._state = self._partials = None
 
         duration = datetime.now() - self.start_time
+        self.project.project_duration = duration
+        self._record_costs()
+        if self._journal is not None:
+            self._journal.set_project_state(self.project.id, FAILED if self.project.failures else COMPLETED)
+            self._commit_journal(force=True)
+            if not self.project.failures:
+                # Nothing remains to be resumed, so the stored results are no longer needed.
+                self._journal.discard_stored(self.project.id)
 
         # Start message
-        message = "Project {} complete. Duration: {}.".format(
-            self.project.name, duration)
+        message = "Project {} complete. Duration: {}. Cost: ${:.4f}.".format(
+            self.project.name, duration, self.project.project_cost or 0.0)
         logger.info(message)
+        self._report_makespan()
+
+    def _report_makespan(self) -> None:
+        """Logs the scheduler's predicted makespan against the actual span from first job start to last job end."""
+        if self.project.first_job_start is None or self.project.predicted_makespan is None:
+            return
+        actual = (self.project.last_job_end - self.project.first_job_start).total_seconds()
+        predicted = self.project.predicted_makespan
+        error = (actual - predicted) / predicted if predicted else float('nan')
+        logger.info("Project {} makespan: predicted {:.2f}s, actual {:.2f}s ({:+.0%}).".format(
+            self.project.name, predicted, actual, error))
+
+    def _write_stacks(self) -> None:
+        """Writes the project's sampled stacks in collapsed-stack format under the log directory."""
+        filename = "{}_{}.folded".format(self.project.name, self.project.id)
+        filepath = os.path.join(Config().read_config('LOGGING', 'logdir'), 'stacks', filename)
+        self.project.stacks_filepath = write_collapsed(self.project.stacks, filepath)
+        logger.info("Project {} stack samples written to {}.".format(
+            self.project.name, filepath))
+
+    def _record_costs(self) -> None:
+        """Summarizes the jobs' usage and cost by stage and category, and stores the table as a file and in the
+        project_cost table of the metadata database."""
+        self.project.cost_summary = self._ledger.summary(self.project.id, self.project.name)
+        self._ledger = None
+        if self.project.cost_summary.empty:
+            return
+        try:
+            self.project.cost_summary_filepath = CostLedger.save(self.project.cost_summary)
+        except Exception as e:
+            logger.warning("Project {} cost summary not stored. {}".format(self.project.name, e))
+        try:
+            CostLedger.insert(self.project.cost_summary)
+        except Exception as e:
+            logger.warning("Project {} cost summary not inserted into the database. {}".format(self.project.name, e))
+
+    def _record_profiles(self) -> None:
+        """Appends the job profiles received since the last call to the profile history."""
+        records, self._profile_records = self._profile_records, []
+        if not records:
+            return
+        try:
+            ProfileHistory().append(records)
+        except Exception as e:
+            logger.warning("Project {} job profiles not recorded. {}".format(
+                self.project.name, e))
 
     @abstractmethod
     def _create_jobs(self, params: list) -> list:
         pass
 
-    @abstractmethod
+    def _create_reducer(self) -> Reducer:
+        """Returns the Reducer that aggregates the job results, or None to collect them for _process_results."""
+        return None
+
     def _process_results(self, results: list) -> Any:
-        pass
+        """Returns the project result from the collected job results. Not called when the Manager has a Reducer."""
+        return results
 
 
 # ------------------------------------------------------------------------------------------------------------------------ #
 class Builder(ABC):
     """Abstraction for building the data."""
 
+    def inputs(self, step: str) -> StepInputs:
+        """Returns the declared inputs and outputs of the named step, or None if the step runs every time."""
+        return None
+
     @property
     @abstractmethod
     def data(self) -> None:
@@ -201,7 +739,7 @@ class Builder(ABC):
 
 
 # ------------------------------------------------------------------------------------------------------------------------ #
-class BuilderRatings(BUILDER):
+class BuilderRatings(Builder):
     """Builds ratings data."""
 
     @property
@@ -251,7 +789,7 @@ class BuilderReviews(Builder):
 class Director(ABC):
     """Orchestrates the data building process via delegation to a builder object."""
 
-    def __init__(self, resource_manager: ResourceManager):
+    def __init__(self, resource_manager: Any):
         self.name = self.__class__.__name__
         self._builder = None
         self._resource_manager = resource_manager
@@ -264,19 +802,30 @@ class Director(ABC):
     def builder(self, builder: Builder) -> None:
         self._builder = builder
 
-    def build_ratings_data(self) -> None:
-        self._builder.build_metadata()
-        self._builder.extract_data()
-        self._builder.explore_data()
-        self._builder.clean_data()
-        self._builder.transform_data()
-
-    def build_reviews_data(self) -> None:
-        self._builder.build_metadata()
-        self._builder.extract_data()
-        self._builder.explore_data()
-        self._builder.clean_data()
-        self._builder.transform_data()
+    def build_ratings_data(self, force: bool = False) -> None:
+        with span('{}.build_ratings_data'.format(self.name)):
+            self._build(force)
+
+    def build_reviews_data(self, force: bool = False) -> None:
+        with span('{}.build_reviews_data'.format(self.name)):
+            self._build(force)
+
+    def _build(self, force: bool = False) -> None:
+        """Runs the builder's steps, skipping those whose declared inputs and outputs are unchanged, unless forced."""
+        steps = None
+        for step in ['build_metadata', 'extract_data', 'explore_data', 'clean_data', 'transform_data']:
+            inputs = self._builder.inputs(step)
+            key = "{}.{}".format(self._builder.__class__.__name__, step)
+            if inputs is not None and steps is None:
+                steps = StepCache()
+            if inputs is not None and not force and steps.is_current(key, inputs):
+                logger.info("{} step {} is up to date.".format(self.name, step))
+                continue
+            with span(step):
+                getattr(self._builder, step)()
+            if inputs is not None:
+                steps.record(key, inputs)
+                steps.save()
 
 
 if __name__ == '__main__':
@@ -12,7 +12,7 @@
 # URL      : https://github.com/john-james-sf/nlr                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # Created  : Monday, November 8th 2021, 8:59:27 pm                                                                         #
-# Modified : Saturday, November 13th 2021, 3:11:33 pm                                                                      #
+# Modified : Sunday, October 18th 2026, 5:50:30 pm                                                                         #
 # Modifier : John James (john.james.sf@gmail.com)                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # License  : BSD 3-clause "New" or "Revised" License                                                                       #
@@ -300,6 +300,38 @@ class TableAdmin:
             logger.error(msg)
             raise Exception(msg)
 
+    def insert(self, table: str, df: pd.DataFrame, connection: mysql.connector.connect) -> None:
+        """Inserts the rows of the data into the table, after any rows it already has.
+
+        Arguments:
+            table: The name of the table, whose insert statement is in SEQUEL.
+            df: DataFrame containing the rows to insert, with columns in the order of the insert statement.
+            connection: A MySQL connection to the database.
+
+        """
+
+        self._check_connection(connection)
+
+        # Missing values are inserted as NULL, and timestamps as the datetimes the connector converts.
+        df = df.astype(object).where(df.notna(), None)
+        data = [tuple(v.to_pydatetime() if isinstance(v, pd.Timestamp) else v for v in row)
+                for row in self.df_to_tuplelist(df)]
+
+        cursor = connection.cursor()
+
+        query = SEQUEL[table]['insert']['sql']
+
+        try:
+            cursor.executemany(query, data)
+            connection.commit()
+        except mysql.connector.Error as e:
+            msg = "Error in {} {}. Error: {}".format(
+                self.__class__.__name__, inspect.stack()[0][3], e)
+            logger.error(msg)
+            raise Exception(msg)
+        finally:
+            cursor.close()
+
     def drop(self, tables: list, connection: mysql.connector.connect) -> None:
         """Drops a list of tables if they exist
 
@@ -12,7 +12,7 @@
 # URL      : https://github.com/john-james-sf/nlr                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # Created  : Saturday, November 13th 2021, 12:07:15 pm                                                                     #
-# Modified : Sunday, November 14th 2021, 5:25:51 pm                                                                        #
+# Modified : Sunday, October 18th 2026, 4:45:57 pm                                                                         #
 # Modifier : John James (john.james.sf@gmail.com)                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # License  : BSD 3-clause "New" or "Revised" License                                                                       #
@@ -23,6 +23,8 @@ import logging
 import mysql.connector
 import pandas as pd
 from typing import Union, Any
+
+from nlr.utils.spans import span
 # ------------------------------------------------------------------------------------------------------------------------ #
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
@@ -34,6 +36,7 @@ logger = logging.getLogger(__name__)
 class DBEngine:
     """Reads, and writes the database on behalf of administration and data access objects."""
 
+    @span('DBEngine.load')
     def load(self, query: Query, connection: mysql.connector.connect) -> None:
 
         try:
@@ -44,6 +47,7 @@ class DBEngine:
         finally:
             cursor.close()
 
+    @span('DBEngine.read')
     def read(self, query: Query, connection: mysql.connector.connect, as_df: bool = False) -> Union[pd.DataFrame, dict]:
         try:
             cursor = connection.cursor()
@@ -55,6 +59,7 @@ class DBEngine:
         finally:
             cursor.close()
 
+    @span('DBEngine.write')
     def write(self, query: Query, connection: mysql.connector.connect) -> None:
         try:
             cursor = connection.cursor()
@@ -12,7 +12,7 @@
 # URL      : https://github.com/john-james-sf/nlr                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # Created  : Monday, November 8th 2021, 9:00:56 pm                                                                         #
-# Modified : Sunday, November 14th 2021, 4:48:10 pm                                                                        #
+# Modified : Sunday, October 18th 2026, 5:15:30 pm                                                                         #
 # Modifier : John James (john.james.sf@gmail.com)                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # License  : BSD 3-clause "New" or "Revised" License                                                                       #
@@ -57,6 +57,25 @@ CREATE TABLE IF NOT EXISTS dataset(
 )
 """
 
+TABLES['project_cost'] = """
+CREATE TABLE IF NOT EXISTS project_cost(
+    id INT AUTO_INCREMENT PRIMARY KEY NOT NULL,
+    run_id VARCHAR(36) NOT NULL,
+    project VARCHAR(100) NOT NULL,
+    stage VARCHAR(100) NOT NULL,
+    category VARCHAR(100),
+    jobs INT NOT NULL,
+    wall_time DOUBLE,
+    cpu_seconds DOUBLE,
+    peak_rss BIGINT,
+    read_bytes BIGINT,
+    write_bytes BIGINT,
+    net_bytes BIGINT,
+    cost DOUBLE,
+    created DATETIME
+)
+"""
+
 SEQUEL = {}
 SEQUEL['datasource'] = {
     'create_table':
@@ -204,6 +223,31 @@ SEQUEL['datasource'] = {
             'qtype': 'exists',
             'sql': """SELECT EXISTS(SELECT 1 FROM datasource WHERE category = %s)""",
         },
+}
 
-
+SEQUEL['project_cost'] = {
+    'create_table':
+        {
+            'name': 'create_table',
+            'description': 'Creates the project_cost table',
+            'table': 'project_cost',
+            'qtype': 'create_table',
+            'sql': TABLES['project_cost'],
+        },
+    'select_project':
+        {
+            'name': 'select_project',
+            'description': 'Select the cost summaries of a project',
+            'table': 'project_cost',
+            'qtype': 'select',
+            'sql': """SELECT * from project_cost WHERE project = %s""",
+        },
+    'insert':
+        {
+            'name': 'insert_project_cost',
+            'description': 'Insert a project cost summary row into the project_cost table.',
+            'table': 'project_cost',
+            'qtype': 'insert',
+            'sql': """INSERT INTO project_cost (run_id, project, stage, category, jobs, wall_time, cpu_seconds, peak_rss, read_bytes, write_bytes, net_bytes, cost, created) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)""",
+        },
 }
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \config_benchmark.py                                                                                          #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 4:36:45 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 4:36:45 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+"""Micro-benchmark of configuration reads with and without the parsed-config cache."""
+import os
+import tempfile
+import time
+from configparser import ConfigParser
+
+from nlr.utils.config import Config
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+def _make_configfile(directory: str, n_sections: int = 20, n_options: int = 8) -> str:
+    """Creates a configuration file of roughly the size of the project config."""
+    config = ConfigParser()
+    for i in range(n_sections):
+        config['SECTION_{}'.format(i)] = {
+            'option_{}'.format(j): 'value_{}_{}'.format(i, j) for j in range(n_options)}
+    filepath = os.path.join(directory, 'config.ini')
+    with open(filepath, 'w') as fp:
+        config.write(fp)
+    return filepath
+
+
+def _uncached_read_section(filepath: str, section: str) -> dict:
+    """Reproduces the pre-cache read_section: one parse for the section plus one per option."""
+    config = ConfigParser()
+    config.read(filepath)
+    d = {}
+    for option in config[section]:
+        option_config = ConfigParser()
+        option_config.read(filepath)
+        d[option] = option_config[section][option]
+    return d
+
+
+def _rate(read, duration: float) -> float:
+    """Returns the number of reads per second achieved by the read callable."""
+    n = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < duration:
+        read()
+        n += 1
+    return n / (time.perf_counter() - start)
+
+
+def benchmark(duration: float = 2.0) -> dict:
+    """Measures read_config and read_section reads per second, before and after the cache."""
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = _make_configfile(directory)
+        config = Config(filepath)
+
+        def uncached_read_config():
+            parser = ConfigParser()
+            parser.read(filepath)
+            return parser['SECTION_0']['option_0']
+
+        results = {}
+        results['read_config'] = (_rate(uncached_read_config, duration),
+                                  _rate(lambda: config.read_config('SECTION_0', 'option_0'), duration))
+        results['read_section'] = (_rate(lambda: _uncached_read_section(filepath, 'SECTION_0'), duration),
+                                   _rate(lambda: config.read_section('SECTION_0'), duration))
+    return results
+
+
+if __name__ == '__main__':
+    print("{:<15}{:>18}{:>18}{:>10}".format(
+        'Read', 'Before (reads/s)', 'After (reads/s)', 'Speedup'))
+    for name, (before, after) in benchmark().items():
+        print("{:<15}{:>18,.0f}{:>18,.0f}{:>9.1f}x".format(
+            name, before, after, after / before))
+# %%
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \dispatch_benchmark.py                                                                                        #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 4:50:22 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 4:50:22 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+"""Compares per-job apply_async submission with chunked dispatch for many tiny jobs."""
+import time
+import multiprocessing as mp
+
+from nlr.data.base import Job
+from nlr.process.dispatch import Dispatcher
+# ------------------------------------------------------------------------------------------------------------------------ #
+N_JOBS = 100000
+PROCESSES = 4
+
+
+class TinyJob(Job):
+    def run(self) -> None:
+        pass
+
+
+class TinyWorker:
+    def __init__(self, job: Job) -> None:
+        self.job = job
+
+    def run(self) -> int:
+        return self.job.params
+
+
+def _run_one(worker, job):
+    return worker(job).run()
+
+
+def per_job(jobs: list) -> float:
+    """Submits each job with its own apply_async call and collects the results."""
+    with mp.Pool(processes=PROCESSES) as pool:
+        start = time.perf_counter()
+        handles = [pool.apply_async(_run_one, args=(TinyWorker, job)) for job in jobs]
+        results = [h.get() for h in handles]
+        elapsed = time.perf_counter() - start
+    assert len(results) == len(jobs)
+    return elapsed
+
+
+def chunked(jobs: list, chunksize: int = None) -> float:
+    """Submits the jobs through the Dispatcher."""
+    with mp.Pool(processes=PROCESSES) as pool:
+        start = time.perf_counter()
+        results, failures = Dispatcher(pool, TinyWorker, processes=PROCESSES, chunksize=chunksize).run(jobs)
+        elapsed = time.perf_counter() - start
+    assert len(results) == len(jobs) and not failures
+    return elapsed
+
+
+def benchmark(n_jobs: int = N_JOBS) -> dict:
+    jobs = [TinyJob(i) for i in range(n_jobs)]
+    return {'per job': per_job(jobs),
+            'chunked, 256': chunked(jobs, 256),
+            'chunked, auto': chunked(jobs)}
+
+
+if __name__ == '__main__':
+    mp.freeze_support()
+    timings = benchmark()
+    baseline = timings['per job']
+    for method, seconds in timings.items():
+        print("{:<16}{:>10.2f} s{:>12.0f} jobs/s{:>8.1f}x".format(
+            method, seconds, N_JOBS / seconds, baseline / seconds))
+# %%
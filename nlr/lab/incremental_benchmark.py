@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \incremental_benchmark.py                                                                                     #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 5:05:45 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 5:05:45 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+"""Times the up-to-date check of an unchanged build against hashing its files from scratch."""
+import os
+import time
+import tempfile
+
+from nlr.utils.incremental import StepInputs, StepCache
+# ------------------------------------------------------------------------------------------------------------------------ #
+N_FILES = 40
+FILE_MB = 8
+
+
+def _make_files(directory: str) -> list:
+    filepaths = []
+    block = os.urandom(1 << 20)
+    for i in range(N_FILES):
+        filepath = os.path.join(directory, 'category_{}.json.gz'.format(i))
+        with open(filepath, 'wb') as fp:
+            for _ in range(FILE_MB):
+                fp.write(block)
+        filepaths.append(filepath)
+    return filepaths
+
+
+def benchmark() -> dict:
+    with tempfile.TemporaryDirectory() as directory:
+        filepaths = _make_files(directory)
+        # Each download step's output is the input of its extract step.
+        steps = {}
+        for i, filepath in enumerate(filepaths):
+            steps['download_{}'.format(i)] = StepInputs(params={'url': filepath}, version='1', outputs=[filepath])
+            steps['extract_{}'.format(i)] = StepInputs(files=[filepath], version='1', outputs=[filepath])
+
+        cache = StepCache(os.path.join(directory, 'steps'))
+        start = time.perf_counter()
+        for key, inputs in steps.items():
+            cache.record(key, inputs)
+        cache.save()
+        first = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cache = StepCache(os.path.join(directory, 'steps'))
+        current = sum(cache.is_current(key, inputs) for key, inputs in steps.items())
+        noop = time.perf_counter() - start
+        assert current == len(steps)
+    return {'record (hashing {} MB)'.format(N_FILES * FILE_MB): first, 'no-op check': noop}
+
+
+if __name__ == '__main__':
+    for method, seconds in benchmark().items():
+        print("{:<28}{:>10.3f} s".format(method, seconds))
+# %%
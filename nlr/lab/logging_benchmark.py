@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \logging_benchmark.py                                                                                         #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 4:40:26 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 4:40:26 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+"""Benchmark of multiprocessing log transports: records per second delivered to the listener's log file."""
+import os
+import tempfile
+import time
+import logging
+import logging.handlers
+import multiprocessing as mp
+
+from nlr.process.parallel import listener_process
+from nlr.utils.loggers import BatchQueueHandler, BufferedFileHandler
+# ------------------------------------------------------------------------------------------------------------------------ #
+N_RECORDS = 32000
+WORKERS = [1, 2, 4, 8, 16, 32]
+FORMAT = '%(asctime)s %(processName)-10s %(name)s %(levelname)-8s %(message)s'
+
+
+def _configurer(handler_class, logfilepath: str):
+    def configure():
+        h = handler_class(logfilepath)
+        h.setFormatter(logging.Formatter(FORMAT))
+        logging.getLogger().addHandler(h)
+    return configure
+
+
+def _work(queue, handler_class, n: int) -> None:
+    root = logging.getLogger()
+    root.handlers = []
+    h = handler_class(queue)
+    root.addHandler(h)
+    root.setLevel(logging.DEBUG)
+    logger = logging.getLogger('benchmark')
+    for i in range(n):
+        logger.info("Record %d of %d", i, n)
+    h.close()
+
+
+def _run(transport: str, n_workers: int, logfilepath: str) -> float:
+    """Returns records per second from first record logged to last record written."""
+    if transport == 'manager':
+        manager = mp.Manager()
+        queue = manager.Queue(-1)
+        queue_handler, file_handler = logging.handlers.QueueHandler, logging.FileHandler
+    else:
+        queue = mp.Queue()
+        queue_handler, file_handler = BatchQueueHandler, BufferedFileHandler
+
+    listener = mp.Process(target=listener_process, args=(queue, _configurer(file_handler, logfilepath)))
+    listener.start()
+
+    n = N_RECORDS // n_workers
+    start = time.perf_counter()
+    workers = [mp.Process(target=_work, args=(queue, queue_handler, n)) for _ in range(n_workers)]
+    [w.start() for w in workers]
+    [w.join() for w in workers]
+    queue.put(None)
+    listener.join()
+    elapsed = time.perf_counter() - start
+
+    if transport == 'manager':
+        manager.shutdown()
+    with open(logfilepath) as fp:
+        assert sum(1 for _ in fp) == n * n_workers
+    os.remove(logfilepath)
+    return n * n_workers / elapsed
+
+
+def benchmark() -> list:
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        logfilepath = os.path.join(directory, 'benchmark.log')
+        for n_workers in WORKERS:
+            results.append((n_workers, _run('manager', n_workers, logfilepath),
+                            _run('batched', n_workers, logfilepath)))
+    return results
+
+
+if __name__ == '__main__':
+    mp.set_start_method('fork')
+    print("{:>8}{:>22}{:>22}{:>10}".format('Workers', 'Manager.Queue (rec/s)', 'Batched (rec/s)', 'Speedup'))
+    for n_workers, manager, batched in benchmark():
+        print("{:>8}{:>22,.0f}{:>22,.0f}{:>9.1f}x".format(n_workers, manager, batched, batched / manager))
+# %%
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \schedule_benchmark.py                                                                                        #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 5:00:28 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 5:00:28 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+"""Compares the makespan of jobs submitted in list order with longest-processing-time-first scheduling."""
+import time
+import multiprocessing as mp
+
+import pandas as pd
+
+from nlr.data.base import Job, Worker
+from nlr.process.dispatch import Dispatcher
+from nlr.process.schedule import CostModel, LPTScheduler
+# ------------------------------------------------------------------------------------------------------------------------ #
+PROCESSES = 4
+# Seconds of work per unit of size.
+RATE = 0.01
+
+
+class SleepJob(Job):
+    def run(self) -> None:
+        pass
+
+
+class SleepWorker(Worker):
+    def _run(self) -> None:
+        time.sleep(self.job.size * RATE)
+
+
+def _jobs() -> list:
+    # Small categories first and the large one last, as when jobs are created in alphabetical order.
+    jobs = [SleepJob({'category': 'Small_{}'.format(i), 'n': 5 + i % 7}) for i in range(40)]
+    return jobs + [SleepJob({'category': 'Books', 'n': 120})]
+
+
+def _run(pool, chunks: list) -> tuple:
+    start = time.perf_counter()
+    results, failures = Dispatcher(pool, SleepWorker, processes=PROCESSES).run_chunks(chunks)
+    assert not failures
+    return time.perf_counter() - start, results
+
+
+def benchmark() -> dict:
+    with mp.Pool(processes=PROCESSES) as pool:
+        list_order, results = _run(pool, [[job] for job in _jobs()])
+
+        # The first run's durations are the history for the second.
+        history = pd.DataFrame({'job_key': [r.job_key for r in results], 'size': [r.job_size for r in results],
+                                'wall_time': [r.duration.total_seconds() for r in results]})
+        scheduler = LPTScheduler(CostModel(history), PROCESSES)
+        chunks = scheduler.chunks(_jobs())
+        lpt, _ = _run(pool, chunks)
+
+        # Sizes alone, with no history, still order the jobs.
+        size_only, _ = _run(pool, LPTScheduler(CostModel(), PROCESSES).chunks(_jobs()))
+    return {'list order': (list_order, None),
+            'lpt, history': (lpt, scheduler.predict_makespan(chunks)),
+            'lpt, sizes only': (size_only, None)}
+
+
+if __name__ == '__main__':
+    mp.freeze_support()
+    for method, (actual, predicted) in benchmark().items():
+        print("{:<18}actual {:>6.2f} s   predicted {}".format(
+            method, actual, '-' if predicted is None else "{:.2f} s".format(predicted)))
+# %%
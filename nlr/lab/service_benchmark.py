@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \service_benchmark.py                                                                                         #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 5:02:38 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 5:02:38 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+"""Compares first-job latency for a project launched in a new interpreter with one submitted to the pool service."""
+import os
+import sys
+import time
+import subprocess
+import tempfile
+import multiprocessing as mp
+
+from nlr.data.base import Job, Worker, Manager, Project
+# ------------------------------------------------------------------------------------------------------------------------ #
+PROCESSES = 4
+REPEATS = 5
+
+
+class StampJob(Job):
+    def run(self) -> None:
+        pass
+
+
+class StampWorker(Worker):
+    def _run(self) -> float:
+        return time.time()
+
+
+class StampProject(Project):
+    pass
+
+
+class StampManager(Manager):
+
+    def _create_jobs(self, params: list) -> list:
+        return [StampJob({}) for _ in params]
+
+    def _process_results(self, results: list) -> float:
+        return min(result.result for result in results)
+
+
+def _project() -> Project:
+    project = StampProject(params=[0], worker=StampWorker)
+    StampManager(project).create_jobs()
+    return project
+
+
+def cold() -> None:
+    """Runs a project as a freshly launched interpreter does: imports, a new pool, then the project."""
+    from nlr.utils.config import Config
+    from nlr.process.parallel import worker_initializer, run_project
+    project = _project()
+    with mp.Pool(processes=PROCESSES, initializer=worker_initializer, initargs=(Config().snapshot(), None)) as pool:
+        run_project(project, pool, PROCESSES)
+    print(project.results)
+
+
+def _cold_latency() -> float:
+    start = time.time()
+    out = subprocess.run([sys.executable, '-c', 'from nlr.lab.service_benchmark import cold; cold()'],
+                         stdout=subprocess.PIPE, check=True, env=dict(os.environ, PYTHONPATH=os.getcwd())).stdout
+    return float(out.decode().split()[-1]) - start
+
+
+def _warm_latency(service) -> float:
+    project = _project()
+    start = time.time()
+    return service.submit(project).results - start
+
+
+def benchmark() -> dict:
+    from nlr.process.service import PoolService
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        cold_times = [_cold_latency() for _ in range(REPEATS)]
+        os.chdir(directory)
+        try:
+            start = time.time()
+            with PoolService(processes=PROCESSES, log=False) as service:
+                startup = time.time() - start
+                warm_times = [_warm_latency(service) for _ in range(REPEATS)]
+        finally:
+            os.chdir(cwd)
+    return {'cold': cold_times, 'warm': warm_times, 'service startup': [startup]}
+
+
+if __name__ == '__main__':
+    mp.freeze_support()
+    # Run through the package module, so that the project classes can be unpickled by the service.
+    from nlr.lab import service_benchmark
+    for method, times in service_benchmark.benchmark().items():
+        times = sorted(times)
+        print("{:<18}median {:>9.1f} ms   min {:>9.1f} ms".format(
+            method, 1000 * times[len(times) // 2], 1000 * times[0]))
+# %%
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \sharedarray_benchmark.py                                                                                     #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 5:08:26 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 5:08:26 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+"""Compares returning large arrays from pool workers by pickle with returning shared-memory handles."""
+import time
+import multiprocessing as mp
+
+import numpy as np
+
+from nlr.utils import sharedarray
+# ------------------------------------------------------------------------------------------------------------------------ #
+PROCESSES = 4
+N_ARRAYS = 8
+# 200 MB of float64 per array.
+ROWS = (200 << 20) // 8
+
+
+def _pickled(i: int) -> np.ndarray:
+    return np.full(ROWS, i, dtype='float64')
+
+
+def _shared(i: int) -> sharedarray.ArrayHandle:
+    handle = sharedarray.allocate((ROWS,), 'float64', project_id='benchmark')
+    handle.array[...] = i
+    return handle
+
+
+def _time(pool, func) -> float:
+    start = time.perf_counter()
+    arrays = pool.map(func, range(N_ARRAYS), chunksize=1)
+    total = sum(float(a[-1]) for a in (getattr(x, 'array', x) for x in arrays))
+    elapsed = time.perf_counter() - start
+    assert total == sum(range(N_ARRAYS))
+    return elapsed
+
+
+def benchmark() -> dict:
+    with mp.Pool(processes=PROCESSES) as pool:
+        timings = {'pickle': _time(pool, _pickled), 'shared memory': _time(pool, _shared)}
+    sharedarray.release('benchmark')
+    return timings
+
+
+if __name__ == '__main__':
+    mp.freeze_support()
+    for method, seconds in benchmark().items():
+        print("{:<16}{:>8.2f} s for {} arrays of {} MB".format(method, seconds, N_ARRAYS, ROWS * 8 >> 20))
+# %%
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \stack_sampler_benchmark.py                                                                                   #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 4:46:52 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 4:46:52 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+"""Measures the overhead of the stack sampler on a CPU-bound Python workload."""
+import time
+
+from nlr.utils.stacks import StackSampler, STACK_INTERVAL
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+def _recurse(depth: int) -> int:
+    return sum(i * i for i in range(200)) if depth == 0 else _recurse(depth - 1)
+
+
+def _workload(n: int = 20000, depth: int = 30) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        _recurse(depth)
+    return time.perf_counter() - start
+
+
+def benchmark(interval: float = STACK_INTERVAL, repeats: int = 5) -> dict:
+    baseline = min(_workload() for _ in range(repeats))
+    sampled = []
+    for _ in range(repeats):
+        with StackSampler(interval) as sampler:
+            sampled.append(_workload())
+    return {'baseline': baseline, 'sampled': min(sampled), 'self_reported': sampler.overhead,
+            'n_samples': sampler.n_samples}
+
+
+if __name__ == '__main__':
+    for interval in [0.001, 0.005, STACK_INTERVAL, 0.05]:
+        r = benchmark(interval)
+        print("interval {:>6.3f}s  baseline {:.3f}s  sampled {:.3f}s  overhead {:>6.2%}  self-reported {:>6.2%}".format(
+            interval, r['baseline'], r['sampled'], r['sampled'] / r['baseline'] - 1, r['self_reported']))
+# %%
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \worker_startup_benchmark.py                                                                                  #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 4:38:44 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 4:38:44 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+"""Compares worker startup configuration cost when reading config.ini versus receiving a snapshot."""
+import os
+import tempfile
+import time
+import multiprocessing as mp
+from configparser import ConfigParser
+
+import nlr.utils.config as config_module
+from nlr.utils.config import Config, install_snapshot
+# ------------------------------------------------------------------------------------------------------------------------ #
+RESOURCES = ['MYSQL_SERVER', 'nlr']
+
+
+def _make_configfile(directory: str) -> str:
+    config = ConfigParser()
+    config['PATH'] = {'home': '~/nlr', 'data_home': '~/nlr/data', 'raw': '~/nlr/data/raw'}
+    config['LOGGING'] = {'logdir': 'logs', 'root_debug': 'logs/root_debug.log'}
+    config['AUTOLOGIN'] = {name: 'True' for name in RESOURCES}
+    for name in RESOURCES:
+        config[name] = {'user': 'root', 'password': 'secret', 'host': 'localhost', 'port': '3306'}
+    for i in range(20):
+        config['SECTION_{}'.format(i)] = {'option_{}'.format(j): str(j) for j in range(8)}
+    filepath = os.path.join(directory, 'config.ini')
+    with open(filepath, 'w') as fp:
+        config.write(fp)
+    return filepath
+
+
+def _startup_reads(filepath: str) -> None:
+    """The configuration reads a worker makes at startup: LogFile, Autologin and auth() for each resource."""
+    config = Config(filepath)
+    config.read_config('LOGGING', 'logdir')
+    config.read_section('LOGGING')
+    for name in RESOURCES:
+        config.exists(name)
+        config.read_config('AUTOLOGIN', name)
+        config.read_section(name)
+
+
+def _from_disk(filepath: str) -> None:
+    # Workers launched in a fresh interpreter start with an empty cache.
+    config_module.invalidate(filepath)
+
+
+def _timed_startup(filepath: str) -> float:
+    start = time.perf_counter()
+    _startup_reads(filepath)
+    return time.perf_counter() - start
+
+
+def _measure(filepath: str, initializer, initargs: tuple, n_workers: int) -> float:
+    """Returns mean per-worker startup configuration time in milliseconds."""
+    with mp.Pool(processes=n_workers, initializer=initializer, initargs=initargs) as pool:
+        times = pool.map(_timed_startup, [filepath] * n_workers, chunksize=1)
+    return 1000 * sum(times) / len(times)
+
+
+def benchmark(n_workers: int = 4) -> dict:
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = _make_configfile(directory)
+        snapshot = Config(filepath).snapshot()
+        return {'config.ini': _measure(filepath, _from_disk, (filepath,), n_workers),
+                'snapshot': _measure(filepath, install_snapshot, (snapshot,), n_workers)}
+
+
+if __name__ == '__main__':
+    mp.freeze_support()
+    for source, ms in benchmark().items():
+        print("{:<12}{:>10.3f} ms per worker".format(source, ms))
+# %%
@@ -12,7 +12,7 @@
 # URL      : https://github.com/john-james-sf/nlr                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # Created  : Monday, November 8th 2021, 1:04:27 pm                                                                         #
-# Modified : Wednesday, November 10th 2021, 3:21:33 am                                                                     #
+# Modified : Sunday, October 18th 2026, 5:53:20 pm                                                                         #
 # Modifier : John James (john.james.sf@gmail.com)                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # License  : BSD 3-clause "New" or "Revised" License                                                                       #
@@ -22,9 +22,11 @@
 
 This is a global object that provides a way for modules to assign projects to multiprocessing
 """
+import atexit
 import logging
 import multiprocessing as mp
 from nlr.data.base import Project
+from nlr.utils.journal import ProjectJournal, COMPLETED
 
 # ------------------------------------------------------------------------------------------------------------------------ #
 # logging.basicConfig(level=logging.INFO)
@@ -34,12 +36,33 @@ logger = logging.getLogger(__name__)
 
 class ProjectAdmin:
     projects = {}
+    # The warm pool service to which projects are submitted, started on first use.
+    service = None
 
-    def add_project(self, project):
+    @classmethod
+    def get_service(cls):
+        if cls.service is None or not cls.service.running:
+            # Imported here, as the service runs projects through nlr.process.parallel, which imports this module.
+            from nlr.process.service import PoolService
+            cls.service = PoolService()
+            cls.service.start()
+            atexit.register(cls.shutdown)
+        return cls.service
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Stops the pool service, if it is running."""
+        if cls.service is not None:
+            cls.service.stop()
+            cls.service = None
+
+    def add_project(self, project) -> Project:
+        """Runs the project on the warm pool service and returns the completed project."""
         try:
             ProjectAdmin.projects[project.id] = project
-            script = "{} {}".format(project.module, project.id)
-            os.system(script)
+            project = self.get_service().submit(project)
+            ProjectAdmin.projects.pop(project.id, None)
+            return project
         except KeyError as e:
             logger.error('Project already exists. {}'.format(e))
             raise
@@ -48,17 +71,33 @@ class ProjectAdmin:
             raise
 
     def get_project(self, id: str) -> Project:
+        """Returns a project added in this process, or resumes an interrupted project from the journal."""
         try:
             project = ProjectAdmin.projects[id]
-            del projects[id]
+            del ProjectAdmin.projects[id]
             return project
-        except KeyError as e:
-            logger.error('Project with id = {} does not exist.'.format(id))
-            raise
+        except KeyError:
+            return self.resume_project(id)
         except Exception as e:
             logger.error(e)
             raise
 
+    def resume_project(self, id: str) -> Project:
+        """Loads a project from the journal, prepared to run only the jobs that did not succeed."""
+        journal = ProjectJournal()
+        try:
+            state = journal.project_state(id)
+        except KeyError:
+            logger.error('Project with id = {} does not exist.'.format(id))
+            raise
+        if state == COMPLETED:
+            msg = 'Project with id = {} has completed. Its results are no longer journaled.'.format(id)
+            logger.error(msg)
+            raise ValueError(msg)
+        project = journal.load_project(id)
+        project.manager.resume_jobs()
+        return project
+
 
 if __name__ == '__main__':
     mp.freeze_support()
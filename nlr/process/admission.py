@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \admission.py                                                                                                 #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 5:11:51 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 5:56:32 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Memory-budget admission control of chunks of jobs onto the pool."""
+import time
+import logging
+import threading
+from typing import Callable
+
+from nlr.process.schedule import CostModel
+from nlr.utils.system import utilization
+# ------------------------------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Fraction of the memory available at the start that is budgeted to the jobs on a pool, when not specified.
+MEMORY_FRACTION = 0.8
+# Estimated peak RSS in bytes of a job with neither a declared estimate nor history.
+DEFAULT_JOB_MEMORY = 512 * 2**20
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+class MemoryBudget:
+    """A budget of memory for the jobs in flight on a pool, shared by the projects running on it at once.
+
+    Each project admits its chunks through its own MemoryAdmission. The memory in use is the sum over the projects
+    of the estimates of their chunks in flight, or of the measured RSS of the workers running their chunks if larger.
+
+    Arguments:
+        budget: Bytes of memory for the jobs in flight. Defaults to MEMORY_FRACTION of the memory available now.
+    """
+
+    def __init__(self, budget: int = None) -> None:
+        self.budget = budget or int(utilization()['available'] * MEMORY_FRACTION)
+        self.peak = 0
+        self.lock = threading.RLock()
+        self._admissions = []
+        self._overrun = False
+
+    def register(self, admission: 'MemoryAdmission') -> None:
+        with self.lock:
+            self._admissions.append(admission)
+
+    def unregister(self, admission: 'MemoryAdmission') -> None:
+        with self.lock:
+            if admission in self._admissions:
+                self._admissions.remove(admission)
+
+    def in_use(self) -> int:
+        """Returns the bytes counted against the budget by all the projects."""
+        with self.lock:
+            in_use = sum(admission.in_use() for admission in self._admissions)
+            self.peak = max(self.peak, in_use)
+            overrun = in_use > self.budget
+            if overrun and not self._overrun:
+                logger.warning("Jobs' memory of {:.0f}MB exceeds the memory budget of {:.0f}MB. Admissions are "
+                               "paused until jobs complete.".format(in_use / 2**20, self.budget / 2**20))
+            self._overrun = overrun
+            return in_use
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+class MemoryAdmission:
+    """Admits a project's chunks of jobs to the pool only while their estimated peak RSS fits within the budget.
+
+    Each job's peak RSS is its declared memory, if any, else the estimate of a peak_rss CostModel from its own
+    history or its size, else default. The jobs of a chunk run one after another in a single process, so a chunk's
+    estimate is that of its largest job. A chunk is admitted if the memory in use by all the projects sharing the
+    budget plus its estimate is within the budget. The project's memory in use is the estimates of its chunks in
+    flight, or the measured RSS of the workers running them when larger, so jobs using more memory than estimated
+    throttle admissions until they complete. A chunk is always admitted when none of the project's is in flight, so
+    a job estimated above the budget runs alone rather than never.
+
+    Arguments:
+        budget: The MemoryBudget shared with the other projects, or bytes for a budget of the project's own.
+            Defaults to a budget of the project's own of MEMORY_FRACTION of the memory available now.
+        model: Optional peak_rss CostModel.
+        default: Estimated peak RSS in bytes of a job with no other basis for one.
+        measure: Optional callable returning the bytes in use by the workers running the project's chunks. Where
+            none is given, a Dispatcher whose pool exposes its workers measures those running the project's chunks.
+        interval: Seconds between measurements.
+    """
+
+    def __init__(self, budget=None, model: CostModel = None, default: int = DEFAULT_JOB_MEMORY,
+                 measure: Callable = None, interval: float = 1.0) -> None:
+        self.budget = budget if isinstance(budget, MemoryBudget) else MemoryBudget(budget)
+        self.model = model
+        self.default = default
+        self.measure = measure
+        self.interval = interval
+        self.reserved = 0
+        self.measured = 0
+        self.peak = 0
+        self.throttled = 0
+        self._inflight = {}
+        self._measured_at = None
+        self._closed = False
+        self.budget.register(self)
+
+    def estimate(self, job) -> int:
+        """Returns the estimated peak RSS of the job in bytes."""
+        memory = getattr(job, 'memory', None)
+        if memory is None and self.model is not None:
+            memory = self.model.estimate(job)
+        return int(self.default if memory is None else memory)
+
+    def chunk_estimate(self, chunk: list) -> int:
+        """Returns the estimated peak RSS in bytes of a chunk, whose jobs run one at a time in one process."""
+        return max((self.estimate(job) for job in chunk), default=0)
+
+    def in_use(self) -> int:
+        """Returns the bytes the project counts against the budget: its estimates in flight or its workers' measured
+        RSS if larger."""
+        return max(self.reserved, self.measured)
+
+    def _measure(self) -> None:
+        now = time.monotonic()
+        if self.measure is None or (self._measured_at is not None and now - self._measured_at < self.interval):
+            return
+        self._measured_at = now
+        self.measured = self.measure()
+        self.peak = max(self.peak, self.measured)
+
+    def admit(self, chunk: list, idle: bool = False) -> bool:
+        """Reserves the chunk's estimate and returns True if it fits within the budget or nothing is in flight.
+
+        Arguments:
+            chunk: The jobs to be submitted as one pool task.
+            idle: True if none of the project's chunks is in flight.
+        """
+        estimate = self.chunk_estimate(chunk)
+        self._measure()
+        with self.budget.lock:
+            if not idle and self.budget.in_use() + estimate > self.budget.budget:
+                self.throttled += 1
+                return False
+            self._inflight[id(chunk)] = estimate
+            self.reserved += estimate
+        return True
+
+    def release(self, chunk: list) -> None:
+        """Releases the reservation of a completed chunk."""
+        with self.budget.lock:
+            self.reserved -= self._inflight.pop(id(chunk), 0)
+            if self._closed and not self._inflight:
+                self.budget.unregister(self)
+
+    def close(self) -> None:
+        """Withdraws the project from the budget once its chunks have completed, or once the chunks still running,
+        such as abandoned duplicates, release their reservations."""
+        with self.budget.lock:
+            self._closed = True
+            if not self._inflight:
+                self.budget.unregister(self)
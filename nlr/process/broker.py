@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \broker.py                                                                                                    #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 5:16:53 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 6:04:23 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Multi-node job execution through a TCP broker from which worker hosts pull chunks of jobs.
+
+The broker runs in a server process started by the driver, the process running the project. Worker processes, on
+this machine or others, connect to it, lease chunks one at a time, run them and return their outcomes. A worker
+sends heartbeats while it runs a chunk, and the chunks leased by a worker that misses its heartbeats are requeued
+for other workers. A chunk whose workers are lost max_attempts times, e.g. because it crashes them, fails.
+
+The driver submits chunks through a BrokerPool, which has the apply_async interface of a process pool, so the
+Dispatcher and run_project execute projects on the broker as they do on a local pool:
+
+    with BrokerPool(('0.0.0.0', 50000), authkey) as pool:
+        run_project(project, pool, processes=pool.wait_for_workers(8))
+
+Worker hosts, which need nlr and the project's Worker classes installed, run:
+
+    NLR_BROKER_AUTHKEY=<authkey> python -m nlr.process.broker <driver host>:50000 --processes 8
+
+Connections to the broker are authenticated but not encrypted. Workers receive only the WORKER_SECTIONS of the
+driver's configuration, which hold no credentials, and read the other sections, such as the datasource and database
+credentials, from their own host's configuration file. The broker should listen only on a trusted network.
+"""
+import os
+import time
+import uuid
+import socket
+import logging
+import argparse
+import threading
+import collections
+import multiprocessing as mp
+from multiprocessing.managers import BaseManager
+from typing import Callable
+
+from nlr.utils.config import ConfigSnapshot, Config, install_snapshot
+# ------------------------------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Seconds between a worker's heartbeats.
+HEARTBEAT_INTERVAL = 2.0
+# Seconds without a heartbeat after which a worker is lost and its chunks are requeued.
+HEARTBEAT_TIMEOUT = 10.0
+# Times a chunk may be lost with its worker before it fails.
+MAX_ATTEMPTS = 3
+# Seconds a worker waits for a chunk before asking again, and the driver waits for outcomes.
+POLL_INTERVAL = 1.0
+# Returned by lease() once the broker is closed, telling the worker to exit.
+STOP = 'stop'
+# Environment variable holding the authentication key of worker hosts.
+AUTHKEY_VARIABLE = 'NLR_BROKER_AUTHKEY'
+# Sections of the driver's configuration sent to workers: those that workers read, none of which hold credentials.
+WORKER_SECTIONS = ['LOGGING', 'PATH']
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+class JobBroker:
+    """Queue of chunks leased to workers, with heartbeats, reassignment of lost chunks and outcome return.
+
+    Lives in the broker server process, where each connection is served on its own thread.
+
+    Arguments:
+        timeout: Seconds without a heartbeat after which a worker is lost.
+        max_attempts: Times a chunk may be lost with its worker before it fails.
+    """
+
+    def __init__(self, timeout: float = HEARTBEAT_TIMEOUT, max_attempts: int = MAX_ATTEMPTS) -> None:
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.snapshot = None
+        self._changed = threading.Condition()
+        self._pending = collections.deque()
+        self._tasks = {}
+        self._attempts = collections.Counter()
+        # Task id to the id of the worker that leased it.
+        self._leases = {}
+        # Worker id to the time of its last heartbeat.
+        self._seen = {}
+        self._outcomes = collections.deque()
+        self._stats = collections.Counter()
+        self._closed = False
+
+    def configure(self, snapshot: ConfigSnapshot) -> None:
+        """Sets the configuration snapshot that workers install when they register."""
+        self.snapshot = snapshot
+
+    def register(self, worker_id: str) -> ConfigSnapshot:
+        """Registers a worker and returns the configuration snapshot for it to install."""
+        with self._changed:
+            self._seen[worker_id] = time.monotonic()
+            self._changed.notify_all()
+        logger.info("Worker {} registered.".format(worker_id))
+        return self.snapshot
+
+    def heartbeat(self, worker_id: str) -> bool:
+        """Records that a worker is alive. Returns False if it had been lost, so its leases were requeued."""
+        with self._changed:
+            known = worker_id in self._seen
+            self._seen[worker_id] = time.monotonic()
+            return known
+
+    def submit(self, task_id: str, func: Callable, args: tuple) -> None:
+        """Queues func(*args) for a worker."""
+        with self._changed:
+            self._tasks[task_id] = (func, args)
+            self._pending.append(task_id)
+            self._stats['submitted'] += 1
+            self._changed.notify_all()
+
+    def lease(self, worker_id: str, timeout: float = POLL_INTERVAL):
+        """Returns the next (task_id, func, args) for the worker, None if there is none within the timeout, or STOP."""
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            self._seen[worker_id] = time.monotonic()
+            while not self._pending and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._changed.wait(remaining)
+            if self._closed:
+                return STOP
+            task_id = self._pending.popleft()
+            self._leases[task_id] = worker_id
+            self._seen[worker_id] = time.monotonic()
+            return (task_id,) + self._tasks[task_id]
+
+    def complete(self, worker_id: str, task_id: str, ok: bool, value) -> None:
+        """Returns a task's outcome: its result if ok, else the exception raised. Outcomes of requeued tasks are
+        accepted from whichever worker completes them first, and later ones are dropped."""
+        with self._changed:
+            self._seen[worker_id] = time.monotonic()
+            if task_id not in self._tasks:
+                return
+            del self._tasks[task_id]
+            self._leases.pop(task_id, None)
+            if task_id in self._pending:
+                self._pending.remove(task_id)
+            self._outcomes.append((task_id, ok, value))
+            self._stats['completed'] += 1
+            self._changed.notify_all()
+
+    def collect(self, timeout: float = POLL_INTERVAL) -> list:
+        """Returns the outcomes returned since the last call, waiting up to the timeout for one."""
+        with self._changed:
+            if not self._outcomes:
+                self._changed.wait_for(lambda: self._outcomes or self._closed, timeout)
+            outcomes = list(self._outcomes)
+            self._outcomes.clear()
+            return outcomes
+
+    def reap(self) -> list:
+        """Requeues the tasks leased by workers lost since their last heartbeat and returns the workers' ids.
+
+        A task lost max_attempts times fails with a RuntimeError outcome.
+        """
+        now = time.monotonic()
+        with self._changed:
+            lost = [worker_id for worker_id, seen in self._seen.items() if now - seen > self.timeout]
+            for worker_id in lost:
+                del self._seen[worker_id]
+            for task_id, worker_id in list(self._leases.items()):
+                if worker_id not in lost:
+                    continue
+                del self._leases[task_id]
+                self._attempts[task_id] += 1
+                if self._attempts[task_id] >= self.max_attempts:
+                    del self._tasks[task_id]
+                    error = RuntimeError("Lost with its worker {} times, last {}.".format(
+                        self._attempts[task_id], worker_id))
+                    self._outcomes.append((task_id, False, error))
+                    self._stats['failed'] += 1
+                else:
+                    # Lost tasks go to the front of the queue, as they were submitted earliest.
+                    self._pending.appendleft(task_id)
+                    self._stats['reassigned'] += 1
+            if lost:
+                self._changed.notify_all()
+        for worker_id in lost:
+            logger.warning("Worker {} lost. Its chunks have been requeued.".format(worker_id))
+        return lost
+
+    def workers(self) -> int:
+        """Returns the number of workers alive."""
+        with self._changed:
+            return len(self._seen)
+
+    def stats(self) -> dict:
+        """Returns counts of tasks submitted, completed, reassigned and failed, and of workers alive."""
+        with self._changed:
+            return dict(self._stats, workers=len(self._seen))
+
+    def close(self) -> None:
+        """Tells workers to exit at their next lease."""
+        with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+# The broker served by this process, if it is a broker server process.
+_broker = None
+
+
+def _get_broker() -> JobBroker:
+    return _broker
+
+
+def _start_broker(timeout: float, max_attempts: int) -> None:
+    """Broker server process initializer. Creates the broker and the thread that reaps lost workers."""
+    global _broker
+    _broker = JobBroker(timeout, max_attempts)
+
+    def reap_periodically():
+        while True:
+            time.sleep(timeout / 4)
+            _broker.reap()
+
+    threading.Thread(target=reap_periodically, name='BrokerReaper', daemon=True).start()
+
+
+class BrokerManager(BaseManager):
+    """Serves the JobBroker to the driver and the workers."""
+
+
+BrokerManager.register('broker', callable=_get_broker)
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+class BrokerPool:
+    """Starts a broker server and submits tasks to its workers with the apply_async interface of a process pool.
+
+    Arguments:
+        address: (host, port) on which the broker listens. Port 0 picks a free port. Defaults to localhost.
+        authkey: Key that workers must present. Defaults to a random key.
+        timeout: Seconds without a heartbeat after which a worker is lost.
+        max_attempts: Times a chunk may be lost with its worker before it fails.
+        sections: The sections of the configuration that workers install. The connections to workers are not
+            encrypted, so sections holding credentials are best left to the worker hosts' configuration files, from
+            which workers read the sections not sent.
+    """
+
+    def __init__(self, address: tuple = ('127.0.0.1', 0), authkey: bytes = None,
+                 timeout: float = HEARTBEAT_TIMEOUT, max_attempts: int = MAX_ATTEMPTS,
+                 sections: list = WORKER_SECTIONS) -> None:
+        self.authkey = authkey or os.urandom(32)
+        self.timeout = timeout
+        self._manager = BrokerManager(address=address, authkey=self.authkey)
+        self._manager.start(initializer=_start_broker, initargs=(timeout, max_attempts))
+        self.address = self._manager.address
+        self.broker = self._manager.broker()
+        self.broker.configure(Config().snapshot(sections))
+        self._callbacks = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._collector = threading.Thread(target=self._collect, name='BrokerCollector', daemon=True)
+        self._collector.start()
+        logger.info("Broker listening on {}:{}.".format(*self.address))
+
+    def __enter__(self) -> 'BrokerPool':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def apply_async(self, func: Callable, args: tuple = (), callback: Callable = None,
+                    error_callback: Callable = None) -> str:
+        """Submits func(*args) to the workers. Its result is passed to callback, or its exception to error_callback,
+        on the pool's collector thread."""
+        task_id = str(uuid.uuid4())
+        with self._lock:
+            self._callbacks[task_id] = (callback, error_callback)
+        self.broker.submit(task_id, func, args)
+        return task_id
+
+    def _collect(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                outcomes = self.broker.collect(POLL_INTERVAL)
+            except (EOFError, OSError):
+                break
+            for task_id, ok, value in outcomes:
+                with self._lock:
+                    callback, error_callback = self._callbacks.pop(task_id, (None, None))
+                handler = callback if ok else error_callback
+                if handler is not None:
+                    handler(value)
+
+    def wait_for_workers(self, n: int = 1, timeout: float = None) -> int:
+        """Waits until at least n workers are registered and returns the number registered."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.broker.workers() < n:
+            if deadline is not None and time.monotonic() > deadline:
+                break
+            time.sleep(0.1)
+        return self.broker.workers()
+
+    def stats(self) -> dict:
+        """Returns the broker's counts of tasks and workers."""
+        return self.broker.stats()
+
+    def close(self) -> None:
+        """Tells the workers to exit and stops the broker."""
+        self.broker.close()
+        self._stopped.set()
+        self._collector.join()
+        # Give workers waiting on a lease the chance to receive STOP before the server goes away.
+        time.sleep(POLL_INTERVAL / 4)
+        self._manager.shutdown()
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+def work(address: tuple, authkey: bytes, worker_id: str = None, heartbeat: float = HEARTBEAT_INTERVAL) -> None:
+    """Runs tasks leased from the broker in this process until the broker closes or is unreachable.
+
+    Arguments:
+        address: (host, port) of the broker.
+        authkey: The broker's authentication key.
+        worker_id: Identifies the worker to the broker. Defaults to the host name and process id.
+        heartbeat: Seconds between heartbeats.
+    """
+    worker_id = worker_id or "{}:{}".format(socket.gethostname(), os.getpid())
+    manager = BrokerManager(address=address, authkey=authkey)
+    manager.connect()
+    broker = manager.broker()
+    snapshot = broker.register(worker_id)
+    if snapshot is not None:
+        install_snapshot(snapshot)
+
+    stopped = threading.Event()
+
+    def beat():
+        # Heartbeats continue while a task runs. The proxy opens a connection for this thread.
+        while not stopped.wait(heartbeat):
+            try:
+                broker.heartbeat(worker_id)
+            except (EOFError, OSError):
+                break
+
+    threading.Thread(target=beat, name='Heartbeat', daemon=True).start()
+    try:
+        while True:
+            task = broker.lease(worker_id, POLL_INTERVAL)
+            if task is None:
+                continue
+            if task == STOP:
+                break
+            task_id, func, args = task
+            try:
+                ok, value = True, func(*args)
+            except Exception as e:
+                ok, value = False, e
+            try:
+                broker.complete(worker_id, task_id, ok, value)
+            except Exception as e:
+                if isinstance(e, (EOFError, OSError)):
+                    raise
+                # The outcome could not be sent, e.g. it does not pickle.
+                broker.complete(worker_id, task_id, False, RuntimeError(repr(e)))
+    except (EOFError, OSError):
+        logger.info("Worker {} lost the broker at {}:{}.".format(worker_id, *address))
+    finally:
+        stopped.set()
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+class WorkerHost:
+    """Runs worker processes on this host for a broker.
+
+    Arguments:
+        address: (host, port) of the broker.
+        authkey: The broker's authentication key.
+        processes: Number of worker processes. Defaults to the number of CPUs.
+        heartbeat: Seconds between each worker's heartbeats.
+    """
+
+    def __init__(self, address: tuple, authkey: bytes, processes: int = None,
+                 heartbeat: float = HEARTBEAT_INTERVAL) -> None:
+        self.address = address
+        self.authkey = authkey
+        self.processes = processes or mp.cpu_count()
+        self.heartbeat = heartbeat
+        self.workers = []
+
+    def start(self) -> 'WorkerHost':
+        """Starts the worker processes."""
+        for _ in range(self.processes):
+            process = mp.Process(target=work, args=(self.address, self.authkey, None, self.heartbeat), daemon=True)
+            process.start()
+            self.workers.append(process)
+        return self
+
+    def join(self, timeout: float = None) -> None:
+        """Waits for the worker processes to exit."""
+        for process in self.workers:
+            process.join(timeout)
+
+    def terminate(self) -> None:
+        """Stops the worker processes."""
+        for process in self.workers:
+            process.terminate()
+        self.join()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Runs worker processes for a job broker.")
+    parser.add_argument("address", type=str, help="host:port of the broker.")
+    parser.add_argument("--processes", type=int, default=None, help="Worker processes. Defaults to the CPUs.")
+    parser.add_argument("--heartbeat", type=float, default=HEARTBEAT_INTERVAL, help="Seconds between heartbeats.")
+    args = parser.parse_args()
+    host, port = args.address.rsplit(':', 1)
+    WorkerHost((host, int(port)), os.environ[AUTHKEY_VARIABLE].encode(), args.processes, args.heartbeat).start().join()
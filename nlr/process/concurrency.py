@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \concurrency.py                                                                                               #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 5:09:29 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 5:46:22 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Adaptive worker concurrency driven by measured CPU, iowait and memory utilization."""
+import time
+import logging
+import multiprocessing as mp
+from typing import Callable
+
+from nlr.utils.system import utilization
+# ------------------------------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+class ConcurrencyPolicy:
+    """Bounds and targets for the number of pool workers running a project's jobs at once.
+
+    Arguments:
+        min_workers: Fewest workers kept running.
+        max_workers: Most workers run at once. Defaults to the number of CPUs. Capped by the size of the pool.
+        initial_workers: Workers running at the start. Defaults to max_workers, so that a short project uses the
+            whole pool, with workers removed only once utilization shows them oversubscribed.
+        target_cpu: CPU utilization percentage above which workers are removed, e.g. when multithreaded BLAS in
+            each worker oversubscribes the CPUs, and well below which workers are added.
+        max_iowait: Iowait percentage above which workers are not added, as the disks rather than the CPUs are
+            the bottleneck.
+        max_memory: Memory utilization percentage above which workers are removed.
+        interval: Seconds between utilization samples and adjustments.
+    """
+
+    def __init__(self, min_workers: int = 1, max_workers: int = None, initial_workers: int = None,
+                 target_cpu: float = 85.0, max_iowait: float = 25.0, max_memory: float = 85.0,
+                 interval: float = 2.0) -> None:
+        self.min_workers = max(1, min_workers)
+        self.max_workers = max(self.min_workers, max_workers or mp.cpu_count())
+        initial_workers = initial_workers or self.max_workers
+        self.initial_workers = min(self.max_workers, max(self.min_workers, initial_workers))
+        self.target_cpu = target_cpu
+        self.max_iowait = max_iowait
+        self.max_memory = max_memory
+        self.interval = interval
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+class ConcurrencyController:
+    """Adjusts the number of workers by one per interval towards the policy's utilization targets.
+
+    Workers are removed while memory or CPU utilization is above target, and added while the CPUs are underused
+    by more than the band and iowait is below its limit.
+
+    Arguments:
+        policy: The ConcurrencyPolicy.
+        processes: Size of the pool, which caps the number of workers.
+        sample: Callable returning utilization as nlr.utils.system.utilization does.
+        band: Percentage points below target_cpu at which workers are added.
+    """
+
+    def __init__(self, policy: ConcurrencyPolicy, processes: int, sample: Callable = utilization,
+                 band: float = 15.0) -> None:
+        self.policy = policy
+        self.max_workers = min(policy.max_workers, processes)
+        self.min_workers = min(policy.min_workers, self.max_workers)
+        self.workers = min(policy.initial_workers, self.max_workers)
+        self.sample = sample
+        self.band = band
+        self.history = []
+        # Start the utilization measurement from now.
+        self.sample()
+        self._last = time.monotonic()
+
+    def poll(self) -> int:
+        """Returns the number of workers to run, adjusting it if an interval has passed since the last adjustment."""
+        now = time.monotonic()
+        if now - self._last >= self.policy.interval:
+            self._last = now
+            self.adjust(self.sample())
+        return self.workers
+
+    def adjust(self, usage: dict) -> int:
+        """Adjusts the number of workers for the utilization sampled and returns it."""
+        workers = self.workers
+        if usage['memory'] > self.policy.max_memory or usage['cpu'] > self.policy.target_cpu:
+            workers = max(self.min_workers, workers - 1)
+        elif usage['cpu'] < self.policy.target_cpu - self.band and usage['iowait'] < self.policy.max_iowait:
+            workers = min(self.max_workers, workers + 1)
+        if workers != self.workers:
+            logger.info("Workers {} -> {}. CPU {:.0f}%, iowait {:.0f}%, memory {:.0f}%.".format(
+                self.workers, workers, usage['cpu'], usage['iowait'], usage['memory']))
+        self.workers = workers
+        self.history.append(dict(usage, workers=workers))
+        return workers
@@ -0,0 +1,634 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \dispatch.py                                                                                                  #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 4:49:00 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 6:08:38 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Chunked, backpressured job dispatch to a process pool, with I/O-bound jobs on threads."""
+import os
+import math
+import time
+import shutil
+import logging
+import tempfile
+import itertools
+import threading
+import traceback
+import statistics
+import collections
+import queue as queues
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable
+
+from nlr.data.base import Job, Reducer
+from nlr.utils.system import processes_rss
+# ------------------------------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Chunks in flight per pool process, when not specified.
+INFLIGHT_PER_PROCESS = 2
+# Chunks per pool process when the chunk size is computed from the number of jobs, as Pool.map does.
+CHUNKS_PER_PROCESS = 4
+# Threads running I/O-bound jobs concurrently, when not specified.
+IO_CONCURRENCY = 32
+# Seconds between progress messages.
+PROGRESS_INTERVAL = 10.0
+# Times the median chunk duration a chunk runs before it is duplicated, in run_project.
+SPECULATION_FACTOR = 2.0
+# Completed chunks of a lane needed before its running chunks are compared against their durations.
+SPECULATION_MIN_SAMPLES = 5
+# Seconds a chunk must have run, at least, before it is a straggler.
+SPECULATION_MIN_SECONDS = 1.0
+# Seconds between checks for stragglers.
+SPECULATION_INTERVAL = 1.0
+# Jobs drawn from the job iterable for one lane and held for the other, at most, before the first waits.
+MAX_HELD_JOBS = 1024
+# Seconds between checks for pool workers that exited while running a chunk.
+WORKER_CHECK_INTERVAL = 1.0
+# Seconds a chunk of an exited worker is given for its outcome, sent before the worker exited, to arrive.
+WORKER_LOST_GRACE = 1.0
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+class JobFailure:
+    """Captures a job that raised, in a form that can be returned from a pool worker.
+
+    Arguments:
+        job: The job that failed.
+        error: The exception it raised.
+    """
+
+    def __init__(self, job: Job, error: BaseException) -> None:
+        self.job_id = job.id
+        self.job_name = job.name
+        self.error = repr(error)
+        self.traceback = ''.join(traceback.format_exception(type(error), error, error.__traceback__))
+
+    def __str__(self) -> str:
+        return "Job {} ({}) failed: {}".format(self.job_name, self.job_id, self.error)
+
+
+class WorkerLost(Exception):
+    """Raised in place of the outcome of a chunk whose pool worker exited while running it, e.g. when killed for
+    running out of memory."""
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+def run_chunk(worker: Callable, jobs: list, reducer: Reducer = None, cancelled: threading.Event = None,
+              tracking: tuple = None) -> tuple:
+    """Executes a chunk of jobs in a pool worker process.
+
+    Returns a Results or JobFailure for each job, and the chunk's partial state if a reducer is given. With a
+    reducer, each job's result is accumulated into the partial state and dropped from its Results. A chunk run on
+    a thread may be given an event, on which it stops before its next job. A chunk run on a pool may be given a
+    directory and token, which it records under the worker's process id as it starts.
+    """
+    if tracking is not None:
+        directory, token = tracking
+        with open(os.path.join(directory, str(os.getpid())), 'w') as fp:
+            fp.write(str(token))
+    outcomes = []
+    partial = reducer.init() if reducer is not None else None
+    for job in jobs:
+        if cancelled is not None and cancelled.is_set():
+            break
+        try:
+            results = worker(job).run()
+            if reducer is not None:
+                partial = reducer.accumulate(partial, results.result)
+                results.result = None
+            outcomes.append(results)
+        except Exception as e:
+            outcomes.append(JobFailure(job, e))
+    return outcomes, partial
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+def split_io(jobs: Iterable) -> tuple:
+    """Splits jobs into a list of the I/O-bound jobs and a list of the others, which need a process."""
+    io_jobs, process_jobs = [], []
+    for job in jobs:
+        (io_jobs if job.execution == 'io' else process_jobs).append(job)
+    return io_jobs, process_jobs
+
+
+# Yielded by a lane's chunk source that has no chunk ready but is not exhausted.
+_WAIT = object()
+
+
+class _Router:
+    """Routes the jobs of one iterable to the pool and thread lanes as the lanes draw them.
+
+    Jobs are drawn from the iterable only as a lane has capacity for one, so a generator of jobs keeps its
+    backpressure. A job drawn for one lane that belongs to the other is held for it, and when more than
+    MAX_HELD_JOBS are held, the drawing lane waits for the other to take them.
+    """
+
+    def __init__(self, jobs: Iterable) -> None:
+        self.jobs = iter(jobs)
+        self.held = {True: collections.deque(), False: collections.deque()}
+
+    def pull(self, io: bool):
+        """Yields the I/O-bound jobs, or the others, and _WAIT while too many jobs are held for the other lane."""
+        while True:
+            if self.held[io]:
+                yield self.held[io].popleft()
+            elif len(self.held[not io]) >= MAX_HELD_JOBS:
+                yield _WAIT
+            else:
+                job = next(self.jobs, None)
+                if job is None:
+                    return
+                self.held[job.execution == 'io'].append(job)
+
+
+def pool_workers(pool) -> set:
+    """Returns the process ids of the pool's workers, or None if the pool does not expose them.
+
+    A pool other than a multiprocessing pool, such as a share of one, may expose them with a workers method.
+    """
+    workers = getattr(pool, 'workers', None)
+    if callable(workers):
+        return workers()
+    processes = getattr(pool, '_pool', None)
+    if processes is None:
+        return None
+    return {process.pid for process in list(processes)}
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+class _WorkerTracker:
+    """Finds the chunks lost with pool workers that exited while running them.
+
+    A multiprocessing pool replaces a worker that dies, but never calls back for the chunk it was running. Each chunk
+    records its token in a file named for its worker's process id as it starts, so the file of a worker no longer in
+    the pool names the last chunk it started.
+    """
+
+    def __init__(self, pool) -> None:
+        self.pool = pool
+        self.directory = tempfile.mkdtemp(prefix='nlr-chunks-')
+        self.checked = time.monotonic()
+
+    def recorded(self) -> dict:
+        """Returns the last token recorded by each worker, by its process id."""
+        tokens = {}
+        for name in os.listdir(self.directory):
+            if not name.isdigit():
+                continue
+            try:
+                with open(os.path.join(self.directory, name)) as fp:
+                    tokens[int(name)] = int(fp.read())
+            except (OSError, ValueError):
+                continue
+        return tokens
+
+    def gone(self) -> dict:
+        """Returns the last token recorded by each worker no longer in the pool, by its process id."""
+        self.checked = time.monotonic()
+        pids = pool_workers(self.pool) or set()
+        return {pid: token for pid, token in self.recorded().items() if pid not in pids}
+
+    def alive(self, pid: int) -> bool:
+        return pid in (pool_workers(self.pool) or set())
+
+    def forget(self, pid: int) -> None:
+        try:
+            os.remove(os.path.join(self.directory, str(pid)))
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+class _Attempt:
+    """A submission of a chunk: the original or a speculative duplicate of it."""
+
+    def __init__(self, key: int, chunk: list, speculative: bool, token: int) -> None:
+        self.key = key
+        self.chunk = chunk
+        self.speculative = speculative
+        self.token = token
+        self.started = None
+        self.cancelled = threading.Event()
+        # The handle returned when the attempt was submitted, the worker and time at which it was found lost, and
+        # whether it has been failed as lost.
+        self.future = None
+        self.lost = None
+        self.failed = False
+
+    def start(self) -> float:
+        """Returns the time the attempt started, or None if it has not. A pool that queues tasks before handing them
+        to its processes, such as a share of a FairPool, gives the time each task was handed on."""
+        handed = getattr(self.future, 'started', 0.0)
+        if self.started is None or handed is None:
+            return None
+        return max(self.started, handed)
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+class _Lane:
+    """A source of chunks and the executor they are submitted to, with its own in-flight limit and admission.
+
+    The executor runs slots chunks at once, first in first out, so a chunk is taken to start when it is submitted
+    to a free slot or, if none is free, when the chunk ahead of it completes, and no earlier than the executor hands
+    it to a process if the executor queues chunks of its own. The durations of completed chunks give the
+    distribution against which running chunks are found to be stragglers.
+    """
+
+    def __init__(self, name: str, chunks: Iterable, submit: Callable, limit: int, admission=None,
+                 slots: int = None) -> None:
+        self.name = name
+        self.chunks = iter(chunks)
+        self.submit = submit
+        self.limit = limit
+        self.admission = admission
+        self.slots = slots or limit
+        self.inflight = 0
+        self.completed = 0
+        self.exhausted = False
+        # The next chunk, held back until it is admitted.
+        self.pending = None
+        # Attempts in flight by the id of the chunk submitted, and those taken to be queued behind the others.
+        self.attempts = {}
+        self.queued = collections.deque()
+        # Attempts that lost to another attempt of their chunk, by the id of the chunk submitted. They hold their
+        # in-flight slots and admission reservations until their outcomes arrive, which are then dropped.
+        self.abandoned = {}
+        self.durations = []
+        self.speculated = 0
+        self.tokens = itertools.count()
+
+    def _launch(self, chunk: list, key: int, speculative: bool) -> None:
+        attempt = _Attempt(key, chunk, speculative, next(self.tokens))
+        if len(self.attempts) + len(self.abandoned) - len(self.queued) < self.slots:
+            attempt.started = time.monotonic()
+        else:
+            self.queued.append(attempt)
+        self.attempts[id(chunk)] = attempt
+        self.inflight += 1
+        attempt.future = self.submit(self, attempt)
+
+    def _settle(self, attempt: _Attempt, now: float, started: bool = True) -> None:
+        """Frees an attempt's in-flight slot and admission reservation. An attempt that held one of the executor's
+        slots starts the chunk queued behind it."""
+        self.inflight -= 1
+        if self.admission is not None:
+            self.admission.release(attempt.chunk)
+        if started and self.queued:
+            self.queued.popleft().started = now
+
+    def _retire(self, attempt: _Attempt, now: float, settle: bool = True) -> None:
+        """Removes an attempt from those in flight and, unless it is abandoned to run on, settles it."""
+        self.attempts.pop(id(attempt.chunk))
+        queued = attempt in self.queued
+        if queued:
+            self.queued.remove(attempt)
+        if settle:
+            self._settle(attempt, now, started=not queued)
+
+    def top_up(self) -> None:
+        while not self.exhausted and self.inflight < self.limit:
+            if self.pending is None:
+                self.pending = next(self.chunks, None)
+                if self.pending is _WAIT:
+                    self.pending = None
+                    break
+                if self.pending is None:
+                    self.exhausted = True
+                    break
+            if self.admission is not None and not self.admission.admit(self.pending, idle=not self.inflight):
+                break
+            self._launch(self.pending, id(self.pending), False)
+            self.pending = None
+
+    def done(self, chunk: list) -> bool:
+        """Records the completion of a chunk submitted. Returns False if it lost to another attempt of its chunk."""
+        now = time.monotonic()
+        abandoned = self.abandoned.pop(id(chunk), None)
+        if abandoned is not None:
+            # A losing attempt, which held its slot and reservation until now.
+            self._settle(abandoned, now)
+            return False
+        if id(chunk) not in self.attempts:
+            # An attempt whose outcome arrived after it was failed as lost.
+            return False
+        attempt = self.attempts[id(chunk)]
+        self._retire(attempt, now)
+        self.durations.append(now - (attempt.start() or now))
+        # The first outcome wins. The other attempts of the chunk are abandoned: they are cancelled if they have not
+        # started, and those on threads stop before their next job. The others run to completion. Either way they
+        # hold their slots and reservations until their outcomes arrive.
+        for other in [other for other in self.attempts.values() if other.key == attempt.key]:
+            other.cancelled.set()
+            self.abandoned[id(other.chunk)] = other
+            self._retire(other, now, settle=False)
+            cancel = getattr(other.future, 'cancel', None)
+            if cancel is not None:
+                cancel()
+        return True
+
+    def running(self, tracker: _WorkerTracker) -> list:
+        """Returns the process ids of the workers running the lane's chunks: those whose last chunk is in flight or
+        abandoned."""
+        tokens = {attempt.token for attempt in itertools.chain(self.attempts.values(), self.abandoned.values())}
+        return [pid for pid, token in tracker.recorded().items() if token in tokens]
+
+    def find_lost(self, tracker: _WorkerTracker, pool) -> list:
+        """Returns the attempts lost with exited workers, failed, once their grace has passed. Abandoned attempts
+        lost with their workers are settled, as their outcomes will not arrive."""
+        now = time.monotonic()
+        for pid, token in tracker.gone().items():
+            attempt = next((attempt for attempt in itertools.chain(self.attempts.values(), self.abandoned.values())
+                            if attempt.token == token), None)
+            if attempt is None:
+                # The worker's last chunk completed before it exited.
+                tracker.forget(pid)
+            elif attempt.lost is None:
+                attempt.lost = (pid, now)
+        failed = []
+        for attempt in list(self.attempts.values()) + list(self.abandoned.values()):
+            if attempt.lost is None or attempt.failed or now - attempt.lost[1] < WORKER_LOST_GRACE:
+                continue
+            pid = attempt.lost[0]
+            if tracker.alive(pid):
+                attempt.lost = None
+                continue
+            tracker.forget(pid)
+            lost = getattr(pool, 'lost', None)
+            if lost is not None:
+                # A pool that holds a slot for each task it runs, such as a share of one, frees the lost task's slot.
+                lost(attempt.future)
+            if self.abandoned.get(id(attempt.chunk)) is attempt:
+                del self.abandoned[id(attempt.chunk)]
+                self._settle(attempt, now)
+                continue
+            if any(other.key == attempt.key and other is not attempt for other in self.attempts.values()):
+                # Another attempt of the chunk is still running, and its outcome is awaited instead.
+                self._retire(attempt, now)
+                continue
+            attempt.failed = True
+            error = WorkerLost("Pool worker {} exited while running the chunk.".format(pid))
+            failed.append((attempt.chunk, [JobFailure(job, error) for job in attempt.chunk]))
+        return failed
+
+    def speculate(self, factor: float) -> int:
+        """Launches a duplicate of each straggler: an original chunk of idempotent jobs running longer than factor
+        times the median chunk duration. Only once no chunks remain to be submitted, when stragglers hold up the end
+        of the lane. Returns the number launched."""
+        if not self.exhausted or self.pending is not None or len(self.durations) < SPECULATION_MIN_SAMPLES:
+            return 0
+        threshold = max(factor * statistics.median(self.durations), SPECULATION_MIN_SECONDS)
+        now = time.monotonic()
+        duplicated = {attempt.key for attempt in self.attempts.values() if attempt.speculative}
+        launched = 0
+        for attempt in list(self.attempts.values()):
+            started = attempt.start()
+            if attempt.speculative or started is None or attempt.key in duplicated:
+                continue
+            if now - started < threshold or not all(job.idempotent for job in attempt.chunk):
+                continue
+            copy = list(attempt.chunk)
+            if self.admission is not None and not self.admission.admit(copy):
+                continue
+            logger.info("Chunk of {} jobs in lane {} running {:.1f}s, over {:.1f}s. Launching a duplicate.".format(
+                len(copy), self.name, now - started, threshold))
+            self._launch(copy, attempt.key, True)
+            self.speculated += 1
+            launched += 1
+        return launched
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+class Dispatcher:
+    """Submits jobs to a process pool in chunks and collects their results as chunks complete.
+
+    At most max_inflight chunks are submitted but not yet completed, so jobs are pulled from the job iterable only
+    as the pool has capacity for them, and completed results are handed on while later chunks run.
+
+    Jobs whose execution class is 'io' spend their time waiting on the network or a database, so rather than occupy
+    pool processes they are run one per task on up to io_concurrency threads in this process. Their results are
+    collected and handed on alongside those from the pool.
+
+    A pool worker that dies, e.g. killed for running out of memory, is replaced by the pool but never returns the
+    chunk it was running. Where the pool exposes its workers, such a chunk is found by the worker's absence from
+    the pool and its jobs fail with WorkerLost.
+
+    Arguments:
+        pool: The multiprocessing pool.
+        worker: The Worker class that executes each job.
+        processes: The number of processes in the pool.
+        chunksize: Jobs per chunk. Defaults to a size computed from the number of jobs, or 1 if unknown.
+        max_inflight: Maximum chunks in flight. Defaults to INFLIGHT_PER_PROCESS chunks per process.
+        reducer: Optional Reducer that workers apply to each chunk's results, returning a partial state per chunk.
+        io_concurrency: Maximum I/O-bound jobs running at once. Defaults to IO_CONCURRENCY.
+        controller: Optional ConcurrencyController. If given, it sets the number of pool workers running at once.
+            While that is fewer than the pool's processes, it is the number of chunks in flight, in place of
+            max_inflight.
+        admission: Optional MemoryAdmission. If given, chunks are submitted to the pool only as it admits them.
+        speculation: Optional factor. If given, once all chunks are submitted, a duplicate is launched of each chunk
+            of idempotent jobs running longer than this many times the median chunk duration. The first outcome of
+            a chunk is handed on and the other is dropped.
+    """
+
+    def __init__(self, pool, worker: Callable, processes: int, chunksize: int = None,
+                 max_inflight: int = None, reducer: Reducer = None, io_concurrency: int = IO_CONCURRENCY,
+                 controller=None, admission=None, speculation: float = None) -> None:
+        self.pool = pool
+        self.worker = worker
+        self.processes = processes
+        self.chunksize = chunksize
+        self.max_inflight = max_inflight or INFLIGHT_PER_PROCESS * processes
+        self.reducer = reducer
+        self.io_concurrency = io_concurrency
+        self.controller = controller
+        self.admission = admission
+        self.speculation = speculation
+        # Chunks duplicated in the runs so far.
+        self.speculated = 0
+
+    def _chunksize(self, jobs: Iterable) -> int:
+        if self.chunksize:
+            return self.chunksize
+        try:
+            n = len(jobs)
+        except TypeError:
+            return 1
+        # Only the jobs that run on the pool are chunked.
+        n = sum(1 for job in jobs if job.execution != 'io')
+        return max(1, math.ceil(n / (self.processes * CHUNKS_PER_PROCESS)))
+
+    def _chunks(self, jobs: Iterable, chunksize: int):
+        chunk = []
+        for job in jobs:
+            if job is _WAIT:
+                yield _WAIT
+                continue
+            chunk.append(job)
+            if len(chunk) == chunksize:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def run(self, jobs: Iterable, **kwargs) -> tuple:
+        """Executes the I/O-bound jobs on threads and the others on the pool in chunks of chunksize.
+
+        Jobs are drawn from the iterable as the pool and the threads have capacity for them, so it may be a
+        generator. Takes the keyword arguments of run_chunks.
+
+        Arguments:
+            jobs: The jobs to execute.
+        """
+        router = _Router(jobs)
+        chunks = self._chunks(router.pull(io=False), self._chunksize(jobs))
+        return self.run_chunks(chunks, io_jobs=router.pull(io=True), **kwargs)
+
+    def _submit_process(self, completed: queues.Queue, tracker: _WorkerTracker = None) -> Callable:
+        def submit(lane: _Lane, attempt: _Attempt):
+            # Tasks on the pool cannot be cancelled. A losing duplicate runs to completion and its outcome is dropped.
+            chunk = attempt.chunk
+            tracking = (tracker.directory, attempt.token) if tracker is not None else None
+            return self.pool.apply_async(run_chunk, args=(self.worker, chunk, self.reducer, None, tracking),
+                                         callback=lambda outcome: completed.put((lane, chunk, outcome)),
+                                         error_callback=lambda e: completed.put(
+                                             (lane, chunk, ([JobFailure(job, e) for job in chunk], None))))
+        return submit
+
+    def _submit_thread(self, completed: queues.Queue, executor: ThreadPoolExecutor) -> Callable:
+        def submit(lane: _Lane, attempt: _Attempt):
+            chunk = attempt.chunk
+            future = executor.submit(run_chunk, self.worker, chunk, self.reducer, attempt.cancelled)
+            future.add_done_callback(
+                lambda f: completed.put((lane, chunk, ([], None) if f.cancelled() else f.result())))
+            return future
+        return submit
+
+    def run_chunks(self, chunks: Iterable, io_jobs: Iterable = (), on_result: Callable = None,
+                   on_failure: Callable = None, on_partial: Callable = None, collect: bool = True) -> tuple:
+        """Executes chunks of jobs in order, returning lists of their Results and JobFailures in order of completion.
+
+        Arguments:
+            chunks: Lists of jobs to execute on the pool, each in one pool task. May be a generator.
+            io_jobs: I/O-bound jobs to execute on threads in this process. May be a generator.
+            on_result: Optional callable invoked with each Results as it completes.
+            on_failure: Optional callable invoked with each JobFailure as it completes.
+            on_partial: Optional callable invoked with each chunk's partial state, if the dispatcher has a reducer.
+            collect: If False, Results are passed to on_result only and not retained. JobFailures are always retained.
+        """
+        results, failures = [], []
+        # Callbacks from the pool and the threads only queue the outcomes. They are handed on from this thread.
+        completed = queues.Queue()
+        # Where the pool exposes its workers, chunks lost with a worker that exits are failed rather than awaited.
+        tracker = _WorkerTracker(self.pool) if pool_workers(self.pool) is not None else None
+        lanes = [_Lane('cpu', chunks, self._submit_process(completed, tracker), self.max_inflight, self.admission,
+                       slots=self.processes)]
+        measure = None
+        if self.admission is not None and self.admission.measure is None and tracker is not None:
+            # Only the workers running this run's chunks are measured, not the others on the pool.
+            measure = self.admission.measure = lambda: processes_rss(lanes[0].running(tracker))
+        # The executor starts its threads only as jobs are submitted to it.
+        executor = ThreadPoolExecutor(max_workers=self.io_concurrency, thread_name_prefix='io')
+        lanes.append(_Lane('io', (_WAIT if job is _WAIT else [job] for job in io_jobs),
+                           self._submit_thread(completed, executor), self.io_concurrency))
+        progress = time.monotonic()
+        # With a controller or admission control, wake at each of their intervals to apply the controller's
+        # adjustments and admit chunks held back by the workers' measured memory while chunks run.
+        intervals = [self.controller.policy.interval] if self.controller else []
+        intervals += [self.admission.interval] if self.admission else []
+        intervals += [SPECULATION_INTERVAL] if self.speculation else []
+        intervals += [WORKER_CHECK_INTERVAL] if tracker else []
+        timeout = min(intervals) if intervals else None
+
+        try:
+            while True:
+                if self.controller:
+                    # Chunks beyond the workers running wait in the pool's queue, and run on the next process to free.
+                    # So chunks are prefetched only while the controller runs every process of the pool, and are
+                    # otherwise limited to the workers it runs.
+                    workers = self.controller.poll()
+                    lanes[0].limit = self.max_inflight if workers >= self.processes else workers
+                # Top up each executor to its in-flight limit, and duplicate stragglers once a lane has no more.
+                for lane in lanes:
+                    lane.top_up()
+                    if self.speculation:
+                        lane.speculate(self.speculation)
+                if not any(lane.attempts for lane in lanes):
+                    break
+                if tracker and time.monotonic() - tracker.checked >= WORKER_CHECK_INTERVAL:
+                    for chunk, outcomes in lanes[0].find_lost(tracker, self.pool):
+                        completed.put((lanes[0], chunk, (outcomes, None)))
+
+                # Wait for a chunk to complete and hand on its outcomes.
+                try:
+                    lane, chunk, (outcomes, partial) = completed.get(timeout=timeout)
+                except queues.Empty:
+                    continue
+                if not lane.done(chunk):
+                    continue
+                lane.completed += len(outcomes)
+                if partial is not None and on_partial:
+                    on_partial(partial)
+                for outcome in outcomes:
+                    if isinstance(outcome, JobFailure):
+                        logger.error(str(outcome))
+                        failures.append(outcome)
+                        if on_failure:
+                            on_failure(outcome)
+                    else:
+                        if collect:
+                            results.append(outcome)
+                        if on_result:
+                            on_result(outcome)
+
+                if time.monotonic() - progress > PROGRESS_INTERVAL:
+                    progress = time.monotonic()
+                    logger.info("Jobs completed: {}, failed: {}.".format(
+                        ', '.join("{} {}".format(lane.name, lane.completed) for lane in lanes), len(failures)))
+        finally:
+            # Threads still running abandoned attempts are left to finish.
+            executor.shutdown(wait=not lanes[-1].abandoned)
+            self.speculated += sum(lane.speculated for lane in lanes)
+            if any(lane.abandoned for lane in lanes):
+                # The run returns without waiting for the abandoned attempts, whose slots and reservations are
+                # settled as their outcomes arrive.
+                threading.Thread(target=self._drain, args=(completed, lanes, tracker, measure),
+                                 name='DispatcherDrain', daemon=True).start()
+            else:
+                self._drain(completed, lanes, tracker, measure)
+
+        return results, failures
+
+    def _drain(self, completed: queues.Queue, lanes: list, tracker: _WorkerTracker, measure: Callable) -> None:
+        """Drops the outcomes of a run's abandoned attempts as they arrive, settling them, then ends the run's
+        measurement and worker tracking."""
+        try:
+            while any(lane.abandoned for lane in lanes):
+                if tracker and time.monotonic() - tracker.checked >= WORKER_CHECK_INTERVAL:
+                    lanes[0].find_lost(tracker, self.pool)
+                try:
+                    lane, chunk, _ = completed.get(timeout=WORKER_CHECK_INTERVAL)
+                except queues.Empty:
+                    continue
+                lane.done(chunk)
+        finally:
+            if measure is not None and self.admission.measure is measure:
+                self.admission.measure = None
+            if tracker is not None:
+                tracker.close()
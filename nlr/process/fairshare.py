@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \fairshare.py                                                                                                 #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 5:21:49 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 6:08:38 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Priority and weighted fair sharing of a process pool between concurrently running projects.
+
+Each project submits to its own share of the pool. The FairPool keeps no more tasks in the pool than it has
+processes, so a task submitted by any project waits only for the next process to free, never behind a queue of
+other projects' tasks. As processes free, the next task is taken from the backlogged share of highest priority and,
+among those, the one with the least virtual time: the pool time its tasks have used divided by its weight. Shares
+thus receive pool time in proportion to their weights. Running tasks are never preempted.
+
+A share that was idle starts at the least virtual time of the other active shares, rather than with credit for the
+time it was idle, so a short interactive project starts within one task of a busy batch project rather than behind it.
+"""
+import time
+import logging
+import itertools
+import threading
+from typing import Callable
+# ------------------------------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Target estimated seconds of work per chunk of a project on a shared pool, bounding how long other projects wait
+# for a process.
+FAIR_CHUNK_SECONDS = 10.0
+# Seconds charged for a task before any task's duration has been measured.
+DEFAULT_TASK_SECONDS = 1.0
+# Weight of the latest duration in a share's moving average task duration.
+SMOOTHING = 0.2
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+class _Task:
+    """A task submitted to a share: a callable, its arguments and callbacks and, once dispatched, its completion and
+    the time.monotonic() at which it was handed to the pool."""
+
+    def __init__(self, func: Callable, args: tuple, callback: Callable, error_callback: Callable) -> None:
+        self.func = func
+        self.args = args
+        self.callback = callback
+        self.error_callback = error_callback
+        self.done = None
+        self.started = None
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+class _Share:
+    """A project's share of a FairPool, with the apply_async interface of a process pool."""
+
+    def __init__(self, fair: 'FairPool', name: str, priority: int, weight: float) -> None:
+        self.fair = fair
+        self.name = name
+        self.priority = priority
+        self.weight = weight
+        self.vtime = 0.0
+        self.estimate = None
+        self.tasks = []
+        self.running = 0
+        self.busy = 0.0
+        self.dispatched = 0
+
+    @property
+    def active(self) -> bool:
+        return bool(self.tasks) or self.running > 0
+
+    def apply_async(self, func: Callable, args: tuple = (), callback: Callable = None,
+                    error_callback: Callable = None) -> _Task:
+        """Queues func(*args) to run on the pool when this share's turn comes. Returns the task."""
+        task = _Task(func, args, callback, error_callback)
+        self.fair._submit(self, task)
+        return task
+
+    def lost(self, task: _Task) -> None:
+        """Frees the process of a task whose worker exited without returning its outcome."""
+        if task is not None and task.done is not None:
+            task.done(None, None)
+
+    def workers(self) -> set:
+        """Returns the process ids of the pool's workers, or None if the pool does not expose them."""
+        return self.fair.workers()
+
+    def close(self) -> None:
+        """Leaves the pool. Tasks already submitted still run."""
+        self.fair._leave(self)
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+class FairPool:
+    """Shares a process pool between projects by priority, then by weighted fair queuing.
+
+    Arguments:
+        pool: The process pool.
+        processes: The number of processes in the pool, which bounds the tasks submitted to it at once.
+        clock: Callable returning seconds, for measuring task durations.
+    """
+
+    def __init__(self, pool, processes: int, clock: Callable = time.monotonic) -> None:
+        self.pool = pool
+        self.processes = processes
+        self.clock = clock
+        self.shares = []
+        self.running = 0
+        self._lock = threading.RLock()
+        self._order = itertools.count()
+
+    def share(self, name: str, priority: int = 0, weight: float = 1.0) -> _Share:
+        """Returns a new share of the pool, with the apply_async interface of a process pool.
+
+        Arguments:
+            name: Name of the share, e.g. the project's, for logging.
+            priority: Tasks of backlogged shares of higher priority run first.
+            weight: Share of the pool time relative to other shares of the same priority.
+        """
+        if weight <= 0:
+            raise ValueError("Share {} has weight {}. Expected a positive weight.".format(name, weight))
+        share = _Share(self, name, priority, weight)
+        with self._lock:
+            self.shares.append(share)
+        return share
+
+    def workers(self) -> set:
+        """Returns the process ids of the pool's workers, or None if the pool does not expose them."""
+        processes = getattr(self.pool, '_pool', None)
+        return None if processes is None else {process.pid for process in list(processes)}
+
+    def _leave(self, share: _Share) -> None:
+        with self._lock:
+            if share in self.shares:
+                self.shares.remove(share)
+
+    def _mean_task_seconds(self) -> float:
+        estimates = [share.estimate for share in self.shares if share.estimate is not None]
+        return sum(estimates) / len(estimates) if estimates else DEFAULT_TASK_SECONDS
+
+    def _submit(self, share: _Share, task: _Task) -> None:
+        with self._lock:
+            if not share.active:
+                # A share becoming active starts level with the other active shares, without credit for idle time.
+                others = [other.vtime for other in self.shares if other is not share and other.active]
+                if others:
+                    share.vtime = max(share.vtime, min(others))
+            share.tasks.append(task)
+            self._dispatch()
+
+    def _next(self) -> _Share:
+        backlogged = [share for share in self.shares if share.tasks]
+        if not backlogged:
+            return None
+        # Ties go to the share with fewer tasks running, then to the one that has had fewer.
+        return min(backlogged, key=lambda share: (-share.priority, share.vtime, share.running, share.dispatched))
+
+    def _dispatch(self) -> None:
+        """Submits tasks to the pool while it has free processes. Called with the lock held."""
+        while self.running < self.processes:
+            share = self._next()
+            if share is None:
+                return
+            task = share.tasks.pop(0)
+            # The task is charged its estimated duration now, so that tasks dispatched before it completes see it,
+            # and the charge is corrected to the measured duration when it completes.
+            charge = share.estimate if share.estimate is not None else self._mean_task_seconds()
+            share.vtime += charge / share.weight
+            share.running += 1
+            share.dispatched += 1
+            self.running += 1
+            started = self.clock()
+            # On the monotonic clock whatever the share's clock, for the Dispatcher to compare with its own.
+            task.started = time.monotonic()
+            task.done = done = self._completion(share, charge, started, task.callback, task.error_callback)
+            self.pool.apply_async(task.func, args=task.args, callback=lambda value, done=done: done(True, value),
+                                  error_callback=lambda error, done=done: done(False, error))
+
+    def _completion(self, share: _Share, charge: float, started: float, callback: Callable,
+                    error_callback: Callable) -> Callable:
+        finished = []
+
+        def done(ok: bool, value) -> None:
+            """Records the task's completion, and hands on its outcome unless ok is None, for a lost task. Only the
+            first call counts, as a task found lost may yet complete."""
+            elapsed = max(0.0, self.clock() - started)
+            with self._lock:
+                if finished:
+                    return
+                finished.append(ok)
+                share.vtime += (elapsed - charge) / share.weight
+                share.busy += elapsed
+                share.estimate = elapsed if share.estimate is None else \
+                    (1 - SMOOTHING) * share.estimate + SMOOTHING * elapsed
+                share.running -= 1
+                self.running -= 1
+                self._dispatch()
+            if ok is None:
+                return
+            handler = callback if ok else error_callback
+            if handler is not None:
+                handler(value)
+        return done
+
+    def stats(self) -> list:
+        """Returns each share's name, priority, weight, tasks dispatched and busy seconds."""
+        with self._lock:
+            return [{'name': share.name, 'priority': share.priority, 'weight': share.weight,
+                     'dispatched': share.dispatched, 'busy': share.busy} for share in self.shares]
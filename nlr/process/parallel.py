@@ -12,7 +12,7 @@
 # URL      : https://github.com/john-james-sf/nlr                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # Created  : Monday, November 8th 2021, 12:18:21 am                                                                        #
-# Modified : Tuesday, November 9th 2021, 12:32:19 am                                                                       #
+# Modified : Sunday, October 18th 2026, 5:52:15 pm                                                                         #
 # Modifier : John James (john.james.sf@gmail.com)                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # License  : BSD 3-clause "New" or "Revised" License                                                                       #
@@ -20,20 +20,29 @@
 # ======================================================================================================================== #
 # %%
 import argparse
-import math
 import os
 import logging
 import logging.handlers
 import multiprocessing as mp
+import multiprocessing.util
+import queue as queues
 import time
 import numpy as np
 import pandas as pd
 
 
-from nlr.utils.loggers import LogFile
-#from nlr.process.admin import ProjectAdmin
+from nlr.utils.config import Config, ConfigSnapshot, install_snapshot
+from nlr.utils.loggers import LogFile, BatchQueueHandler, BufferedFileHandler, JsonLinesHandler, JobContextFilter
+from nlr.process.admin import ProjectAdmin
+from nlr.process.dispatch import Dispatcher, split_io, SPECULATION_FACTOR
+from nlr.process.schedule import CostModel, LPTScheduler
+from nlr.process.concurrency import ConcurrencyPolicy, ConcurrencyController
+from nlr.process.admission import MemoryBudget, MemoryAdmission
+from nlr.process.broker import BrokerPool
 # ------------------------------------------------------------------------------------------------------------------------ #
-NUM_PROCESSORS = max(1, int(math.floor(mp.cpu_count()/2)))
+# Pool size. The number of workers running at once is adapted within each project's ConcurrencyPolicy.
+MAX_PROCESSORS = mp.cpu_count()
+logger = logging.getLogger(__name__)
 
 # ------------------------------------------------------------------------------------------------------------------------ #
 
@@ -42,52 +51,138 @@ def listener_configurer():
     """Top-level loop that waits for logging events on the queue until the LogRecords is None."""
     root = logging.getLogger()
     lf = LogFile()
-    logfilepath = lf.get_logfile(logname='root', level='debug')
-    h = logging.FileHandler(logfilepath)
+    logfilepath = lf.get_logfile(logger='root', level='debug')
+    h = BufferedFileHandler(logfilepath)
     f = logging.Formatter(
         '%(asctime)s %(processName)-10s %(name)s %(levelname)-8s %(message)s')
     h.setFormatter(f)
     root.addHandler(h)
+    # Structured sink for analysis, alongside the text log.
+    root.addHandler(JsonLinesHandler(os.path.splitext(logfilepath)[0] + '.jsonl'))
 
 
 # ------------------------------------------------------------------------------------------------------------------------ #
 def worker_configurer(queue):
-    """Configures the worker to message the Queue."""
+    """Configures the worker to send batches of log records to the Queue."""
     root = logging.getLogger()
     if len(root.handlers) == 0:
-        h = logging.handlers.QueueHandler(queue)
+        h = BatchQueueHandler(queue)
+        h.addFilter(JobContextFilter())
         root.addHandler(h)
         root.setLevel(logging.DEBUG)
+        # Pool workers exit without running atexit handlers, so send the last batch from a finalizer.
+        mp.util.Finalize(h, h.close, exitpriority=10)
 
 
 # ------------------------------------------------------------------------------------------------------------------------ #
-def listener_process(queue, configurer):
+def worker_initializer(snapshot: ConfigSnapshot, queue) -> None:
+    """Pool initializer. Installs the parent's configuration snapshot and configures logging.
+
+    With the snapshot installed, Config, LogFile and auth() reads in the worker do no config file I/O. Without a
+    queue, the worker's logging is left unconfigured.
+    """
+    install_snapshot(snapshot)
+    if queue is not None:
+        worker_configurer(queue)
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+def listener_process(queue, configurer, interval: float = 1.0):
+    """Writes the log records workers send on the queue, in batches or singly, until it receives None."""
     configurer()
+    root = logging.getLogger()
     while True:
         try:
-            record = queue.get()
-            if record is None:  # We send this as a sentinel to tell the listener to quit.
+            try:
+                records = queue.get(timeout=interval)
+            except queues.Empty:
+                # Workers are quiet, so write out what has been buffered.
+                for handler in root.handlers:
+                    handler.flush()
+                continue
+            if records is None:  # We send this as a sentinel to tell the listener to quit.
                 break
-            logger = logging.getLogger(record.name)
-            # No level or filter logic applied - just do it!
-            logger.handle(record)
+            if isinstance(records, logging.LogRecord):
+                records = [records]
+            for record in records:
+                logger = logging.getLogger(record.name)
+                # No level or filter logic applied - just do it!
+                logger.handle(record)
         except Exception:
             import sys
             import traceback
             print('Whoops! Problem:', file=sys.stderr)
             traceback.print_exc(file=sys.stderr)
+    logging.shutdown()
 
 
 # ------------------------------------------------------------------------------------------------------------------------ #
-def main_pool(id: str):
+def run_project(project, pool, processes: int, chunksize: int = None, max_chunk_cost: float = None,
+                memory: MemoryBudget = None):
+    """Executes the project's jobs on the pool and hands their results to the project's manager.
+
+    Arguments:
+        project: The Project, whose jobs have been created by its Manager.
+        pool: The process pool, initialized with worker_initializer, or a BrokerPool.
+        processes: The number of processes in the pool.
+        chunksize: Jobs per chunk. By default, jobs are scheduled longest-first in chunks of similar estimated cost.
+        max_chunk_cost: Optional limit of the estimated seconds of a chunk scheduled by estimated cost.
+        memory: The MemoryBudget shared by the projects running on the pool. Defaults to a budget of the project's
+            memory_budget bytes, for a project running alone on the pool.
+    """
+    # The number of workers running at once follows utilization, within the project's policy. Chunks are admitted
+    # while the estimated peak RSS of those in flight, or the measured RSS of the workers running them if larger,
+    # together with that of the other projects on the pool, is within the pool's memory budget. Both measure this
+    # host, so neither applies to a broker's workers on other hosts.
+    controller = admission = None
+    if not isinstance(pool, BrokerPool):
+        controller = ConcurrencyController(project.concurrency or ConcurrencyPolicy(), processes)
+        admission = MemoryAdmission(memory or project.memory_budget,
+                                    CostModel.from_history(project.name, metric='peak_rss'))
+    # Jobs are submitted in chunks, with a bounded number in flight. Each job's results are handed to the manager as
+    # its chunk completes, and results reduced inside the workers arrive as one partial state per chunk.
+    manager = project.manager
+    manager.begin_results()
+    # Once all chunks are submitted, chunks of idempotent jobs running well past the median are duplicated, and the
+    # first of the two to complete is taken.
+    dispatcher = Dispatcher(pool, project.worker, processes=processes, chunksize=chunksize, reducer=manager.reducer,
+                            controller=controller, admission=admission, speculation=SPECULATION_FACTOR)
+    kwargs = dict(on_result=manager.process_result, on_partial=manager.process_partial,
+                  on_failure=manager.process_failure, collect=False)
+    try:
+        if chunksize:
+            _, project.failures = dispatcher.run(project.jobs, **kwargs)
+        else:
+            # I/O-bound jobs run on threads. The others run on the pool, longest first, packed into chunks of similar
+            # estimated cost.
+            io_jobs, process_jobs = split_io(project.jobs)
+            scheduler = LPTScheduler(CostModel.from_history(project.name), processes, max_chunk_cost)
+            chunks = scheduler.chunks(process_jobs)
+            project.predicted_makespan = scheduler.predict_makespan(chunks)
+            _, project.failures = dispatcher.run_chunks(chunks, io_jobs=io_jobs, **kwargs)
+    finally:
+        if admission is not None:
+            admission.close()
+    logger.info("Project {} completed with {} failed jobs.".format(project.name, len(project.failures)))
+    if dispatcher.speculated:
+        logger.info("Duplicated {} straggling chunks.".format(dispatcher.speculated))
+    if admission is not None:
+        logger.info("Peak RSS of the project's workers {:.0f}MB of a {:.0f}MB budget. Admissions throttled {} "
+                    "times.".format(admission.peak / 2**20, admission.budget.budget / 2**20, admission.throttled))
+    manager.end_results()
+    return project
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+def main_pool(id: str, chunksize: int = None):
     start_time = time.time()
 
     # Setup basic logging for main process
     logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger(__name__)
 
-    # Build queue and listener
-    queue = mp.Manager().Queue(-1)
+    # Build queue and listener. The queue is shared with workers by inheritance through the pool initializer.
+    queue = mp.Queue()
     listener = mp.Process(target=listener_process,
                           args=(queue, listener_configurer))
     listener.start()
@@ -95,18 +190,19 @@ def main_pool(id: str):
 
     # Get the project to execute and assign the worker
     project = ProjectAdmin().get_project(id)
-    worker = project.worker
     logger.info("Project {}, id {} received for worker {}".format(
         project.name, project.id, project.worker.__class__.__name__))
 
-    # Execute the project jobs by assigning the work to a process pool to be completed by worker.
-    pool = mp.Pool(processes=NUM_PROCESSORS)
-    for job in project.jobs:
-        pool.apply_async(worker,
-                         args=(job, queue, worker_configurer))
-
+    # Execute the project jobs by assigning the work to a process pool to be completed by worker. Workers
+    # receive a frozen snapshot of the configuration rather than reading the config file themselves.
+    snapshot = Config().snapshot()
+    processes = min(MAX_PROCESSORS, (project.concurrency or ConcurrencyPolicy()).max_workers)
+    pool = mp.Pool(processes=processes, initializer=worker_initializer,
+                   initargs=(snapshot, queue))
+    run_project(project, pool, processes, chunksize)
     pool.close()
     pool.join()
+
     queue.put_nowait(None)
     listener.join()
     end_time = time.time()
@@ -116,7 +212,8 @@ if __name__ == "__main__":
     mp.freeze_support()
     parser = argparse.ArgumentParser()
     parser.add_argument("id", type=str, help="Project Id to execute.")
+    parser.add_argument("--chunksize", type=int, default=None, help="Jobs per chunk submitted to the pool.")
     args = parser.parse_args()
-    main_pool(args.id)
+    main_pool(args.id, args.chunksize)
 
     # %%
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \plan.py                                                                                                      #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 5:29:02 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 5:30:45 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Dry-run plans of projects: the estimated duration, bytes transferred, disk usage and peak memory of their jobs.
+
+A plan is made from the jobs a Manager creates, before any of them run, to choose the pool's concurrency and the
+machine's size. Each job's estimates come from the profile history of the project's earlier runs: the median for
+the job's key or, for a job without history, its size from the datasource table times the median per unit of size
+of the jobs of its class, since sizes are in bytes for some classes and in rows for others. I/O-bound jobs without
+any history are taken to download, and write to disk, their download_size.
+"""
+import heapq
+import logging
+import numpy as np
+import pandas as pd
+
+from nlr.utils.history import ProfileHistory
+from nlr.process.schedule import CostModel
+from nlr.process.dispatch import IO_CONCURRENCY
+# ------------------------------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Estimates of each job, by the profile history metric each is estimated from.
+ESTIMATES = {'duration': 'wall_time', 'transfer_bytes': 'net_bytes', 'disk_bytes': 'write_bytes',
+             'peak_memory': 'peak_rss'}
+# Pool processes for which the summary predicts the makespan and peak memory.
+PROCESSES = [1, 2, 4, 8, 16, 32]
+MB = 2**20
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+def _list_schedule(durations: list, slots: int) -> float:
+    """Returns the makespan of the durations run longest first, each on the next free of slots."""
+    finish = [0.0] * max(1, min(slots, len(durations)))
+    for duration in sorted(durations, reverse=True):
+        heapq.heappush(finish, heapq.heappop(finish) + duration)
+    return max(finish) if durations else 0.0
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+class ProjectPlan:
+    """The estimated resource needs of a project's jobs.
+
+    Arguments:
+        project: Name of the project.
+        jobs: One row per job, with its id, name, key, execution class and size, and its estimates: duration in
+            seconds, transfer_bytes over the network, disk_bytes written and peak_memory in bytes of RSS. Estimates
+            without a basis are NaN.
+    """
+
+    def __init__(self, project: str, jobs: pd.DataFrame) -> None:
+        self.project = project
+        self.jobs = jobs
+
+    @classmethod
+    def from_jobs(cls, project: str, jobs: list, history: pd.DataFrame = None) -> 'ProjectPlan':
+        """Estimates the jobs from the history, by default the profile history of the project's earlier runs."""
+        if history is None:
+            try:
+                history = ProfileHistory().load()
+            except Exception as e:
+                logger.warning("Profile history unavailable for the plan of project {}. {}".format(project, e))
+                history = pd.DataFrame()
+            if len(history) and 'project' in history.columns:
+                history = history[history['project'] == project]
+        names = history['job_key'].str.split(':').str[0] if 'job_key' in history.columns else None
+        models = {}
+        rows = []
+        for job in jobs:
+            if job.name not in models:
+                own = history[names == job.name] if names is not None else None
+                models[job.name] = {column: CostModel(own, metric) for column, metric in ESTIMATES.items()}
+            row = {'job_id': job.id, 'job_name': job.name, 'job_key': job.key, 'execution': job.execution,
+                   'size': job.size}
+            for column, model in models[job.name].items():
+                row[column] = model.estimate(job)
+            if job.execution == 'io' and job.transfer_size is not None:
+                for column in ['transfer_bytes', 'disk_bytes']:
+                    if row[column] is None:
+                        row[column] = job.transfer_size
+            rows.append(row)
+        columns = ['job_id', 'job_name', 'job_key', 'execution', 'size'] + list(ESTIMATES)
+        df = pd.DataFrame(rows, columns=columns)
+        df[list(ESTIMATES)] = df[list(ESTIMATES)].astype(float)
+        return cls(project, df)
+
+    @property
+    def totals(self) -> dict:
+        """Returns the project's total duration, transfer and disk bytes, its largest job's peak memory, and the
+        number of jobs with an estimated duration."""
+        jobs = self.jobs
+        return {'jobs': len(jobs),
+                'estimated': int(jobs['duration'].notna().sum()),
+                'duration': float(jobs['duration'].sum()),
+                'transfer_bytes': float(jobs['transfer_bytes'].sum()),
+                'disk_bytes': float(jobs['disk_bytes'].sum()),
+                'peak_memory': float(jobs['peak_memory'].max()) if jobs['peak_memory'].notna().any() else np.nan}
+
+    def _durations(self, io: bool) -> list:
+        jobs = self.jobs[(self.jobs['execution'] == 'io') == io]
+        if not len(jobs):
+            return []
+        # Jobs without an estimate are taken to last as long as the median estimated job.
+        known = self.jobs['duration'].dropna()
+        fill = float(known.median()) if len(known) else 0.0
+        return jobs['duration'].fillna(fill).tolist()
+
+    def makespan(self, processes: int, io_concurrency: int = IO_CONCURRENCY) -> float:
+        """Returns the estimated seconds to run the project's jobs on a pool of processes, with its I/O-bound jobs
+        on io_concurrency threads alongside."""
+        return max(_list_schedule(self._durations(io=False), processes),
+                   _list_schedule(self._durations(io=True), io_concurrency))
+
+    def peak_memory(self, processes: int) -> float:
+        """Returns the estimated peak RSS in bytes of a pool of processes running the project's pool jobs: that of
+        the processes largest jobs running at once."""
+        peaks = self.jobs.loc[self.jobs['execution'] != 'io', 'peak_memory'].dropna()
+        return float(peaks.nlargest(processes).sum())
+
+    def summary(self, processes: list = None, io_concurrency: int = IO_CONCURRENCY) -> pd.DataFrame:
+        """Returns the estimated makespan and peak memory of the project for each number of pool processes."""
+        processes = processes or PROCESSES
+        return pd.DataFrame({'processes': processes,
+                             'makespan': [self.makespan(n, io_concurrency) for n in processes],
+                             'peak_memory': [self.peak_memory(n) for n in processes]})
+
+    def report(self) -> str:
+        """Returns the plan's totals and summary as text."""
+        totals = self.totals
+        lines = ["Plan for project {}: {} jobs, {} with estimates.".format(
+            self.project, totals['jobs'], totals['estimated'])]
+        lines.append("Total duration {:.1f}s. Transfer {:.1f}MB. Disk {:.1f}MB. Largest job peak memory {:.1f}MB.".
+                     format(totals['duration'], totals['transfer_bytes'] / MB, totals['disk_bytes'] / MB,
+                            totals['peak_memory'] / MB))
+        for row in self.summary().itertuples():
+            lines.append("    {:>3} processes: makespan {:.1f}s, peak memory {:.1f}MB.".format(
+                row.processes, row.makespan, row.peak_memory / MB))
+        return '\n'.join(lines)
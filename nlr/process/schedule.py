@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \schedule.py                                                                                                  #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 4:59:45 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 6:06:47 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Cost-aware, longest-processing-time-first scheduling of jobs onto the pool."""
+import heapq
+import logging
+import statistics
+
+import pandas as pd
+
+from nlr.utils.history import ProfileHistory
+# ------------------------------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Chunks per pool process when packing jobs, as for the Dispatcher's computed chunk size.
+CHUNKS_PER_PROCESS = 4
+# Seconds a job is taken to last when the model has no history, in limiting a chunk to max_chunk_cost by its number of
+# jobs.
+UNCALIBRATED_JOB_SECONDS = 1.0
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+class CostModel:
+    """Estimates a job metric from its history and job sizes: durations in seconds by default.
+
+    A job whose key has history is estimated at the median of its past values. Otherwise a job with a size, from
+    its download_size, size or n parameter, is estimated at its size times the median value per unit of size seen
+    in the history. Jobs with neither are estimated at the median of the other jobs' estimates.
+
+    Arguments:
+        history: Profile history records with job_key, size and metric columns.
+        metric: The profiled metric to estimate, e.g. 'wall_time' in seconds or 'peak_rss' in bytes.
+    """
+
+    def __init__(self, history: pd.DataFrame = None, metric: str = 'wall_time') -> None:
+        self.metric = metric
+        self._values = {}
+        self._rate = None
+        if history is not None and len(history) and 'job_key' in history.columns and metric in history.columns:
+            history = history.dropna(subset=[metric])
+            self._values = history.dropna(subset=['job_key']).groupby('job_key')[metric].median().to_dict()
+            sized = history[history['size'].fillna(0) > 0]
+            if len(sized):
+                self._rate = float((sized[metric] / sized['size']).median())
+
+    @classmethod
+    def from_history(cls, project: str = None, metric: str = 'wall_time') -> 'CostModel':
+        """Builds the model from the profile history, optionally restricted to a project."""
+        try:
+            history = ProfileHistory().load()
+        except Exception as e:
+            logger.warning("Profile history unavailable for {} estimates. {}".format(metric, e))
+            return cls(metric=metric)
+        if project is not None and len(history):
+            history = history[history['project'] == project]
+        return cls(history, metric)
+
+    @property
+    def calibrated(self) -> bool:
+        """True if the model has history from which to estimate the metric in its own units."""
+        return bool(self._values) or self._rate is not None
+
+    def estimate(self, job) -> float:
+        """Returns the estimated metric of the job, or None if there is no basis for one."""
+        if job.key in self._values:
+            return float(self._values[job.key])
+        if self._rate is not None and job.size is not None:
+            return job.size * self._rate
+        return None
+
+    def costs(self, jobs: list) -> list:
+        """Returns the estimated cost of each job.
+
+        Costs are in the metric's units if the model is calibrated. Otherwise they are the jobs' sizes, which still order the jobs
+        by their relative cost, or 1 for every job if no job has a size.
+        """
+        if self.calibrated:
+            costs = [self.estimate(job) for job in jobs]
+        else:
+            costs = [job.size for job in jobs]
+        known = [cost for cost in costs if cost is not None]
+        fill = statistics.median(known) if known else 1.0
+        return [fill if cost is None else cost for cost in costs]
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+class LPTScheduler:
+    """Orders jobs longest-first and packs them into chunks of roughly equal estimated cost.
+
+    The pool hands each chunk to the next idle process in submission order, so submitting chunks longest-first
+    gives the longest-processing-time-first list schedule: the largest jobs start first and the small jobs fill in
+    around them, rather than one large job started last determining the makespan.
+
+    Arguments:
+        model: The CostModel that estimates the jobs' costs.
+        processes: The number of processes in the pool.
+        max_chunk_cost: Optional limit of a chunk's estimated seconds, e.g. so that projects sharing the pool wait no
+            longer than this for a process. If the model is not calibrated, a chunk is instead limited to the jobs
+            that fit in it at UNCALIBRATED_JOB_SECONDS each.
+    """
+
+    def __init__(self, model: CostModel, processes: int, max_chunk_cost: float = None) -> None:
+        self.model = model
+        self.processes = processes
+        self.max_chunk_cost = max_chunk_cost
+
+    def chunks(self, jobs: list) -> list:
+        """Returns the jobs packed into chunks, in order of decreasing estimated cost.
+
+        Jobs are taken longest-first and added to a chunk until its cost reaches the target of the total cost over
+        CHUNKS_PER_PROCESS chunks per process, or max_chunk_cost if that is less. Jobs costing more than the target
+        are chunks of their own. Without estimated seconds to compare with max_chunk_cost, chunks are closed at the
+        number of jobs it allows instead.
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return []
+        costs = self.model.costs(jobs)
+        target = sum(costs) / (self.processes * CHUNKS_PER_PROCESS)
+        max_jobs = len(jobs)
+        if self.max_chunk_cost and self.model.calibrated:
+            target = min(target, self.max_chunk_cost)
+        elif self.max_chunk_cost:
+            max_jobs = max(1, int(self.max_chunk_cost / UNCALIBRATED_JOB_SECONDS))
+        chunks, chunk, chunk_cost = [], [], 0.0
+        for cost, job in sorted(zip(costs, jobs), key=lambda pair: pair[0], reverse=True):
+            chunk.append(job)
+            chunk_cost += cost
+            if chunk_cost >= target or len(chunk) >= max_jobs:
+                chunks.append(chunk)
+                chunk, chunk_cost = [], 0.0
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def makespan(self, chunks: list) -> float:
+        """Returns the makespan of the chunks list-scheduled on the pool, in the units of the model's costs."""
+        costs = iter(self.model.costs([job for chunk in chunks for job in chunk]))
+        finish = [0.0] * self.processes
+        for chunk in chunks:
+            start = heapq.heappop(finish)
+            heapq.heappush(finish, start + sum(next(costs) for _ in chunk))
+        return max(finish)
+
+    def predict_makespan(self, chunks: list) -> float:
+        """Returns the predicted makespan of the chunks in seconds, or None if the model is not calibrated."""
+        return self.makespan(chunks) if self.model.calibrated else None
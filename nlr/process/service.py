@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \service.py                                                                                                   #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 5:01:50 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 5:49:32 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Long-lived warm worker pool service to which projects are submitted over a local connection.
+
+The service process owns a process pool whose workers are forked from a forkserver that has already imported the
+heavy modules, and keeps the pool between projects. Submitting a project costs a round trip over a local socket
+(a named pipe on Windows) rather than a new interpreter, new imports and a new pool.
+"""
+import os
+import logging
+import threading
+import traceback
+import multiprocessing as mp
+from multiprocessing.connection import Listener, Client
+
+from nlr.utils.config import Config
+from nlr.process.parallel import (MAX_PROCESSORS, listener_configurer, listener_process, worker_initializer,
+                                  run_project)
+from nlr.process.fairshare import FairPool, FAIR_CHUNK_SECONDS
+from nlr.process.admission import MemoryBudget
+# ------------------------------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Modules imported once by the forkserver, so that pool workers forked from it start with them loaded. Modules that
+# are not installed are skipped.
+PRELOAD = ['numpy', 'pandas', 'psutil', 'mysql.connector', 'boto3', 'nlr.data.base', 'nlr.process.dispatch']
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+def get_context():
+    """Returns the forkserver context with the heavy modules preloaded, or the spawn context where unsupported."""
+    if 'forkserver' in mp.get_all_start_methods():
+        context = mp.get_context('forkserver')
+        context.set_forkserver_preload(PRELOAD)
+        return context
+    return mp.get_context('spawn')
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+class _ProjectServer:
+    """Runs submitted projects on the service's pool. Lives in the service process."""
+
+    def __init__(self, context, processes: int, log: bool, memory_budget: int = None) -> None:
+        self.context = context
+        self.processes = processes
+        # One memory budget for the jobs of all the projects running on the pool.
+        self.memory = MemoryBudget(memory_budget)
+        self.queue = None
+        self.listener = None
+        if log:
+            self.queue = context.Queue()
+            self.listener = context.Process(target=listener_process, args=(self.queue, listener_configurer))
+            self.listener.start()
+        self.snapshot = None
+        self.pool = None
+        # Number of projects running, guarded by the condition.
+        self._active = 0
+        self._idle = threading.Condition()
+        self._refresh()
+
+    def _refresh(self) -> None:
+        """Starts the pool, or restarts it if the configuration has changed since the workers were initialized."""
+        snapshot = Config().snapshot()
+        if self.pool is not None and snapshot == self.snapshot:
+            return
+        if self.pool is not None:
+            logger.info("Configuration changed. Restarting the pool service workers.")
+            self.pool.close()
+            self.pool.join()
+        self.snapshot = snapshot
+        self.pool = self.context.Pool(processes=self.processes, initializer=worker_initializer,
+                                      initargs=(snapshot, self.queue))
+        # Projects running at once share the pool by priority and weight.
+        self.fair = FairPool(self.pool, self.processes)
+
+    def run(self, project):
+        with self._idle:
+            # The pool is only restarted between projects.
+            if self._active == 0:
+                self._refresh()
+            self._active += 1
+            share = self.fair.share(project.name, project.priority, project.weight)
+        try:
+            return run_project(project, share, self.processes, max_chunk_cost=FAIR_CHUNK_SECONDS,
+                               memory=self.memory)
+        finally:
+            share.close()
+            with self._idle:
+                self._active -= 1
+                self._idle.notify_all()
+
+    def reply(self, conn, command: str, payload) -> None:
+        if command == 'ping':
+            conn.send(('ok', os.getpid()))
+        elif command == 'run':
+            try:
+                conn.send(('ok', self.run(payload)))
+            except Exception:
+                conn.send(('error', traceback.format_exc()))
+        else:
+            conn.send(('error', "Unknown command {}.".format(command)))
+
+    def handle(self, conn, request: tuple) -> None:
+        """Serves one client connection, starting with its first request, until the client closes it."""
+        with conn:
+            while True:
+                self.reply(conn, *request)
+                try:
+                    request = conn.recv()
+                except EOFError:
+                    return
+
+    def close(self) -> None:
+        with self._idle:
+            self._idle.wait_for(lambda: self._active == 0)
+        self.pool.close()
+        self.pool.join()
+        if self.listener is not None:
+            self.queue.put_nowait(None)
+            self.listener.join()
+
+
+def serve(ready, authkey: bytes, processes: int, log: bool, memory_budget: int = None) -> None:
+    """Service process main. Sends the address it listens on through ready, then serves until told to stop."""
+    server = _ProjectServer(get_context(), processes, log, memory_budget)
+    with Listener(authkey=authkey) as listener:
+        ready.send(listener.address)
+        ready.close()
+        while True:
+            conn = listener.accept()
+            try:
+                command, payload = conn.recv()
+            except EOFError:
+                conn.close()
+                continue
+            if command == 'stop':
+                conn.send(('ok', None))
+                conn.close()
+                break
+            threading.Thread(target=server.handle, args=(conn, (command, payload)), daemon=True).start()
+    server.close()
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+class PoolService:
+    """Handle to a warm worker pool service process.
+
+    Projects are pickled to the service, so their Project, Manager, Job and Worker classes must be importable there.
+    The completed project, with its results and failures, is returned.
+
+    Arguments:
+        processes: The number of pool worker processes.
+        log: If True, the service runs a log listener and workers send their log records to it.
+        memory_budget: Bytes of estimated peak RSS admitted to the pool at once, shared by the projects running on
+            it. None budgets a fraction of the memory available when the service starts.
+    """
+
+    def __init__(self, processes: int = MAX_PROCESSORS, log: bool = True, memory_budget: int = None) -> None:
+        self.processes = processes
+        self.log = log
+        self.memory_budget = memory_budget
+        self.address = None
+        self._authkey = os.urandom(32)
+        self._process = None
+
+    def __enter__(self) -> 'PoolService':
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    @property
+    def running(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def start(self) -> None:
+        """Starts the service process and waits until it is accepting projects."""
+        if self.running:
+            return
+        context = get_context()
+        receiver, sender = context.Pipe(duplex=False)
+        # The service owns a pool, so it cannot be a daemon process.
+        self._process = context.Process(target=serve, name='PoolService',
+                                        args=(sender, self._authkey, self.processes, self.log, self.memory_budget))
+        self._process.start()
+        sender.close()
+        self.address = receiver.recv()
+        receiver.close()
+        logger.info("Pool service started with {} workers at {}.".format(self.processes, self.address))
+
+    def _request(self, command: str, payload=None):
+        with Client(self.address, authkey=self._authkey) as conn:
+            conn.send((command, payload))
+            status, reply = conn.recv()
+        if status == 'error':
+            raise RuntimeError("Pool service failed to run the project.\n{}".format(reply))
+        return reply
+
+    def ping(self) -> int:
+        """Returns the process id of the service."""
+        return self._request('ping')
+
+    def submit(self, project):
+        """Runs the project on the service's pool and returns the completed project."""
+        logger.info("Submitting project {}, id {} to the pool service.".format(project.name, project.id))
+        return self._request('run', project)
+
+    def stop(self) -> None:
+        """Stops the service once its running projects have completed."""
+        if not self.running:
+            return
+        self._request('stop')
+        self._process.join()
+        self._process = None
+        logger.info("Pool service stopped.")
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \accounting.py                                                                                                #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 5:14:07 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 5:50:30 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+"""Resource cost accounting of jobs and projects.
+
+Each job's resource usage, measured by its Profiler, is priced by ResourceRates and rolled up into its project by a
+CostLedger, which summarizes the project's usage and cost by stage, the job class, and category. Rates are read from
+the COSTS section of the configuration, for example:
+
+    [COSTS]
+    core_hour = 0.05
+    gb_transferred = 0.09
+
+Rates not configured take their defaults.
+"""
+import os
+import logging
+from datetime import datetime
+import pandas as pd
+
+from nlr.utils.config import Config
+from nlr.database import DBNAME
+from nlr.database.sequel import TABLES
+# ------------------------------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Resource usage accounted for each job.
+USAGE_FIELDS = ['wall_time', 'cpu_seconds', 'peak_rss', 'read_bytes', 'write_bytes', 'net_bytes']
+# Columns of the summary table, as stored in the project_cost table of the metadata database.
+SUMMARY_COLUMNS = ['run_id', 'project', 'stage', 'category', 'jobs'] + USAGE_FIELDS + ['cost', 'created']
+GB = 2**30
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+class ResourceRates:
+    """Prices of resources in dollars, from which job costs are computed.
+
+    Arguments:
+        core_hour: Price of an hour of CPU time.
+        gb_hour: Price of a GB of memory, the job's peak RSS, held for an hour of the job's wall time.
+        gb_read: Price of a GB read.
+        gb_written: Price of a GB written.
+        gb_transferred: Price of a GB transferred over the network.
+    """
+
+    RATES = ['core_hour', 'gb_hour', 'gb_read', 'gb_written', 'gb_transferred']
+
+    def __init__(self, core_hour: float = 0.05, gb_hour: float = 0.005, gb_read: float = 0.0,
+                 gb_written: float = 0.0, gb_transferred: float = 0.09) -> None:
+        self.core_hour = core_hour
+        self.gb_hour = gb_hour
+        self.gb_read = gb_read
+        self.gb_written = gb_written
+        self.gb_transferred = gb_transferred
+
+    @classmethod
+    def from_config(cls, config: Config = None) -> 'ResourceRates':
+        """Returns the rates in the COSTS section of the configuration, defaulting those not configured."""
+        try:
+            config = config or Config()
+            section = config.read_section('COSTS') if config.exists('COSTS') else {}
+        except Exception as e:
+            logger.warning("Cost rates unavailable from the configuration. Using defaults. {}".format(e))
+            section = {}
+        return cls(**{rate: float(value) for rate, value in section.items() if rate in cls.RATES})
+
+    def cost(self, usage: dict) -> float:
+        """Returns the cost in dollars of a job's resource usage."""
+        def get(field):
+            return usage.get(field) or 0
+        return (get('cpu_seconds') / 3600 * self.core_hour
+                + get('peak_rss') / GB * get('wall_time') / 3600 * self.gb_hour
+                + get('read_bytes') / GB * self.gb_read
+                + get('write_bytes') / GB * self.gb_written
+                + get('net_bytes') / GB * self.gb_transferred)
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+class CostLedger:
+    """Rolls up the resource usage and cost of a project's jobs as their results arrive.
+
+    Usage is summed, except peak RSS, of which the largest is kept, both for the project as a whole and by stage and
+    category, where the stage is the job's class and the category the parameter in its key, if any.
+
+    Arguments:
+        rates: The ResourceRates pricing the jobs' usage. Defaults to those configured.
+    """
+
+    def __init__(self, rates: ResourceRates = None) -> None:
+        self.rates = rates or ResourceRates.from_config()
+        self.totals = dict.fromkeys(USAGE_FIELDS + ['cost'], 0.0)
+        self.jobs = 0
+        self._groups = {}
+
+    @staticmethod
+    def _accumulate(totals: dict, usage: dict) -> None:
+        for field, value in usage.items():
+            if field == 'peak_rss':
+                totals[field] = max(totals.get(field, 0.0), value or 0)
+            elif field in totals:
+                totals[field] += value or 0
+
+    def add(self, result) -> float:
+        """Prices a job's Results usage, records its cost in the usage, rolls it up and returns the cost."""
+        usage = getattr(result, 'usage', None)
+        if not usage:
+            return 0.0
+        usage['cost'] = self.rates.cost(usage)
+        category = (result.job_key or '').partition(':')[2] or None
+        group = self._groups.setdefault((result.job_name, category),
+                                        dict(jobs=0, **dict.fromkeys(USAGE_FIELDS + ['cost'], 0.0)))
+        group['jobs'] += 1
+        self.jobs += 1
+        self._accumulate(group, usage)
+        self._accumulate(self.totals, usage)
+        return usage['cost']
+
+    @property
+    def cost(self) -> float:
+        """The total cost in dollars of the jobs added."""
+        return self.totals['cost']
+
+    def summary(self, run_id: str = None, project: str = None) -> pd.DataFrame:
+        """Returns the usage and cost by stage and category, most expensive first."""
+        created = datetime.now()
+        rows = [dict(group, run_id=run_id, project=project, stage=stage, category=category, created=created)
+                for (stage, category), group in self._groups.items()]
+        df = pd.DataFrame(rows, columns=SUMMARY_COLUMNS)
+        return df.sort_values('cost', ascending=False, ignore_index=True)
+
+    @staticmethod
+    def save(summary: pd.DataFrame, directory: str = None) -> str:
+        """Writes a summary table as a Parquet file and returns its filepath.
+
+        Arguments:
+            summary: The table returned by summary().
+            directory: Defaults to the costs directory under the log directory.
+        """
+        directory = directory or os.path.join(Config().read_config('LOGGING', 'logdir'), 'costs')
+        os.makedirs(directory, exist_ok=True)
+        run_id = summary['run_id'].iloc[0] if len(summary) else None
+        filepath = os.path.join(directory, "{}_{}.parquet".format(datetime.now().strftime("%Y%m%d-%H%M%S"), run_id))
+        summary.to_parquet(filepath, index=False)
+        return filepath
+
+    @staticmethod
+    def insert(summary: pd.DataFrame, database: str = DBNAME) -> None:
+        """Inserts the rows of a summary table into the project_cost table of the metadata database.
+
+        Arguments:
+            summary: The table returned by summary().
+            database: The metadata database, in which the table is created if it does not exist.
+        """
+        # Imported here, as the MySQL connector is needed only where costs are recorded in the database.
+        from nlr.database.connect import MySQLDatabase
+        from nlr.database.admin import TableAdmin
+        table_admin = TableAdmin()
+        conn = MySQLDatabase()
+        with conn(database) as connection:
+            table_admin.create('project_cost', connection, TABLES['project_cost'])
+            table_admin.insert('project_cost', summary[SUMMARY_COLUMNS], connection)
@@ -12,21 +12,220 @@
 # URL      : https://github.com/john-james-sf/nlr                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # Created  : Monday, November 8th 2021, 11:25:50 pm                                                                        #
-# Modified : Saturday, November 13th 2021, 6:53:41 am                                                                      #
+# Modified : Sunday, October 18th 2026, 6:09:48 pm                                                                         #
 # Modifier : John James (john.james.sf@gmail.com)                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # License  : BSD 3-clause "New" or "Revised" License                                                                       #
 # Copyright: (c) 2021 nov8.ai                                                                                              #
 # ======================================================================================================================== #
 import os
+import contextlib
 from configparser import ConfigParser
+from types import MappingProxyType
 import pandas as pd
+
+from nlr.utils.file import atomic_output, locked
 # ------------------------------------------------------------------------------------------------------------------------ #
 configfile = os.path.join("config", "config.ini")
 # ------------------------------------------------------------------------------------------------------------------------ #
+# Parsed configurations shared by every Config reader in the process, keyed by filepath. Each entry holds the file
+# signature at parse time and the parsed ConfigParser, which must be treated as read-only.
+_cache = {}
+# Callables notified after each write with the filepath and the set of sections the write changed.
+_listeners = []
+# Snapshot installed in pool worker processes. While installed, reads of its file are served from memory.
+_snapshot = None
+# The file's configuration with a partial snapshot's sections in place of its own, keyed by filepath. Each entry holds
+# the snapshot and the parsed file it was built from.
+_overlays = {}
+
+
+def _signature(filepath: str) -> tuple:
+    """Returns the (mtime, size, inode) signature of the configuration file, or None if it does not exist."""
+    try:
+        stat = os.stat(filepath)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def _load(filepath: str) -> ConfigParser:
+    """Returns the parsed configuration, re-reading the file only if it changed since it was last parsed."""
+    if _snapshot is not None and _snapshot.filepath == filepath:
+        if not _snapshot.partial:
+            return _snapshot._parser
+        return _overlay(_snapshot, _load_file(filepath))
+    return _load_file(filepath)
+
+
+def _load_file(filepath: str) -> ConfigParser:
+    """Returns the parsed configuration file, re-reading it only if it changed since it was last parsed."""
+    signature = _signature(filepath)
+    cached = _cache.get(filepath)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    config = ConfigParser()
+    config.read(filepath)
+    _cache[filepath] = (signature, config)
+    return config
+
+
+def _overlay(snapshot: 'ConfigSnapshot', config: ConfigParser) -> ConfigParser:
+    """Returns the parsed file's configuration with the snapshot's sections in place of its own."""
+    cached = _overlays.get(snapshot.filepath)
+    if cached is not None and cached[0] is snapshot and cached[1] is config:
+        return cached[2]
+    overlay = ConfigParser(interpolation=None)
+    overlay.read_dict({section: dict(config[section]) for section in config.sections()
+                       if section not in snapshot._sections})
+    overlay.read_dict(snapshot._sections)
+    _overlays[snapshot.filepath] = (snapshot, config, overlay)
+    return overlay
+
+
+def _store(filepath: str, config: ConfigParser) -> None:
+    """Atomically replaces the configuration file and primes the cache with it.
+
+    The configuration is written to a temporary file in the same directory, which is then renamed over the
+    original, so readers see either the old or the new file, never a partial one. A snapshot installed for the
+    file is uninstalled, since it no longer reflects the configuration.
+    """
+    global _snapshot
+    with atomic_output(filepath, 'w') as fp:
+        config.write(fp)
+    _cache[filepath] = (_signature(filepath), config)
+    if _snapshot is not None and _snapshot.filepath == filepath:
+        _snapshot = None
+
+
+def invalidate(filepath: str = configfile) -> None:
+    """Discards the cached configuration so that the next read parses the file."""
+    _cache.pop(filepath, None)
+
+
+def add_listener(listener) -> None:
+    """Registers a callable to be notified of configuration writes.
+
+    Arguments:
+        listener: Callable accepting the filepath and the set of changed section names.
+    """
+    _listeners.append(listener)
+
+
+def _sections(config: ConfigParser) -> dict:
+    return {section: dict(config.items(section, raw=True)) for section in config.sections()}
+
+
+def install_snapshot(snapshot: 'ConfigSnapshot') -> None:
+    """Serves all subsequent reads of the snapshot's file from the snapshot, without file I/O.
+
+    Intended for pool worker initializers, which receive the snapshot frozen by the parent process. A partial
+    snapshot serves its own sections, and the others are read from this process's copy of the file.
+
+    Arguments:
+        snapshot: The snapshot to install. None uninstalls the current snapshot.
+    """
+    global _snapshot
+    _snapshot = snapshot
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+class ConfigSnapshot:
+    """Immutable, picklable copy of the configuration taken at a point in time.
+
+    Arguments:
+        filepath: The configuration file the snapshot was taken from.
+        sections: Dictionary mapping section names to dictionaries of option / value pairs.
+        partial: True if the snapshot holds only some of the sections. Once installed, the other sections are read
+            from the configuration file where it is installed.
+    """
+
+    def __init__(self, filepath: str, sections: dict, partial: bool = False) -> None:
+        sections = {section: dict(options)
+                    for section, options in sections.items()}
+        parser = ConfigParser(interpolation=None)
+        parser.read_dict(sections)
+        object.__setattr__(self, 'filepath', filepath)
+        object.__setattr__(self, '_sections', sections)
+        object.__setattr__(self, '_parser', parser)
+        object.__setattr__(self, 'partial', partial)
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError("ConfigSnapshot is read-only.")
+
+    def __reduce__(self):
+        return (self.__class__, (self.filepath, self._sections, self.partial))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ConfigSnapshot):
+            return NotImplemented
+        return (self.filepath == other.filepath and self._sections == other._sections
+                and self.partial == other.partial)
+
+    __hash__ = None
+
+    def sections(self) -> list:
+        return list(self._sections.keys())
+
+    def section(self, name: str) -> MappingProxyType:
+        """Returns a read-only view of the named section. Raises KeyError if it does not exist."""
+        return MappingProxyType(self._sections[name])
+
+    @property
+    def paths(self) -> MappingProxyType:
+        return MappingProxyType(self._sections.get('PATH', {}))
+
+    @property
+    def logging(self) -> MappingProxyType:
+        return MappingProxyType(self._sections.get('LOGGING', {}))
+
+    @property
+    def logdir(self) -> str:
+        return self._parser['LOGGING']['logdir']
+
+    def credentials(self, name: str) -> dict:
+        """Returns a copy of the credentials for the named resource."""
+        return dict(self._sections[name])
+
+    def autologin(self, name: str) -> bool:
+        """Returns True if autologin is enabled for the named resource."""
+        return 'True' in self._parser['AUTOLOGIN'][name]
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
 
 
 class Config:
+    """Reads and writes the project configuration file.
+
+    Reads are served from a per-process cache that is invalidated when the file's modification time or size changes.
+    Writes are applied as locked transactions that atomically replace the file.
+
+    Arguments:
+        filepath: The configuration file. Defaults to config/config.ini
+    """
+
+    def __init__(self, filepath: str = configfile) -> None:
+        self._filepath = filepath
+
+    def _read(self) -> ConfigParser:
+        """Parses a private copy of the configuration for modification."""
+        config = ConfigParser()
+        config.read(self._filepath)
+        return config
+
+    def snapshot(self, sections: list = None) -> ConfigSnapshot:
+        """Returns an immutable snapshot of the current configuration.
+
+        Arguments:
+            sections: Optional names of the sections to include, those that exist. Defaults to all sections. A
+                snapshot of some sections is partial: where it is installed, the others are read from the file.
+        """
+        config = _load(self._filepath)
+        return ConfigSnapshot(self._filepath, {section: dict(config[section]) for section in config.sections()
+                                               if sections is None or section in sections},
+                              partial=sections is not None)
 
     def exists(self, name: str) -> bool:
         """Returns True if the named section exists, False otherwise.
@@ -34,15 +233,10 @@ class Config:
         Arguments:
             name : The name of the resource
         """
-
-        config = ConfigParser()
-        config.read(configfile)
-        return name in config.sections()
+        return name in _load(self._filepath).sections()
 
     def read_config(self, section: str, option: str):
-        config = ConfigParser()
-        config.read(configfile)
-        return config[section][option]
+        return _load(self._filepath)[section][option]
 
     def read_section(self, section: str, as_df=False):
         """Returns the a section configuration.
@@ -51,12 +245,7 @@ class Config:
             section: The section of the configuration to read
             as_dict: If True return as dictionary, otherwise return as dataframe.
         """
-        config = ConfigParser()
-        config.read(configfile)
-        options = config[section]
-        d = {}
-        for option in options:
-            d[option] = self.read_config(section, option)
+        d = dict(_load(self._filepath)[section])
 
         if as_df:
             return pd.DataFrame.from_dict(d, orient='index')
@@ -64,48 +253,66 @@ class Config:
         else:
             return d
 
+    @contextlib.contextmanager
+    def transaction(self):
+        """Applies a batch of changes with one parse and one atomic write.
+
+        The configuration file is locked against other writers, processes included, for the duration of the
+        context. Changes are written only if the block completes without raising.
+
+            with config.transaction() as parser:
+                parser['LOGGING']['level'] = 'debug'
+        """
+        with locked(self._filepath):
+            config = self._read()
+            before = _sections(config)
+            yield config
+            _store(self._filepath, config)
+
+        after = _sections(config)
+        changed = {section for section in before.keys() | after.keys()
+                   if before.get(section) != after.get(section)}
+        if changed:
+            for listener in _listeners:
+                listener(self._filepath, changed)
+
+    def write_sections(self, sections: dict) -> None:
+        """Writes a batch of options in a single transaction.
+
+        Arguments:
+            sections: Dictionary mapping section names to dictionaries of option / value pairs.
+        """
+        with self.transaction() as config:
+            for section, options in sections.items():
+                if not config.has_section(section):
+                    config.add_section(section)
+                for option, value in options.items():
+                    config[section][option] = value
+
     def write_config(self, section: str, option: str, value: str):
-        config = ConfigParser()
-        config.read(configfile)
-        try:
-            config[section][option] = value
-        except KeyError as e:
-            config[section] = {}
-            config[section][option] = value
-        with open(configfile, 'w') as fp:
-            config.write(fp)
+        self.write_sections({section: {option: value}})
 
     def write_configs(self, section: str, options: list, values: list):
         assert len(options) == len(
             values), "Error in Config.write_configs: options and values lists must have same length."
-        for i in range(len(options)):
-            self.write_config(section, options[i], values[i])
+        self.write_sections({section: dict(zip(options, values))})
 
     def write_options(self, section: str, options: list):
         """Options are expected to be a list of key/value pairs."""
-        config = ConfigParser()
-        config.read(configfile)
+        d = {}
         for option in options:
-            for k, v in option.items():
-                self.write_config(section=section, option=k, value=v)
+            d.update(option)
+        self.write_sections({section: d})
 
     def remove_section(self, section: str):
-        config = ConfigParser()
-        config.read(configfile)
-        config.remove_section(section)
-        with open(configfile, 'w') as fp:
-            config.write(fp)
+        with self.transaction() as config:
+            config.remove_section(section)
 
     def remove_option(self, section: str, option: str):
-        config = ConfigParser()
-        config.read(configfile)
-        config.remove_option(section, option)
-        with open(configfile, 'w') as fp:
-            config.write(fp)
+        with self.transaction() as config:
+            config.remove_option(section, option)
 
     def print_section(self, section: str):
-        config = ConfigParser()
-        config.read(configfile)
         d = self.read_section(section, as_df=False)
         try:
             d['password'] = '*****'
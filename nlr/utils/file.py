@@ -12,7 +12,7 @@
 # URL      : https://github.com/john-james-sf/nlr                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # Created  : Monday, November 8th 2021, 3:39:51 pm                                                                         #
-# Modified : Monday, November 8th 2021, 9:51:01 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 6:09:48 pm                                                                         #
 # Modifier : John James (john.james.sf@gmail.com)                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # License  : BSD 3-clause "New" or "Revised" License                                                                       #
@@ -20,16 +20,23 @@
 # ======================================================================================================================== #
 """File utilities."""
 import os
-from configparser import ConfigParser
+import shutil
+import tempfile
+import contextlib
+try:
+    import fcntl
+except ImportError:     # Windows
+    fcntl = None
+    import msvcrt
 # ------------------------------------------------------------------------------------------------------------------------ #
 
 
 def get_absdir(basedir: str) -> str:
     """Returns absolute path to the designate base directory """
     """Returns filenames in a directory specified by its basename. """
-    config = ConfigParser()
-    config.read(configfile)
-    folder = config['PATH'][basename]
+    # Imported here, as nlr.utils.config imports this module.
+    from nlr.utils.config import Config
+    folder = Config().read_config('PATH', basedir)
     return folder
 
 
@@ -43,8 +50,63 @@ def get_filepaths(basedir: str) -> list:
 
 def get_filenames(basedir: str) -> list:
     """Returns filenames in a directory specified by its basename. """
-    config = ConfigParser()
-    config.read(configfile)
-    folder = config['PATH'][basename]
-    filenames = os.path.listdir(folder)
+    # Imported here, as nlr.utils.config imports this module.
+    from nlr.utils.config import Config
+    folder = Config().read_config('PATH', basedir)
+    filenames = os.listdir(folder)
     return filenames
+
+
+@contextlib.contextmanager
+def atomic_output(filepath: str, mode: str = 'wb'):
+    """Opens a temporary file beside filepath for writing, and renames it over filepath when the block completes.
+
+    Readers see the previous file or the complete new one, never a partial one, and of two jobs writing the same
+    output, as a job and its speculative duplicate do, the last to complete replaces the other's whole file. If the
+    block raises, the temporary file is removed and filepath is left as it was.
+
+    Arguments:
+        filepath: The output file.
+        mode: The mode in which the temporary file is opened.
+    """
+    directory = os.path.dirname(filepath) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, temppath = tempfile.mkstemp(prefix='.' + os.path.basename(filepath), suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, mode) as fp:
+            yield fp
+            fp.flush()
+            os.fsync(fp.fileno())
+        if os.path.exists(filepath):
+            shutil.copymode(filepath, temppath)
+        os.replace(temppath, filepath)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temppath)
+        raise
+
+
+@contextlib.contextmanager
+def locked(filepath: str):
+    """Holds an exclusive advisory lock on the file for the duration of the context.
+
+    The lock is taken on a companion .lock file, so that it holds across the file being replaced by atomic_output,
+    and excludes other processes as well as other threads.
+
+    Arguments:
+        filepath: The file to lock, such as the configuration file or a manifest.
+    """
+    with open(filepath + '.lock', 'a+') as fp:
+        if fcntl:
+            fcntl.flock(fp.fileno(), fcntl.LOCK_EX)
+        else:
+            fp.seek(0)
+            msvcrt.locking(fp.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(fp.fileno(), fcntl.LOCK_UN)
+            else:
+                fp.seek(0)
+                msvcrt.locking(fp.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \history.py                                                                                                   #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 4:48:11 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 6:06:17 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+"""Persistent job profile history and run-to-run regression detection.
+
+Every job profile, the Profiler statistics returned in the job's Results, is appended to a columnar history store:
+a directory of Parquet files, one per project run, under the log directory. Parquet support requires pyarrow.
+
+Runs are compared from the command line:
+
+    python -m nlr.utils.history runs
+    python -m nlr.utils.history compare <run_id> [--baseline <run_id> ...]
+
+A job is flagged when a metric's median in the run exceeds the baseline median by more than the threshold and a
+one-sided Mann-Whitney U test finds the increase significant. When either side has too few jobs for the test, the
+comparison is reported as untested, with no p-value, and is not flagged. The compare command exits with status 1 if
+any regression is flagged.
+"""
+import os
+import sys
+import math
+import uuid
+import glob
+import argparse
+import logging
+from datetime import datetime, timedelta
+import numpy as np
+import pandas as pd
+
+from nlr.utils.config import Config
+# ------------------------------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Metrics compared between runs.
+METRICS = ['wall_time', 'peak_rss', 'io_bytes']
+# Minimum number of jobs on each side for the significance test.
+MIN_SAMPLES = 3
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+def profile_record(run_id: str, project: str, job_id: str, profile: dict, job_key: str = None,
+                   size: float = None, usage: dict = None) -> dict:
+    """Flattens a job's Profiler statistics into a history record.
+
+    Arguments:
+        run_id: Identifier of the run, i.e. the project id.
+        project: Name of the project.
+        job_id: Identifier of the job.
+        profile: The Profiler statistics from the job's Results.
+        job_key: Optional key identifying the job across runs.
+        size: Optional size of the job's work, from its parameters.
+        usage: Optional resources the job used, from its Results. Its bytes read, written and transferred are the
+            job's alone. The profile's are the running totals of the worker process, which has run other jobs, so
+            without usage the job's bytes are not recorded.
+    """
+    d = {}
+    d['run_id'] = run_id
+    d['project'] = project
+    d['job_id'] = job_id
+    d['job_key'] = job_key
+    d['size'] = size
+    for k, v in profile.items():
+        if isinstance(v, timedelta):
+            v = v.total_seconds()
+        d[k] = v
+    for k in ['read_bytes', 'write_bytes', 'net_bytes']:
+        d[k] = usage.get(k) if usage else None
+    io_bytes = [d[k] for k in ['read_bytes', 'write_bytes'] if d[k] is not None]
+    d['io_bytes'] = sum(io_bytes) if io_bytes else None
+    # Sampled jobs report their peak; otherwise the RSS at the end of the job is the best available estimate, and is
+    # marked as one.
+    d['peak_rss'] = profile.get('peak_rss', profile.get('rss'))
+    d['peak_rss_estimated'] = 'peak_rss' not in profile
+    return d
+
+
+class ProfileHistory:
+    """Columnar store of job profiles across runs.
+
+    Arguments:
+        directory: Directory holding the Parquet files. Defaults to the profiles directory under the log directory.
+    """
+
+    def __init__(self, directory: str = None) -> None:
+        self.directory = directory or os.path.join(Config().read_config('LOGGING', 'logdir'), 'profiles')
+
+    def append(self, records: list) -> str:
+        """Appends profile records as a new Parquet file and returns its filepath."""
+        if not records:
+            return None
+        os.makedirs(self.directory, exist_ok=True)
+        df = pd.DataFrame(records)
+        filename = "{}_{}.parquet".format(datetime.now().strftime("%Y%m%d-%H%M%S"), uuid.uuid4().hex[:8])
+        filepath = os.path.join(self.directory, filename)
+        df.to_parquet(filepath, index=False)
+        return filepath
+
+    def load(self, run_ids: list = None) -> pd.DataFrame:
+        """Loads the history, optionally restricted to the given runs."""
+        filepaths = sorted(glob.glob(os.path.join(self.directory, '*.parquet')))
+        if not filepaths:
+            return pd.DataFrame(columns=['run_id', 'project', 'job_id', 'job_key', 'size', 'job'] + METRICS)
+        df = pd.concat([pd.read_parquet(filepath) for filepath in filepaths], ignore_index=True)
+        if run_ids is not None:
+            df = df[df['run_id'].isin(run_ids)]
+        return df
+
+    def runs(self) -> pd.DataFrame:
+        """Summarizes the stored runs, oldest first."""
+        df = self.load()
+        if df.empty:
+            return pd.DataFrame(columns=['run_id', 'project', 'start_time', 'jobs'])
+        runs = df.groupby(['run_id', 'project'], as_index=False).agg(
+            start_time=('start_time', 'min'), jobs=('job_id', 'count'))
+        return runs.sort_values('start_time', ignore_index=True)
+
+    def compare(self, run_id: str, baseline: list = None, metrics: list = METRICS, alpha: float = 0.05,
+                threshold: float = 0.1) -> pd.DataFrame:
+        """Compares a run against baseline runs by job name.
+
+        Arguments:
+            run_id: The run to check.
+            baseline: Baseline run ids. Defaults to all earlier runs of the same project.
+            metrics: The metrics to compare.
+            alpha: Significance level of the one-sided Mann-Whitney U test.
+            threshold: Minimum relative increase in the median to be flagged, e.g. 0.1 for 10%.
+        """
+        df = self.load()
+        run = df[df['run_id'] == run_id]
+        if run.empty:
+            raise KeyError("Run {} not found in {}.".format(run_id, self.directory))
+        if baseline is None:
+            runs = self.runs()
+            project = run['project'].iloc[0]
+            start_time = runs.loc[runs['run_id'] == run_id, 'start_time'].iloc[0]
+            earlier = runs[(runs['project'] == project) & (runs['start_time'] < start_time)]
+            baseline = list(earlier['run_id'])
+        base = df[df['run_id'].isin(baseline)]
+
+        rows = []
+        for job, group in run.groupby('job'):
+            base_group = base[base['job'] == job]
+            for metric in metrics:
+                x = group[metric].dropna().astype(float).values
+                y = base_group[metric].dropna().astype(float).values
+                if len(x) == 0 or len(y) == 0:
+                    continue
+                median, base_median = float(np.median(x)), float(np.median(y))
+                change = (median - base_median) / base_median if base_median else np.nan
+                # Too few jobs on either side to test leaves the comparison untested, and it is not flagged.
+                p_value = _mann_whitney_greater(x, y) if min(len(x), len(y)) >= MIN_SAMPLES else np.nan
+                significant = bool(p_value < alpha) if not np.isnan(p_value) else False
+                rows.append({'job': job, 'metric': metric, 'n': len(x), 'baseline_n': len(y),
+                             'median': median, 'baseline_median': base_median, 'change': change,
+                             'p_value': p_value,
+                             'regression': bool(change > threshold and significant)})
+        return pd.DataFrame(rows, columns=['job', 'metric', 'n', 'baseline_n', 'median', 'baseline_median',
+                                           'change', 'p_value', 'regression'])
+
+
+def _mann_whitney_greater(x: np.ndarray, y: np.ndarray) -> float:
+    """Returns the p-value of a one-sided Mann-Whitney U test that x tends to exceed y.
+
+    Uses the normal approximation with tie correction.
+    """
+    n1, n2 = len(x), len(y)
+    ranks = pd.Series(np.concatenate((x, y))).rank().values
+    u = ranks[:n1].sum() - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    _, counts = np.unique(np.concatenate((x, y)), return_counts=True)
+    tie_term = ((counts ** 3 - counts).sum()) / (n * (n - 1))
+    sigma = math.sqrt(n1 * n2 / 12 * ((n + 1) - tie_term))
+    if sigma == 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / sigma
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m nlr.utils.history',
+                                     description="Job profile history and regression detection.")
+    parser.add_argument("--directory", type=str, default=None, help="Profile history directory.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('runs', help="List stored runs.")
+    compare = subparsers.add_parser('compare', help="Compare a run against a baseline.")
+    compare.add_argument("run_id", type=str, help="Run (project) id to check.")
+    compare.add_argument("--baseline", type=str, nargs='+', default=None,
+                         help="Baseline run ids. Defaults to all earlier runs of the same project.")
+    compare.add_argument("--alpha", type=float, default=0.05, help="Significance level.")
+    compare.add_argument("--threshold", type=float, default=0.1,
+                         help="Minimum relative increase in the median to flag.")
+    args = parser.parse_args(argv)
+
+    history = ProfileHistory(args.directory)
+    if args.command == 'runs':
+        print(history.runs().to_string(index=False))
+        return 0
+
+    df = history.compare(args.run_id, baseline=args.baseline, alpha=args.alpha, threshold=args.threshold)
+    print(df.to_string(index=False))
+    regressions = df[df['regression']]
+    if len(regressions):
+        print("\n{} regression(s) in run {}.".format(len(regressions), args.run_id))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
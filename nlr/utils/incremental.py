@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \incremental.py                                                                                               #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 5:04:45 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 6:09:48 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Content-hash incremental execution of jobs and build steps.
+
+A step declares its inputs: the files it reads, its parameters and the version of its code, together with the files
+it writes. The step is up to date, and need not run, if the fingerprint of its inputs matches the one recorded when
+it last succeeded and its outputs are unchanged since then.
+
+Files are fingerprinted by content, but a file's digest is only recomputed if its size or modification time has
+changed since it was last hashed, so checking that an unchanged build is up to date costs one stat per file.
+"""
+import os
+import json
+import inspect
+import hashlib
+import logging
+
+from nlr.utils.config import Config
+from nlr.utils.file import atomic_output, locked
+# ------------------------------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------------------------------ #
+MANIFEST = 'manifest.json'
+# Bytes read at a time when hashing files.
+BLOCKSIZE = 1 << 20
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+class StepInputs:
+    """Declares what a step depends on and what it produces.
+
+    Arguments:
+        files: Paths of the files the step reads.
+        params: JSON-serializable parameters of the step.
+        version: Version of the step's code. Changing it invalidates the step's previous outputs.
+        outputs: Paths of the files the step writes.
+    """
+
+    def __init__(self, files: list = (), params: dict = None, version: str = None, outputs: list = ()) -> None:
+        self.files = list(files)
+        self.params = params
+        self.version = version
+        self.outputs = list(outputs)
+
+
+def params_digest(params) -> str:
+    """Returns a short digest of JSON-serializable parameters."""
+    return hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+def source_version(obj) -> str:
+    """Returns a version for a class, or the class of an object, from a digest of its source code."""
+    cls = obj if inspect.isclass(obj) else obj.__class__
+    try:
+        source = inspect.getsource(cls)
+    except (OSError, TypeError):
+        return cls.__qualname__
+    return hashlib.sha256(source.encode()).hexdigest()[:16]
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+class StepCache:
+    """Records the fingerprints of steps that have succeeded, to decide which steps are up to date.
+
+    The records are held in memory and written to the manifest by save(). Caches of projects running at once share
+    the manifest, so save() merges this cache's changes into the manifest on disk rather than replacing it.
+
+    Arguments:
+        directory: Directory holding the manifest. Defaults to the steps directory under the log directory.
+    """
+
+    def __init__(self, directory: str = None) -> None:
+        self.directory = directory or os.path.join(Config().read_config('LOGGING', 'logdir'), 'steps')
+        self.filepath = os.path.join(self.directory, MANIFEST)
+        self._steps, self._files = self._read()
+        self._dirty = False
+        # Steps recorded or forgotten since the last save, forgotten steps as None, and whether all were forgotten.
+        self._changes = {}
+        self._cleared = False
+
+    def _read(self) -> tuple:
+        if not os.path.exists(self.filepath):
+            return {}, {}
+        with open(self.filepath) as fp:
+            manifest = json.load(fp)
+        return manifest.get('steps', {}), manifest.get('files', {})
+
+    def digest(self, filepath: str) -> str:
+        """Returns the content digest of a file, rehashing it only if its size or modification time has changed."""
+        filepath = os.path.abspath(filepath)
+        st = os.stat(filepath)
+        known = self._files.get(filepath)
+        if known and known[0] == st.st_size and known[1] == st.st_mtime_ns:
+            return known[2]
+        h = hashlib.sha256()
+        with open(filepath, 'rb') as fp:
+            for block in iter(lambda: fp.read(BLOCKSIZE), b''):
+                h.update(block)
+        self._files[filepath] = [st.st_size, st.st_mtime_ns, h.hexdigest()]
+        self._dirty = True
+        return h.hexdigest()
+
+    def fingerprint(self, inputs: StepInputs) -> str:
+        """Returns the fingerprint of the step's inputs. Raises FileNotFoundError if an input file does not exist."""
+        h = hashlib.sha256()
+        h.update(json.dumps(inputs.params, sort_keys=True, default=str).encode())
+        h.update(str(inputs.version).encode())
+        for filepath in sorted(os.path.abspath(f) for f in inputs.files):
+            h.update(filepath.encode())
+            h.update(self.digest(filepath).encode())
+        return h.hexdigest()
+
+    def is_current(self, key: str, inputs: StepInputs) -> bool:
+        """Returns True if the step last succeeded with the same inputs and its outputs are unchanged since."""
+        record = self._steps.get(key)
+        if record is None:
+            return False
+        try:
+            if record['inputs'] != self.fingerprint(inputs):
+                return False
+            outputs = {os.path.abspath(f) for f in inputs.outputs}
+            if outputs != set(record['outputs']):
+                return False
+            return all(self.digest(f) == digest for f, digest in record['outputs'].items())
+        except FileNotFoundError:
+            return False
+
+    def record(self, key: str, inputs: StepInputs) -> None:
+        """Records that the step has succeeded with its current inputs and outputs."""
+        try:
+            self._steps[key] = {'inputs': self.fingerprint(inputs),
+                                'outputs': {os.path.abspath(f): self.digest(f) for f in inputs.outputs}}
+        except FileNotFoundError as e:
+            logger.warning("Step {} not recorded. {}".format(key, e))
+            self._steps.pop(key, None)
+        self._changes[key] = self._steps.get(key)
+        self._dirty = True
+
+    def invalidate(self, key: str = None) -> None:
+        """Forgets the named step, or all steps if no name is given."""
+        if key is None:
+            self._steps = {}
+            self._changes = {}
+            self._cleared = True
+        else:
+            self._steps.pop(key, None)
+            self._changes[key] = None
+        self._dirty = True
+
+    def save(self) -> None:
+        """Merges this cache's changes into the manifest and atomically writes it, if anything has changed.
+
+        Under a lock on the manifest, the manifest is re-read, so that steps recorded by other caches since this one
+        read it are kept, and the steps this cache recorded or forgot, and the file digests it computed, are applied.
+        """
+        if not self._dirty:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        with locked(self.filepath):
+            steps, files = self._read()
+            if self._cleared:
+                steps = {}
+            for key, record in self._changes.items():
+                if record is None:
+                    steps.pop(key, None)
+                else:
+                    steps[key] = record
+            files.update(self._files)
+            with atomic_output(self.filepath, 'w') as fp:
+                json.dump({'steps': steps, 'files': files}, fp)
+        self._steps, self._files = steps, files
+        self._changes = {}
+        self._cleared = False
+        self._dirty = False
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \journal.py                                                                                                   #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 5:19:22 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 5:53:20 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Durable journal of projects and their jobs' states, from which an interrupted project is resumed.
+
+The journal is a SQLite database under the log directory. It holds each project as created, with its jobs, the
+state of each job, pending until it succeeds or fails, and pointers to the pickled Results of the jobs that
+succeeded and to the partial states reduced inside the workers. Resuming a project runs only its incomplete jobs
+and replays the stored results and partial states into its Manager.
+
+Writes are committed in batches. A chunk's partial state and its jobs' states are committed together, so a project
+interrupted mid-chunk reruns the whole chunk rather than counting part of it twice.
+
+Stored results take as much disk as the pickled Results of the jobs that succeeded, and are kept until the project
+completes without failures, when they are deleted and only the project's and its jobs' states are kept. A project
+that failed keeps them, to be resumed, until it is removed with remove_project.
+"""
+import io
+import os
+import pickle
+import sqlite3
+import logging
+import shutil
+from datetime import datetime
+
+from nlr.utils.config import Config
+from nlr.utils.sharedarray import ArrayHandle
+# ------------------------------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------------------------------ #
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects(
+    id TEXT PRIMARY KEY NOT NULL,
+    name TEXT NOT NULL,
+    state TEXT NOT NULL,
+    created TIMESTAMP,
+    updated TIMESTAMP,
+    project BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jobs(
+    project_id TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    job_key TEXT,
+    state TEXT NOT NULL,
+    updated TIMESTAMP,
+    result TEXT,
+    error TEXT,
+    PRIMARY KEY (project_id, job_id)
+);
+CREATE TABLE IF NOT EXISTS partials(
+    project_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    pointer TEXT NOT NULL,
+    PRIMARY KEY (project_id, seq)
+);
+"""
+# Job and project states.
+PENDING, SUCCEEDED, FAILED, RUNNING, COMPLETED = 'pending', 'succeeded', 'failed', 'running', 'completed'
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+class _DurablePickler(pickle.Pickler):
+    """Refuses shared arrays, which do not outlive the process that owns them."""
+
+    def persistent_id(self, obj):
+        if isinstance(obj, ArrayHandle):
+            raise pickle.PicklingError("Shared array {} cannot be journaled.".format(obj.name))
+        return None
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+class ProjectJournal:
+    """SQLite journal of projects, job states and pointers to stored results.
+
+    Arguments:
+        directory: Directory of the database and stored results. Defaults to the journal directory under the log
+            directory.
+    """
+
+    def __init__(self, directory: str = None) -> None:
+        self.directory = directory or os.path.join(Config().read_config('LOGGING', 'logdir'), 'journal')
+        self.filepath = os.path.join(self.directory, 'journal.sqlite')
+        os.makedirs(self.directory, exist_ok=True)
+        self._connection = None
+        self.connection.executescript(SCHEMA)
+        self.connection.commit()
+
+    def __getstate__(self) -> dict:
+        # The connection is reopened in the receiving process.
+        return {'directory': self.directory, 'filepath': self.filepath, '_connection': None}
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.filepath, timeout=30)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        return self._connection
+
+    def commit(self) -> None:
+        """Makes the writes since the last commit durable."""
+        self.connection.commit()
+
+    def close(self) -> None:
+        """Closes the connection, discarding uncommitted writes."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def store(self, project_id: str, name: str, obj) -> str:
+        """Pickles an object under the project's directory and returns its pointer, or None if it does not pickle."""
+        buffer = io.BytesIO()
+        try:
+            _DurablePickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(obj)
+        except Exception as e:
+            logger.warning("Project {} {} not journaled. It will run again if the project is resumed. {}".format(
+                project_id, name, e))
+            return None
+        directory = os.path.join(self.directory, project_id)
+        os.makedirs(directory, exist_ok=True)
+        pointer = os.path.join(directory, "{}.pickle".format(name))
+        with open(pointer, 'wb') as fp:
+            fp.write(buffer.getbuffer())
+        return pointer
+
+    @staticmethod
+    def load(pointer: str):
+        """Loads a stored object."""
+        with open(pointer, 'rb') as fp:
+            return pickle.load(fp)
+
+    def record_project(self, project) -> None:
+        """Records a project and its jobs, all pending, and commits."""
+        now = datetime.now()
+        blob = pickle.dumps(project, protocol=pickle.HIGHEST_PROTOCOL)
+        with self.connection:
+            self.connection.execute("INSERT OR REPLACE INTO projects VALUES (?, ?, ?, ?, ?, ?)",
+                                    (project.id, project.name, RUNNING, now, now, blob))
+            self.connection.execute("DELETE FROM jobs WHERE project_id = ?", (project.id,))
+            self.connection.execute("DELETE FROM partials WHERE project_id = ?", (project.id,))
+            self.connection.executemany("INSERT INTO jobs VALUES (?, ?, ?, ?, ?, NULL, NULL)",
+                                        [(project.id, job.id, job.key, PENDING, now) for job in project.jobs])
+
+    def load_project(self, project_id: str):
+        """Returns the project as recorded, with all its jobs. Raises KeyError if it is not in the journal."""
+        row = self.connection.execute("SELECT project FROM projects WHERE id = ?", (project_id,)).fetchone()
+        if row is None:
+            raise KeyError(project_id)
+        return pickle.loads(row[0])
+
+    def set_project_state(self, project_id: str, state: str) -> None:
+        self.connection.execute("UPDATE projects SET state = ?, updated = ? WHERE id = ?",
+                                (state, datetime.now(), project_id))
+
+    def projects(self) -> list:
+        """Returns (id, name, state, created, updated) of the journaled projects, latest first."""
+        return self.connection.execute(
+            "SELECT id, name, state, created, updated FROM projects ORDER BY created DESC").fetchall()
+
+    def project_state(self, project_id: str) -> str:
+        """Returns the state of a project. Raises KeyError if it is not in the journal."""
+        row = self.connection.execute("SELECT state FROM projects WHERE id = ?", (project_id,)).fetchone()
+        if row is None:
+            raise KeyError(project_id)
+        return row[0]
+
+    def discard_stored(self, project_id: str) -> None:
+        """Deletes the project's stored results and partial states, keeping its project and job state rows."""
+        with self.connection:
+            self.connection.execute("UPDATE jobs SET result = NULL WHERE project_id = ?", (project_id,))
+            self.connection.execute("DELETE FROM partials WHERE project_id = ?", (project_id,))
+        shutil.rmtree(os.path.join(self.directory, project_id), ignore_errors=True)
+
+    def remove_project(self, project_id: str) -> None:
+        """Removes a project, its jobs and its stored objects from the journal."""
+        with self.connection:
+            for table, column in (('projects', 'id'), ('jobs', 'project_id'), ('partials', 'project_id')):
+                self.connection.execute("DELETE FROM {} WHERE {} = ?".format(table, column), (project_id,))
+        shutil.rmtree(os.path.join(self.directory, project_id), ignore_errors=True)
+
+    def job_states(self, project_id: str) -> dict:
+        """Returns the state of each of the project's jobs by job id."""
+        return dict(self.connection.execute("SELECT job_id, state FROM jobs WHERE project_id = ?", (project_id,)))
+
+    def succeeded(self, project_id: str, job_id: str, pointer: str) -> None:
+        """Records that a job succeeded, with the pointer to its stored Results. Without one, it stays pending."""
+        if pointer is None:
+            return
+        self.connection.execute("UPDATE jobs SET state = ?, updated = ?, result = ?, error = NULL "
+                                "WHERE project_id = ? AND job_id = ?",
+                                (SUCCEEDED, datetime.now(), pointer, project_id, job_id))
+
+    def failed(self, project_id: str, job_id: str, error: str) -> None:
+        """Records that a job failed."""
+        self.connection.execute("UPDATE jobs SET state = ?, updated = ?, error = ? WHERE project_id = ? AND job_id = ?",
+                                (FAILED, datetime.now(), error, project_id, job_id))
+
+    def results(self, project_id: str) -> list:
+        """Returns the pointers to the stored Results of the project's succeeded jobs."""
+        return [row[0] for row in self.connection.execute(
+            "SELECT result FROM jobs WHERE project_id = ? AND state = ? ORDER BY updated", (project_id, SUCCEEDED))]
+
+    def record_partial(self, project_id: str, pointer: str) -> None:
+        """Records the pointer to a stored partial state."""
+        self.connection.execute("INSERT INTO partials SELECT ?, COUNT(*), ? FROM partials WHERE project_id = ?",
+                                (project_id, pointer, project_id))
+
+    def partials(self, project_id: str) -> list:
+        """Returns the pointers to the project's stored partial states, in order."""
+        return [row[0] for row in self.connection.execute(
+            "SELECT pointer FROM partials WHERE project_id = ? ORDER BY seq", (project_id,))]
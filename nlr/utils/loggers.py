@@ -12,7 +12,7 @@
 # URL      : https://github.com/john-james-sf/nlr                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # Created  : Monday, November 8th 2021, 12:26:37 pm                                                                        #
-# Modified : Tuesday, November 9th 2021, 12:32:17 am                                                                       #
+# Modified : Sunday, October 18th 2026, 4:43:49 pm                                                                         #
 # Modifier : John James (john.james.sf@gmail.com)                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # License  : BSD 3-clause "New" or "Revised" License                                                                       #
@@ -21,18 +21,38 @@
 
 """Log Management Utilities."""
 import os
-from configparser import ConfigParser
+import io
+import glob
+import gzip
+import json
+import shutil
+import time
+import logging
+import logging.handlers
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import pandas as pd
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
+from nlr.utils.config import Config
 
 # ------------------------------------------------------------------------------------------------------------------------ #
+# Identifiers of the job and project executing in the current thread or task, stamped on log records by
+# JobContextFilter.
+_job_context = contextvars.ContextVar('job_context', default=(None, None))
+# ------------------------------------------------------------------------------------------------------------------------ #
 
 
 class LogFile:
 
     def __init__(self):
-        self._config = ConfigParser()
-        self._config.read(configfile)
-        self._logdir = self._config['LOGGING']['logdir']
+        self._config = Config()
+        self._logdir = self._config.read_config('LOGGING', 'logdir')
 
     def get_logfile(self, logger: str = 'root', level: str = 'debug') -> str:
         """Returns a log filename for the given logger and level."""
@@ -43,14 +63,263 @@ class LogFile:
         filepath = os.path.join(self._logdir, filename)
 
         # If logfile exists, nothing to do, just return the logfile path.
-        self._config.read(configfile)
-        if self._config['LOGGING'].get(key, None):
+        if self._config.read_section('LOGGING').get(key, None):
             return filepath
 
         # Otherwise, add the filename, create the directory if needed, and return the logfile path.
         else:
-            self._config['LOGGING'][key] = filepath
-            with open(configfile, 'w') as fp:
-                self._config.write(fp)
-            os.makedirs(filepath, exist_ok=True)
+            self._config.write_config('LOGGING', key, filepath)
+            os.makedirs(self._logdir, exist_ok=True)
             return filepath
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+class BatchQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that sends log records to the queue in batches rather than one at a time.
+
+    A batch, a list of prepared records, is sent when it reaches capacity, when it has waited the flush interval,
+    and when the handler is flushed or closed. The listener must therefore accept lists of records.
+
+    Arguments:
+        queue: A multiprocessing.Queue or Pipe connection with a put method.
+        capacity: Maximum number of records per batch.
+        interval: Maximum seconds a record waits in the batch before being sent.
+    """
+
+    def __init__(self, queue, capacity: int = 256, interval: float = 0.5) -> None:
+        super(BatchQueueHandler, self).__init__(queue)
+        self.capacity = capacity
+        self.interval = interval
+        self._batch = []
+        self._stopped = threading.Event()
+        self._flusher = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._batch.append(self.prepare(record))
+            if len(self._batch) >= self.capacity:
+                self.flush()
+            elif self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_periodically, name='BatchQueueHandlerFlusher', daemon=True)
+                self._flusher.start()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            if self._batch:
+                batch, self._batch = self._batch, []
+                self.enqueue(batch)
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        self._stopped.set()
+        self.flush()
+        super(BatchQueueHandler, self).close()
+
+    def _flush_periodically(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.flush()
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that buffers writes, flushing at most once per interval rather than after every record.
+
+    Arguments:
+        filename: The log file.
+        buffer_size: Size of the write buffer in bytes.
+        interval: Maximum seconds a record waits in the buffer before it is flushed.
+    """
+
+    def __init__(self, filename: str, buffer_size: int = 1 << 16, interval: float = 1.0, **kwargs) -> None:
+        self.buffer_size = buffer_size
+        self.interval = interval
+        self._last_flush = time.monotonic()
+        super(BufferedFileHandler, self).__init__(filename, **kwargs)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size, encoding=self.encoding)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if time.monotonic() - self._last_flush >= self.interval:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        super(BufferedFileHandler, self).flush()
+        self._last_flush = time.monotonic()
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+def set_job_context(job_id: str = None, project_id: str = None) -> None:
+    """Sets the job and project identifiers stamped on records logged by the current thread or task."""
+    _job_context.set((job_id, project_id))
+
+
+class JobContextFilter(logging.Filter):
+    """Adds job_id and project_id attributes to log records, unless the caller supplied them as extras."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        job_id, project_id = _job_context.get()
+        if not hasattr(record, 'job_id'):
+            record.job_id = job_id
+        if not hasattr(record, 'project_id'):
+            record.project_id = project_id
+        return True
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+class JsonFormatter(logging.Formatter):
+    """Formats log records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        d = {}
+        d['time'] = datetime.fromtimestamp(record.created).isoformat()
+        d['level'] = record.levelname
+        d['logger'] = record.name
+        d['process'] = record.process
+        d['process_name'] = record.processName
+        d['job_id'] = getattr(record, 'job_id', None)
+        d['project_id'] = getattr(record, 'project_id', None)
+        d['module'] = record.module
+        d['function'] = record.funcName
+        d['line'] = record.lineno
+        d['message'] = record.getMessage()
+        if record.exc_info:
+            d['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            d['exception'] = record.exc_text
+        return json.dumps(d, default=str)
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+class JsonLinesHandler(BufferedFileHandler):
+    """Structured log sink that writes JSON lines, rotating the file by size.
+
+    Rotated files are renamed with a timestamp, e.g. root_debug.20211113-101443-123456.jsonl, and compressed on a
+    background thread so the listener is not held up. Only the newest backup_count rotated files are kept.
+
+    Arguments:
+        filename: The log file.
+        max_bytes: Size at which the file is rotated. Zero disables rotation.
+        backup_count: Number of rotated files to keep. Zero keeps all.
+        compression: 'gzip', 'zstd' (requires the zstandard package) or None.
+    """
+
+    __suffixes = {'gzip': '.gz', 'zstd': '.zst', None: ''}
+
+    def __init__(self, filename: str, max_bytes: int = 64 << 20, backup_count: int = 50,
+                 compression: str = 'gzip', **kwargs) -> None:
+        if compression not in JsonLinesHandler.__suffixes:
+            raise ValueError("Unsupported compression {}.".format(compression))
+        if compression == 'zstd' and zstandard is None:
+            raise ImportError("zstd compression requires the zstandard package.")
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.compression = compression
+        self._compressor = ThreadPoolExecutor(max_workers=1) if compression else None
+        super(JsonLinesHandler, self).__init__(filename, **kwargs)
+        self.setFormatter(JsonFormatter())
+        self._size = os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            # JSON is ASCII-encoded, so characters written equal bytes written.
+            line = self.format(record) + self.terminator
+            self.stream.write(line)
+            self._size += len(line)
+            if self.max_bytes and self._size >= self.max_bytes:
+                self.rollover()
+            elif time.monotonic() - self._last_flush >= self.interval:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def rollover(self) -> None:
+        """Renames the current file with a timestamp, starts a new one and schedules compression of the old."""
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        root, ext = os.path.splitext(self.baseFilename)
+        rotated = "{}.{}{}".format(root, datetime.now().strftime("%Y%m%d-%H%M%S-%f"), ext)
+        os.replace(self.baseFilename, rotated)
+        self.stream = self._open()
+        self._size = 0
+        if self._compressor:
+            self._compressor.submit(self._compress, rotated)
+        else:
+            self._prune()
+
+    def close(self) -> None:
+        super(JsonLinesHandler, self).close()
+        if self._compressor:
+            self._compressor.shutdown(wait=True)
+
+    def _compress(self, filepath: str) -> None:
+        target = filepath + JsonLinesHandler.__suffixes[self.compression]
+        try:
+            with open(filepath, 'rb') as src:
+                if self.compression == 'gzip':
+                    with gzip.open(target, 'wb') as dst:
+                        shutil.copyfileobj(src, dst)
+                else:
+                    with open(target, 'wb') as dst:
+                        zstandard.ZstdCompressor().copy_stream(src, dst)
+            os.remove(filepath)
+            self._prune()
+        except Exception:
+            logging.getLogger(__name__).exception("Failed to compress rotated log {}.".format(filepath))
+
+    def _prune(self) -> None:
+        if not self.backup_count:
+            return
+        rotated = sorted(_rotated_logs(self.baseFilename))
+        for filepath in rotated[:-self.backup_count]:
+            os.remove(filepath)
+
+
+def _rotated_logs(filepath: str) -> list:
+    """Returns the rotated, possibly compressed, files of the log."""
+    root, ext = os.path.splitext(filepath)
+    pattern = glob.escape(root) + '.*' + ext
+    return glob.glob(pattern) + glob.glob(pattern + '.gz') + glob.glob(pattern + '.zst')
+
+
+def _open_log(filepath: str) -> io.TextIOBase:
+    if filepath.endswith('.gz'):
+        return gzip.open(filepath, 'rt')
+    if filepath.endswith('.zst'):
+        if zstandard is None:
+            raise ImportError("Reading {} requires the zstandard package.".format(filepath))
+        return io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(open(filepath, 'rb'), closefd=True))
+    return open(filepath, 'r')
+
+
+def read_jsonl_logs(filepath: str) -> pd.DataFrame:
+    """Loads a JSON lines log and its rotated files into a DataFrame sorted by time.
+
+    Arguments:
+        filepath: The current log file, e.g. the path passed to JsonLinesHandler.
+    """
+    filepaths = sorted(_rotated_logs(filepath))
+    if os.path.exists(filepath):
+        filepaths.append(filepath)
+    frames = []
+    for path in filepaths:
+        with _open_log(path) as fp:
+            frames.append(pd.read_json(fp, lines=True, dtype=False, convert_dates=['time']))
+    frames = [frame for frame in frames if len(frame)]
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True).sort_values('time', kind='stable', ignore_index=True)
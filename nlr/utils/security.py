@@ -12,7 +12,7 @@
 # URL      : https://github.com/john-james-sf/nlr                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # Created  : Tuesday, November 9th 2021, 1:15:01 pm                                                                        #
-# Modified : Saturday, November 13th 2021, 6:18:21 am                                                                      #
+# Modified : Sunday, October 18th 2026, 4:39:45 pm                                                                         #
 # Modifier : John James (john.james.sf@gmail.com)                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # License  : BSD 3-clause "New" or "Revised" License                                                                       #
@@ -20,10 +20,72 @@
 # ======================================================================================================================== #
 from getpass import getpass
 import logging
+import threading
+import time
 
-from nlr.utils.config import Config
+from nlr.utils.config import Config, add_listener
 # ------------------------------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------------------------------ #
+CREDENTIAL_TTL = 300    # Seconds autologin credentials are served from the cache before being re-read.
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+class CredentialCache:
+    """Per-process cache of autologin credentials keyed by resource name.
+
+    Arguments:
+        ttl: Seconds an entry is served before it expires.
+    """
+
+    def __init__(self, ttl: float = CREDENTIAL_TTL) -> None:
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> dict:
+        """Returns a copy of the cached credentials for the resource, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl:
+                self.hits += 1
+                return dict(entry[1])
+            self._entries.pop(name, None)
+            self.misses += 1
+            return None
+
+    def put(self, name: str, credentials: dict) -> None:
+        with self._lock:
+            self._entries[name] = (time.monotonic(), dict(credentials))
+
+    def invalidate(self, name: str = None) -> None:
+        """Removes the named resource from the cache, or all resources if name is None."""
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries), 'ttl': self.ttl}
+
+
+credential_cache = CredentialCache()
+
+
+def _invalidate_credentials(filepath: str, sections: set) -> None:
+    """Config write listener. Drops credentials whose section, or whose autologin state, changed."""
+    if 'AUTOLOGIN' in sections:
+        credential_cache.invalidate()
+    else:
+        for section in sections:
+            credential_cache.invalidate(section)
+
+
+add_listener(_invalidate_credentials)
 
 
 def auth(name: str):
@@ -32,6 +94,10 @@ def auth(name: str):
     Arguments:
         name: The name of the resource for which authorization is being requested.
     """
+    credentials = credential_cache.get(name)
+    if credentials is not None:
+        return credentials
+
     config = Config()
     autologin = Autologin()
 
@@ -41,9 +107,10 @@ def auth(name: str):
         credentials = config.read_section(name)
     except KeyError as e:
         logger.error("The resource {} does not exist.".format(name))
-        raise()
+        raise
 
     if auto_login:
+        credential_cache.put(name, credentials)
         return credentials
     else:
         user_prompt = "Please enter your user id for the {}: ".format(
@@ -82,7 +149,9 @@ class Autologin:
     def on(self, name) -> None:
         self._check_exists(name)
         self._config.write_config('AUTOLOGIN', name, 'True')
+        credential_cache.invalidate(name)
 
     def off(self, name) -> None:
         self._check_exists(name)
         self._config.write_config('AUTOLOGIN', name, 'False')
+        credential_cache.invalidate(name)
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \sharedarray.py                                                                                               #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 5:06:56 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 5:06:56 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Shared-memory transport of large NumPy arrays from pool workers.
+
+A worker returns an ArrayHandle in place of a large array. Pickling the handle sends only its descriptor, and the
+receiving process maps the same memory, so the array is not copied through the result pipe. Arrays are held in
+POSIX shared memory, or in memory-mapped .npy files if they are very large, on Windows, or where
+multiprocessing.shared_memory is unavailable (Python 3.7).
+
+Pickling a handle hands ownership of the memory to the receiving process, which registers it under the handle's
+project. release(project_id) frees the project's arrays; Project does so when closed or garbage collected.
+"""
+import os
+import logging
+import tempfile
+import threading
+from collections import defaultdict
+
+import numpy as np
+try:
+    from multiprocessing import shared_memory, resource_tracker
+except ImportError:
+    shared_memory = None
+# ------------------------------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Arrays of at least this many bytes are memory-mapped files rather than shared memory, which is backed by RAM.
+MMAP_THRESHOLD = 1 << 30
+# Directory under which memory-mapped arrays are written, one subdirectory per project.
+MMAP_DIRECTORY = os.path.join(tempfile.gettempdir(), 'nlr-arrays')
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Handles owned by this process, by project id.
+_owned = defaultdict(list)
+# Shared memory that could not be closed because views of it were in use, closed once they are released.
+_lingering = []
+_lock = threading.Lock()
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+def _use_mmap(nbytes: int) -> bool:
+    return shared_memory is None or os.name == 'nt' or nbytes >= MMAP_THRESHOLD
+
+
+class ArrayHandle:
+    """Picklable handle to a NumPy array in shared memory or a memory-mapped file.
+
+    Create handles with allocate or share rather than directly.
+
+    Arguments:
+        kind: 'shm' or 'mmap'.
+        name: The shared memory name or the file path.
+        shape: Shape of the array.
+        dtype: Data type of the array.
+        project_id: Identifier of the project that owns the array.
+    """
+
+    def __init__(self, kind: str, name: str, shape: tuple, dtype: str, project_id: str = None) -> None:
+        self.kind = kind
+        self.name = name
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype).str
+        self.project_id = project_id
+        self._shm = None
+        self._array = None
+
+    @property
+    def array(self) -> np.ndarray:
+        """The array, a view of the shared memory or file. No data is copied."""
+        return self._array
+
+    @property
+    def nbytes(self) -> int:
+        return int(np.prod(self.shape)) * np.dtype(self.dtype).itemsize
+
+    def __repr__(self) -> str:
+        return "ArrayHandle({}, {}, {}, {})".format(self.kind, self.name, self.shape, self.dtype)
+
+    def __getstate__(self) -> dict:
+        state = {k: self.__dict__[k] for k in ('kind', 'name', 'shape', 'dtype', 'project_id')}
+        # The receiving process takes ownership, so this process no longer tracks or maps the memory.
+        _disown(self)
+        if self._shm is not None:
+            resource_tracker.unregister(self._shm._name, 'shared_memory')
+        self._close()
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._shm = None
+        self._array = None
+        self._attach()
+        _own(self)
+
+    def _attach(self) -> None:
+        if self.kind == 'shm':
+            # Attaching registers the memory with this process's resource tracker.
+            self._shm = shared_memory.SharedMemory(name=self.name)
+            self._array = _view(self._shm, self.shape, self.dtype)
+        else:
+            self._array = np.load(self.name, mmap_mode='r+')
+
+    def _close(self) -> None:
+        self._array = None
+        if self._shm is not None:
+            _close(self._shm)
+
+    def release(self) -> None:
+        """Frees the memory or file. Views of the array remain valid until they are released."""
+        if self.kind == 'shm' and self._shm is not None:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+        elif self.kind == 'mmap':
+            try:
+                os.remove(self.name)
+            except OSError as e:
+                # Windows cannot remove a file that is still mapped.
+                logger.warning("Array file {} not removed. {}".format(self.name, e))
+        self._close()
+        self._shm = None
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+def _view(shm, shape: tuple, dtype) -> np.ndarray:
+    # The view holds an export of the shared memory's buffer, so the memory cannot be unmapped while it is in use.
+    count = int(np.prod(shape))
+    return np.frombuffer(shm.buf, dtype=dtype, count=count).reshape(shape)
+
+
+def _close(shm) -> None:
+    """Unmaps shared memory, or defers it until the views of the memory have been released."""
+    with _lock:
+        lingering = _lingering + [shm]
+        _lingering.clear()
+    for shm in lingering:
+        try:
+            shm.close()
+        except BufferError:
+            with _lock:
+                _lingering.append(shm)
+
+
+def _own(handle: ArrayHandle) -> None:
+    with _lock:
+        _owned[handle.project_id].append(handle)
+
+
+def _disown(handle: ArrayHandle) -> None:
+    with _lock:
+        handles = _owned.get(handle.project_id, [])
+        if handle in handles:
+            handles.remove(handle)
+
+
+def allocate(shape: tuple, dtype='float64', project_id: str = None) -> ArrayHandle:
+    """Allocates a shared array for a worker to fill in place, which avoids even the copy made by share.
+
+    Arguments:
+        shape: Shape of the array.
+        dtype: Data type of the array.
+        project_id: Identifier of the project that owns the array, e.g. the job's project_id.
+    """
+    nbytes = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+    if _use_mmap(nbytes):
+        directory = os.path.join(MMAP_DIRECTORY, str(project_id))
+        os.makedirs(directory, exist_ok=True)
+        fd, filepath = tempfile.mkstemp(suffix='.npy', dir=directory)
+        os.close(fd)
+        handle = ArrayHandle('mmap', filepath, shape, dtype, project_id)
+        handle._array = np.lib.format.open_memmap(filepath, mode='w+', dtype=dtype, shape=tuple(shape))
+    else:
+        shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        handle = ArrayHandle('shm', shm.name, shape, dtype, project_id)
+        handle._shm = shm
+        handle._array = _view(shm, shape, dtype)
+    _own(handle)
+    return handle
+
+
+def share(array: np.ndarray, project_id: str = None) -> ArrayHandle:
+    """Copies an array into shared memory and returns its handle.
+
+    Arguments:
+        array: The array.
+        project_id: Identifier of the project that owns the array, e.g. the job's project_id.
+    """
+    handle = allocate(array.shape, array.dtype, project_id)
+    handle.array[...] = array
+    return handle
+
+
+def owned(project_id: str) -> list:
+    """Returns the handles owned by this process for the project."""
+    with _lock:
+        return list(_owned.get(project_id, []))
+
+
+def release(project_id: str) -> int:
+    """Frees the project's shared arrays owned by this process, returning the number released."""
+    with _lock:
+        handles = _owned.pop(project_id, [])
+    for handle in handles:
+        handle.release()
+    # Other processes may own files in the project's directory, so it is only removed once empty.
+    try:
+        os.rmdir(os.path.join(MMAP_DIRECTORY, str(project_id)))
+    except OSError:
+        pass
+    if handles:
+        logger.debug("Released {} shared arrays of project {}.".format(len(handles), project_id))
+    return len(handles)
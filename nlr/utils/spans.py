@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \spans.py                                                                                                     #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 4:45:09 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 5:02:48 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Hierarchical span profiling.
+
+A span times a block of code: wall time, CPU time, bytes read and written, and the number of calls. Spans nest,
+and are aggregated by their path from the root span into a tree held by a SpanRecorder. Spans are opened with the
+span class, as a context manager or a decorator:
+
+    with span('extract_data'):
+        ...
+
+    @span('DBEngine.read')
+    def read(...):
+        ...
+
+A worker process records into its own SpanRecorder, rooted at the path of the span that was open when the job was
+submitted, and returns the exported tree with its results for the parent to merge.
+"""
+import os
+import time
+import functools
+import contextlib
+import contextvars
+import threading
+import pandas as pd
+
+from nlr.utils.system import Profiler
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Statistics aggregated per span path.
+SPAN_FIELDS = ['calls', 'wall_time', 'cpu_time', 'read_bytes', 'write_bytes']
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+class SpanRecorder:
+    """Aggregates spans into a tree keyed by span path, a tuple of span names from the root."""
+
+    def __init__(self) -> None:
+        self._nodes = {}
+        self._lock = threading.Lock()
+
+    def add(self, path: tuple, stats: tuple) -> None:
+        """Adds the statistics of one or more calls to the span at path."""
+        with self._lock:
+            node = self._nodes.get(path)
+            self._nodes[path] = list(stats) if node is None else [a + b for a, b in zip(node, stats)]
+
+    def export(self) -> dict:
+        """Returns the tree as a picklable dictionary mapping paths to statistics."""
+        with self._lock:
+            return {path: tuple(stats) for path, stats in self._nodes.items()}
+
+    def __getstate__(self) -> dict:
+        return {'nodes': self.export()}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__()
+        self.merge(state['nodes'])
+
+    def merge(self, spans: dict) -> None:
+        """Merges an exported tree, e.g. one returned by a worker process."""
+        for path, stats in spans.items():
+            self.add(path, stats)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._nodes = {}
+
+    def to_frame(self) -> pd.DataFrame:
+        """Returns the tree as a DataFrame, one row per node in depth-first order, names indented by depth."""
+        rows = []
+        for path, stats in sorted(self.export().items()):
+            row = {'path': '/'.join(path), 'depth': len(path) - 1,
+                   'name': '  ' * (len(path) - 1) + path[-1]}
+            row.update(zip(SPAN_FIELDS, stats))
+            rows.append(row)
+        return pd.DataFrame(rows, columns=['path', 'depth', 'name'] + SPAN_FIELDS)
+
+    def print(self) -> None:
+        df = self.to_frame().drop(columns=['path', 'depth'])
+        width = df['name'].str.len().max() if len(df) else 0
+        print(df.to_string(index=False, formatters={'name': lambda name: name.ljust(width)}))
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Recorder and span path of the current thread or task.
+_default_recorder = SpanRecorder()
+_recorder = contextvars.ContextVar('span_recorder', default=None)
+_path = contextvars.ContextVar('span_path', default=())
+# Profiler for the current process. Recreated after a fork, since it is bound to a process id.
+_profiler = None
+
+
+def _counters() -> tuple:
+    global _profiler
+    if _profiler is None or _profiler.profiler.pid != os.getpid():
+        _profiler = Profiler('spans')
+    read_bytes, write_bytes = _profiler.io_bytes()
+    return (time.perf_counter(), time.process_time(), read_bytes, write_bytes)
+
+
+def get_recorder() -> SpanRecorder:
+    """Returns the recorder to which spans in the current thread or task are added."""
+    return _recorder.get() or _default_recorder
+
+
+def current_path() -> tuple:
+    """Returns the path of the innermost open span."""
+    return _path.get()
+
+
+@contextlib.contextmanager
+def recording(recorder: SpanRecorder, parent: tuple = None):
+    """Records spans opened in the context into the recorder, optionally rooted under a parent path.
+
+    Arguments:
+        recorder: The recorder to which spans are added.
+        parent: Path under which spans are nested, e.g. the current_path() of the submitting process.
+    """
+    recorder_token = _recorder.set(recorder)
+    path_token = _path.set(tuple(parent) if parent is not None else _path.get())
+    try:
+        yield recorder
+    finally:
+        _path.reset(path_token)
+        _recorder.reset(recorder_token)
+
+
+class span:
+    """Times the enclosed block, or decorated function, as a child of the innermost open span.
+
+    Arguments:
+        name: The name of the span.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._token = None
+        self._start = None
+
+    def __enter__(self) -> 'span':
+        self._token = _path.set(_path.get() + (self.name,))
+        self._start = _counters()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        end = _counters()
+        path = _path.get()
+        _path.reset(self._token)
+        wall, cpu, read_bytes, write_bytes = (e - s for e, s in zip(end, self._start))
+        get_recorder().add(path, (1, wall, cpu, read_bytes, write_bytes))
+        return False
+
+    def __call__(self, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(self.name):
+                return func(*args, **kwargs)
+        return wrapper
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \stacks.py                                                                                                    #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 4:46:21 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 4:46:21 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Statistical stack sampling profiler.
+
+A StackSampler thread periodically captures the Python stacks of the threads it watches using
+sys._current_frames(), counting identical stacks. Counts are exported in collapsed-stack format, one
+'root;caller;callee count' line per distinct stack, which flamegraph.pl, speedscope and similar tools render as
+flame graphs.
+"""
+import os
+import sys
+import time
+import threading
+from collections import Counter
+# ------------------------------------------------------------------------------------------------------------------------ #
+STACK_INTERVAL = 0.01   # Default seconds between samples.
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+def _label(frame) -> str:
+    return "{}:{}".format(frame.f_globals.get('__name__', '?'), frame.f_code.co_name)
+
+
+class StackSampler:
+    """Samples the Python stacks of threads in the current process on a background thread.
+
+    The time spent sampling, during which the sampler holds the GIL, is tracked so that the overhead can be
+    checked against the elapsed time.
+
+    Arguments:
+        interval: Seconds between samples.
+        threads: Identifiers of the threads to sample. Defaults to every thread other than the sampler's own.
+    """
+
+    def __init__(self, interval: float = STACK_INTERVAL, threads: list = None) -> None:
+        self.interval = interval
+        self.threads = set(threads) if threads else None
+        self.stacks = Counter()
+        self.n_samples = 0
+        self.sample_time = 0
+        self._start = None
+        self._end = None
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def sample(self) -> None:
+        start = time.perf_counter()
+        own = threading.get_ident()
+        for ident, frame in sys._current_frames().items():
+            if ident == own or (self.threads is not None and ident not in self.threads):
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(_label(frame))
+                frame = frame.f_back
+            self.stacks[';'.join(reversed(stack))] += 1
+        self.n_samples += 1
+        self.sample_time += time.perf_counter() - start
+
+    def _sample_periodically(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.sample()
+
+    def start(self) -> None:
+        self._start = time.perf_counter()
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._sample_periodically, name='StackSampler', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+        self._end = time.perf_counter()
+
+    def __enter__(self) -> 'StackSampler':
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        self.stop()
+        return False
+
+    @property
+    def overhead(self) -> float:
+        """Fraction of elapsed time spent sampling."""
+        end = self._end or time.perf_counter()
+        elapsed = end - self._start if self._start else 0
+        return self.sample_time / elapsed if elapsed else 0.0
+
+    def export(self) -> dict:
+        """Returns the stack counts as a picklable dictionary."""
+        return dict(self.stacks)
+
+
+def write_collapsed(stacks: dict, filepath: str) -> str:
+    """Writes stack counts in collapsed-stack format, heaviest stacks first, and returns the filepath."""
+    os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+    with open(filepath, 'w') as fp:
+        for stack, count in sorted(stacks.items(), key=lambda item: -item[1]):
+            fp.write("{} {}\n".format(stack, count))
+    return filepath
+
+
+def read_collapsed(filepath: str) -> Counter:
+    """Reads stack counts written by write_collapsed."""
+    stacks = Counter()
+    with open(filepath) as fp:
+        for line in fp:
+            stack, count = line.rstrip('\n').rsplit(' ', 1)
+            stacks[stack] += int(count)
+    return stacks
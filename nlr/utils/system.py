@@ -12,7 +12,7 @@
 # URL      : https://github.com/john-james-sf/nlr                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # Created  : Wednesday, November 10th 2021, 9:10:56 am                                                                     #
-# Modified : Wednesday, November 10th 2021, 11:19:29 am                                                                    #
+# Modified : Sunday, October 18th 2026, 6:02:45 pm                                                                         #
 # Modifier : John James (john.james.sf@gmail.com)                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # License  : BSD 3-clause "New" or "Revised" License                                                                       #
@@ -21,22 +21,66 @@
 # %%
 from pprint import pprint
 from datetime import datetime
+import os
+import threading
+import time
+import numpy as np
 import psutil
 import pandas as pd
+from typing import Iterable
 pd.options.display.max_columns = 100
 
 # ------------------------------------------------------------------------------------------------------------------------ #
-profile_template_filepath = "./nlr/utils/profiling.csv"
+profile_template_filepath = os.path.join(os.path.dirname(__file__), "profiling.csv")
+# Columns of the resource samples taken in sampling mode.
+SAMPLE_FIELDS = ['time', 'user', 'system', 'rss', 'read_count', 'write_count', 'read_bytes', 'write_bytes',
+                 'voluntary', 'involuntary']
+# Per-thread I/O character counts, where the platform provides them (Linux).
+THREAD_IO_FILEPATH = '/proc/thread-self/io'
+# ------------------------------------------------------------------------------------------------------------------------ #
+# The profile template is read once per process rather than once per job.
+_profile_template = None
+
+
+def _get_profile_template() -> pd.DataFrame:
+    global _profile_template
+    if _profile_template is None:
+        _profile_template = pd.read_csv(profile_template_filepath)
+    return _profile_template
 
 
 class Profiler:
-    """Captures process resource utilization statistics."""
+    """Captures process resource utilization statistics.
+
+    By default a single snapshot is taken at end(). In sampling mode, a background thread also samples CPU times,
+    RSS, I/O counters and context switches every interval seconds into a preallocated ring buffer, from which
+    peak, mean and rate statistics are computed.
+
+    The snapshot covers the profile template, including open files and connections, which take milliseconds to
+    list. Without it, only the CPU times, memory and I/O counters are taken, which costs little enough to profile
+    every job.
 
-    def __init__(self, jobname: str) -> None:
+    Arguments:
+        jobname: The name of the job being profiled.
+        interval: Seconds between samples. None disables sampling.
+        capacity: Number of samples retained. When full, the oldest samples are overwritten.
+        snapshot: If False, only the CPU times, memory and I/O counters are taken at end().
+    """
+
+    def __init__(self, jobname: str, interval: float = None, capacity: int = 4096, snapshot: bool = True) -> None:
         self.jobname = jobname
+        self.snapshot = snapshot
         self.profiler = psutil.Process()
-        self._profile_template = pd.read_csv(profile_template_filepath)
+        self.interval = interval
         self._stats = {}
+        self._selected = None
+        self._profile = None
+        self._samples = np.zeros((capacity, len(SAMPLE_FIELDS))) if interval else None
+        self._n_samples = 0
+        self._sampler = None
+        self._stopped = threading.Event()
+        self._counters_start = None
+        self._usage = None
 
     def extract_tuple(self) -> dict:
         d = {}
@@ -48,18 +92,30 @@ class Profiler:
         return d
 
     def extract_dict(self) -> dict:
-
-        d = self.profiler.as_dict(attrs=['name', 'pid', 'create_time', 'cpu_percent', 'num_threads', 'num_handles',
-                                         'memory_percent'])
+        # num_handles is only available on Windows.
+        attrs = ['name', 'pid', 'create_time', 'cpu_percent', 'num_threads', 'num_handles', 'memory_percent']
+        d = self.profiler.as_dict(attrs=[attr for attr in attrs if hasattr(self.profiler, attr)])
         d['num_open_files'] = len(self.profiler.open_files())
-        d['num_connections'] = len(self.profiler.connections())
+        # connections was renamed net_connections in psutil 6.
+        connections = getattr(self.profiler, 'net_connections', None) or self.profiler.connections
+        d['num_connections'] = len(connections())
         d['create_time_format'] = datetime.fromtimestamp(
             self.profiler.create_time()).strftime("%Y-%m-%d %H:%M:%S")
         d['job'] = self.jobname
         return d
 
+    def extract_counters(self) -> dict:
+        """Returns the process's CPU times, memory and I/O counters, without the rest of the snapshot."""
+        with self.profiler.oneshot():
+            cpu = self.profiler.cpu_times()
+            memory = self.profiler.memory_info()
+            io = self.profiler.io_counters()
+        return {'job': self.jobname, 'pid': self.profiler.pid, 'user': cpu.user, 'system': cpu.system,
+                'rss': memory.rss, 'vms': memory.vms, 'read_count': io.read_count, 'read_bytes': io.read_bytes,
+                'write_count': io.write_count, 'write_bytes': io.write_bytes}
+
     def select(self) -> dict:
-        stats = self._profile_template['stat'].values
+        stats = _get_profile_template()['stat'].values
         d = {}
         for stat in stats:
             d[stat] = self._stats[stat]
@@ -70,22 +126,183 @@ class Profiler:
         data['stat'] = d.keys()
         data['value'] = d.values()
         df = pd.DataFrame(data=data)
-        self.profile = self._profile_template.merge(
+        self._profile = _get_profile_template().merge(
             right=df, left_on='stat', right_on='stat', how='left')
 
+    @property
+    def profile(self) -> pd.DataFrame:
+        """The profile as a DataFrame, built on first access after end()."""
+        if self._profile is None and self._selected is not None:
+            self.format(self._selected)
+        return self._profile
+
+    @property
+    def stats(self) -> dict:
+        """The selected profile statistics, without the DataFrame."""
+        return self._selected
+
+    def io_bytes(self) -> tuple:
+        """Returns the (read, written) byte counts of the process so far.
+
+        Where the platform reports them (Linux), character counts are used, which include network and page cache
+        I/O, rather than storage-level byte counts.
+        """
+        io = self.profiler.io_counters()
+        return (getattr(io, 'read_chars', io.read_bytes), getattr(io, 'write_chars', io.write_bytes))
+
+    def _counters(self) -> tuple:
+        """Returns the CPU seconds and the read and written byte counts of the job so far.
+
+        A job on the main thread of a process, as in a pool worker, is charged the process's counters. A job on
+        another thread, as an I/O-bound job is, shares its process with other jobs, so it is charged its own thread's
+        CPU time and, where the platform reports them, its thread's I/O character counts.
+        """
+        if threading.current_thread() is threading.main_thread():
+            cpu = self.profiler.cpu_times()
+            return (cpu.user + cpu.system,) + self.io_bytes()
+        try:
+            with open(THREAD_IO_FILEPATH) as f:
+                io = dict(line.split(': ') for line in f.read().splitlines())
+            return time.thread_time(), int(io['rchar']), int(io['wchar'])
+        except (OSError, KeyError, ValueError):
+            return (time.thread_time(),) + self.io_bytes()
+
+    def usage(self) -> dict:
+        """Returns the resources the job used between start() and end(), for cost accounting.
+
+        CPU seconds and bytes read and written are differences of the counters at start() and end(), so they are the
+        job's alone in a pool worker that runs many jobs. Peak RSS is the sampled peak, or the RSS at end() if the job
+        was not sampled, and is that of the process. A job on a thread other than the main thread shares the process's
+        memory with the jobs on the other threads, so none is charged to it and its peak RSS is None.
+        """
+        return self._usage
+
+    def sample(self) -> None:
+        """Records one resource sample in the ring buffer."""
+        with self.profiler.oneshot():
+            cpu = self.profiler.cpu_times()
+            rss = self.profiler.memory_info().rss
+            io = self.profiler.io_counters()
+            ctx = self.profiler.num_ctx_switches()
+        row = self._n_samples % len(self._samples)
+        self._samples[row] = (time.time(), cpu.user, cpu.system, rss, io.read_count, io.write_count,
+                              io.read_bytes, io.write_bytes, ctx.voluntary, ctx.involuntary)
+        self._n_samples += 1
+
+    def _sample_periodically(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.sample()
+
+    def _ordered_samples(self) -> np.ndarray:
+        """Returns the retained samples, oldest first."""
+        capacity = len(self._samples)
+        if self._n_samples <= capacity:
+            return self._samples[:self._n_samples]
+        row = self._n_samples % capacity
+        return np.concatenate((self._samples[row:], self._samples[:row]))
+
+    @property
+    def samples(self) -> pd.DataFrame:
+        """The retained samples as a DataFrame, built on demand."""
+        if self._samples is None:
+            return None
+        df = pd.DataFrame(self._ordered_samples(), columns=SAMPLE_FIELDS)
+        df['time'] = pd.to_datetime(df['time'], unit='s')
+        return df
+
+    def summary(self) -> dict:
+        """Returns peak, mean and rate statistics computed from the samples."""
+        samples = self._ordered_samples() if self._samples is not None else None
+        if samples is None or len(samples) < 2:
+            return {}
+        col = {field: samples[:, i] for i, field in enumerate(SAMPLE_FIELDS)}
+        elapsed = np.diff(col['time'])
+        elapsed[elapsed <= 0] = np.nan
+        cpu_percent = 100 * np.diff(col['user'] + col['system']) / elapsed
+        duration = col['time'][-1] - col['time'][0]
+
+        def rate(field):
+            return (col[field][-1] - col[field][0]) / duration if duration > 0 else np.nan
+
+        d = {}
+        d['job'] = self.jobname
+        d['n_samples'] = len(samples)
+        d['duration'] = float(duration)
+        d['peak_rss'] = float(col['rss'].max())
+        d['mean_rss'] = float(col['rss'].mean())
+        d['peak_cpu_percent'] = float(np.nanmax(cpu_percent))
+        d['mean_cpu_percent'] = float(100 * ((col['user'][-1] + col['system'][-1]) -
+                                             (col['user'][0] + col['system'][0])) / duration) if duration > 0 else np.nan
+        d['read_bytes_per_sec'] = float(rate('read_bytes'))
+        d['write_bytes_per_sec'] = float(rate('write_bytes'))
+        d['read_count_per_sec'] = float(rate('read_count'))
+        d['write_count_per_sec'] = float(rate('write_count'))
+        d['ctx_switches_per_sec'] = float(rate('voluntary') + rate('involuntary'))
+        return d
+
     def start(self) -> None:
         self._stats['start_time'] = datetime.now()
+        self._counters_start = self._counters()
+        if self.interval:
+            self.sample()
+            self._stopped.clear()
+            self._sampler = threading.Thread(target=self._sample_periodically, name='ProfilerSampler',
+                                             daemon=True)
+            self._sampler.start()
 
     def end(self) -> None:
+        if self._sampler is not None:
+            self._stopped.set()
+            self._sampler.join()
+            self._sampler = None
+            self.sample()
         self._stats['end_time'] = datetime.now()
         self._stats['wall_time'] = self._stats['end_time'] -\
             self._stats['start_time']
-        d = self.extract_dict()
-        self._stats.update(d)
-        d = self.extract_tuple()
-        self._stats.update(d)
-        d = self.select()
-        self.format(d)
+        cpu_seconds, read_bytes, write_bytes = (
+            end - start for end, start in zip(self._counters(), self._counters_start))
+        if self.snapshot:
+            self._stats.update(self.extract_dict())
+            self._stats.update(self.extract_tuple())
+            self._selected = self.select()
+        else:
+            self._stats.update(self.extract_counters())
+            self._selected = dict(self._stats)
+        self._profile = None
+        peak_rss = None
+        if threading.current_thread() is threading.main_thread():
+            peak_rss = self.summary().get('peak_rss', self._stats.get('rss'))
+        self._usage = {'cpu_seconds': float(cpu_seconds),
+                       'peak_rss': peak_rss,
+                       'read_bytes': int(read_bytes),
+                       'write_bytes': int(write_bytes)}
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+def utilization() -> dict:
+    """Samples system-wide utilization since the previous call.
+
+    Returns the CPU and iowait percentages, iowait being zero where the platform does not report it, the percentage
+    of memory in use and the bytes of memory available.
+    """
+    times = psutil.cpu_times_percent(interval=None)
+    memory = psutil.virtual_memory()
+    return {'cpu': 100.0 - times.idle - getattr(times, 'iowait', 0.0),
+            'iowait': getattr(times, 'iowait', 0.0),
+            'memory': memory.percent,
+            'available': memory.available}
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+def processes_rss(pids: Iterable) -> int:
+    """Returns the resident memory in bytes of the processes with the given ids, such as pool workers."""
+    rss = 0
+    for pid in pids:
+        try:
+            rss += psutil.Process(pid).memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return rss
 
 
 if __name__ == '__main__':
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \test_batch_handler.py                                                                                        #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 4:42:43 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 5:37:41 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+import os
+import queue
+import shutil
+import tempfile
+import logging
+import inspect
+
+from nlr.utils.loggers import BatchQueueHandler, BufferedFileHandler
+# ------------------------------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _record(i: int) -> logging.LogRecord:
+    return logging.LogRecord('batch', logging.INFO, __file__, 0, 'Record %d', (i,), None)
+
+
+class BatchHandlerTests:
+
+    def test_flush_on_capacity(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        q = queue.Queue()
+        h = BatchQueueHandler(q, capacity=10, interval=60)
+        for i in range(25):
+            h.handle(_record(i))
+        assert q.qsize() == 2, "Failure in {}".format(inspect.stack()[0][3])
+        h.close()
+        batches = [q.get() for _ in range(q.qsize())]
+        assert [len(b) for b in batches] == [10, 10, 5], "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert batches[2][-1].getMessage() == 'Record 24', "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_flush_on_interval(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        q = queue.Queue()
+        h = BatchQueueHandler(q, capacity=100, interval=0.05)
+        h.handle(_record(0))
+        assert len(q.get(timeout=1)) == 1, "Failure in {}".format(inspect.stack()[0][3])
+        h.close()
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_buffered_file_handler(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        directory = tempfile.mkdtemp()
+        try:
+            filepath = os.path.join(directory, 'buffered.log')
+            h = BufferedFileHandler(filepath, interval=60)
+            for i in range(100):
+                h.handle(_record(i))
+            assert os.path.getsize(filepath) == 0, "Failure in {}".format(inspect.stack()[0][3])
+            h.close()
+            with open(filepath) as fp:
+                assert len(fp.readlines()) == 100, "Failure in {}".format(inspect.stack()[0][3])
+        finally:
+            shutil.rmtree(directory)
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+
+def test_batch_handler():
+    logger.info(" Started Batch Handler Tests")
+    t = BatchHandlerTests()
+    t.test_flush_on_capacity()
+    t.test_flush_on_interval()
+    t.test_buffered_file_handler()
+    logger.info(" Completed Batch Handler Tests. Success!")
+
+
+if __name__ == "__main__":
+    test_batch_handler()
+    # %%
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \test_jsonl_handler.py                                                                                        #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 4:43:43 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 4:43:43 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+import os
+import glob
+import shutil
+import tempfile
+import logging
+import inspect
+
+from nlr.utils.loggers import JsonLinesHandler, JobContextFilter, set_job_context, read_jsonl_logs
+# ------------------------------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class JsonLinesHandlerTests:
+
+    def __init__(self):
+        self.directory = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.directory, 'root_debug.jsonl')
+
+    def teardown(self):
+        shutil.rmtree(self.directory)
+
+    def test_rotation(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        h = JsonLinesHandler(self.filepath, max_bytes=4096, backup_count=0)
+        h.addFilter(JobContextFilter())
+        log = logging.getLogger('jsonl')
+        log.propagate = False
+        log.addHandler(h)
+        log.setLevel(logging.INFO)
+
+        set_job_context('job-1', 'project-1')
+        for i in range(200):
+            log.info("Record %d", i)
+        set_job_context()
+        log.removeHandler(h)
+        h.close()
+
+        assert glob.glob(os.path.join(self.directory, 'root_debug.*.jsonl.gz')), "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert not glob.glob(os.path.join(self.directory, 'root_debug.*.jsonl')), "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_read_jsonl_logs(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        df = read_jsonl_logs(self.filepath)
+        assert len(df) == 200, "Failure in {}".format(inspect.stack()[0][3])
+        assert list(df['message'][:2]) == ['Record 0', 'Record 1'], "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert (df['job_id'] == 'job-1').all() and (df['project_id'] == 'project-1').all(), "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert (df['process'] == os.getpid()).all(), "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+
+def test_jsonl_handler():
+    logger.info(" Started JSON Lines Handler Tests")
+    t = JsonLinesHandlerTests()
+    try:
+        t.test_rotation()
+        t.test_read_jsonl_logs()
+    finally:
+        t.teardown()
+    logger.info(" Completed JSON Lines Handler Tests. Success!")
+
+
+if __name__ == "__main__":
+    test_jsonl_handler()
+    # %%
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \test_admission.py                                                                                            #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 5:12:26 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 6:02:46 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+import logging
+import inspect
+import time
+import multiprocessing as mp
+import pandas as pd
+import psutil
+
+from nlr.data.base import Job
+from nlr.process.admission import MemoryBudget, MemoryAdmission
+from nlr.process.dispatch import Dispatcher
+from nlr.process.schedule import CostModel
+# ------------------------------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class BuildJob(Job):
+    def __init__(self, params: dict, memory: int = None) -> None:
+        super(BuildJob, self).__init__(params)
+        self.memory = memory
+
+    def run(self) -> None:
+        pass
+
+
+class EchoWorker:
+    def __init__(self, job: Job) -> None:
+        self.job = job
+
+    def run(self) -> int:
+        return self.job.params['n']
+
+
+class SleepWorker:
+    def __init__(self, job: Job) -> None:
+        self.job = job
+
+    def run(self) -> int:
+        time.sleep(self.job.params['seconds'])
+        return self.job.params['n']
+
+
+class CountingPool:
+    """Wraps a pool, recording the largest number of chunks in flight."""
+
+    def __init__(self, pool) -> None:
+        self.pool = pool
+        self.inflight = 0
+        self.max_inflight = 0
+
+    def apply_async(self, func, args, callback, error_callback):
+        self.inflight += 1
+        self.max_inflight = max(self.max_inflight, self.inflight)
+
+        def done(outcomes):
+            self.inflight -= 1
+            callback(outcomes)
+
+        return self.pool.apply_async(func, args=args, callback=done, error_callback=error_callback)
+
+
+class AdmissionTests:
+
+    def test_estimates(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        history = pd.DataFrame({'job_key': ['BuildJob:books', 'BuildJob:books', 'BuildJob:music'],
+                                'size': [100, 100, 200],
+                                'peak_rss': [1000, 3000, 4000]})
+        model = CostModel(history, metric='peak_rss')
+        budget = MemoryAdmission(10000, model, default=50, measure=lambda: 0)
+        # History of the job's key, then its size at the median bytes per unit of size, then the default.
+        assert budget.estimate(BuildJob({'category': 'books'})) == 2000, "Failure in {}".format(inspect.stack()[0][3])
+        assert budget.estimate(BuildJob({'category': 'toys', 'size': 50})) == 1000, "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert budget.estimate(BuildJob({'category': 'toys'})) == 50, "Failure in {}".format(inspect.stack()[0][3])
+        # A declared estimate takes precedence.
+        assert budget.estimate(BuildJob({'category': 'books'}, memory=7)) == 7, "Failure in {}".format(
+            inspect.stack()[0][3])
+        # A chunk's jobs run one at a time, so it needs the memory of its largest job.
+        chunk = [BuildJob({'category': 'books'}), BuildJob({'category': 'music'})]
+        assert budget.chunk_estimate(chunk) == 4000, "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_admit(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        rss = {'bytes': 0}
+        budget = MemoryAdmission(1000, measure=lambda: rss['bytes'], interval=0)
+        chunks = [[BuildJob({'n': i}, memory=400)] for i in range(3)]
+        assert budget.admit(chunks[0], idle=True), "Failure in {}".format(inspect.stack()[0][3])
+        assert budget.admit(chunks[1]), "Failure in {}".format(inspect.stack()[0][3])
+        assert not budget.admit(chunks[2]), "Failure in {}".format(inspect.stack()[0][3])
+        budget.release(chunks[0])
+        assert budget.reserved == 400, "Failure in {}".format(inspect.stack()[0][3])
+        # Workers using more memory than estimated hold back admissions.
+        rss['bytes'] = 900
+        assert not budget.admit(chunks[2]), "Failure in {}".format(inspect.stack()[0][3])
+        rss['bytes'] = 300
+        assert budget.admit(chunks[2]), "Failure in {}".format(inspect.stack()[0][3])
+        # A job larger than the budget still runs when nothing else is in flight.
+        budget.release(chunks[1])
+        budget.release(chunks[2])
+        assert budget.admit([BuildJob({'n': 3}, memory=5000)], idle=True), "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert budget.throttled == 2 and budget.peak == 900, "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_dispatch(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        # A budget with room for two of the large jobs keeps at most two chunks of them in flight.
+        budget = MemoryAdmission(2 * 2**30, measure=lambda: 0)
+        jobs = [BuildJob({'n': i}, memory=2**30) for i in range(12)]
+        with mp.Pool(processes=4) as pool:
+            counting = CountingPool(pool)
+            dispatcher = Dispatcher(counting, EchoWorker, processes=4, chunksize=1, admission=budget)
+            results, failures = dispatcher.run(jobs)
+        assert sorted(results) == list(range(12)) and not failures, "Failure in {}".format(inspect.stack()[0][3])
+        assert counting.max_inflight == 2 and budget.reserved == 0, "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_shared(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        # Projects sharing a budget are admitted against the memory in use by all of them.
+        shared = MemoryBudget(1000)
+        rss = {'bytes': 0}
+        first = MemoryAdmission(shared, measure=lambda: rss['bytes'], interval=0)
+        second = MemoryAdmission(shared, measure=lambda: 0, interval=0)
+        chunks = [[BuildJob({'n': i}, memory=400)] for i in range(4)]
+        assert first.admit(chunks[0], idle=True) and first.admit(chunks[1]), "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert not second.admit(chunks[2]), "Failure in {}".format(inspect.stack()[0][3])
+        # A project with nothing in flight still runs a chunk.
+        assert second.admit(chunks[2], idle=True), "Failure in {}".format(inspect.stack()[0][3])
+        first.release(chunks[0])
+        first.release(chunks[1])
+        # The first project's workers measured above its estimates hold back the second.
+        rss['bytes'] = 700
+        first.admit(chunks[0], idle=True)
+        assert not second.admit(chunks[3]), "Failure in {}".format(inspect.stack()[0][3])
+        # Once the first project completes, it no longer counts against the budget.
+        first.release(chunks[0])
+        first.close()
+        assert second.admit(chunks[3]), "Failure in {}".format(inspect.stack()[0][3])
+        assert shared.peak == 1100, "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_measured(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        # Without a measure, the dispatcher measures the workers running its chunks, and only while they run them.
+        budget = MemoryAdmission(2**40, interval=0)
+        jobs = [BuildJob({'n': i, 'seconds': 0.05}, memory=2**20) for i in range(8)]
+        with mp.Pool(processes=2) as pool:
+            dispatcher = Dispatcher(pool, SleepWorker, processes=2, chunksize=1, admission=budget)
+            results, failures = dispatcher.run(jobs)
+            workers = sum(psutil.Process(process.pid).memory_info().rss for process in pool._pool)
+        assert sorted(results) == list(range(8)) and not failures, "Failure in {}".format(inspect.stack()[0][3])
+        assert 0 < budget.peak <= 2 * workers, "Failure in {}".format(inspect.stack()[0][3])
+        assert budget.measure is None, "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+
+def test_admission():
+    logger.info(" Started Admission Tests")
+    t = AdmissionTests()
+    t.test_estimates()
+    t.test_admit()
+    t.test_dispatch()
+    t.test_shared()
+    t.test_measured()
+    logger.info(" Completed Admission Tests. Success!")
+
+
+if __name__ == "__main__":
+    test_admission()
+    # %%
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \test_broker.py                                                                                               #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 5:17:17 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 6:04:23 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+import os
+import shutil
+import tempfile
+import logging
+import inspect
+
+from nlr.data.base import Job
+from nlr.process.broker import BrokerPool, WorkerHost, JobBroker
+from nlr.process.dispatch import Dispatcher
+from nlr.utils.config import Config, configfile
+# ------------------------------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class SquareJob(Job):
+    def run(self) -> None:
+        pass
+
+
+class SquareWorker:
+    """Minimal worker. Kills its process the first time it sees a job with a marker file that does not exist."""
+
+    def __init__(self, job: Job) -> None:
+        self.job = job
+
+    def run(self) -> tuple:
+        marker = self.job.params.get('crash')
+        if marker and not os.path.exists(marker):
+            open(marker, 'w').close()
+            os._exit(1)
+        return self.job.params['n'] ** 2, os.getpid()
+
+
+class ConfigWorker:
+    """Returns the log directory, which the driver sends, and the datasource bucket, which the host configures."""
+
+    def __init__(self, job: Job) -> None:
+        self.job = job
+
+    def run(self) -> tuple:
+        config = Config()
+        return config.read_config('LOGGING', 'logdir'), config.read_config('DATASOURCE', 'bucketname')
+
+
+class BrokerTests:
+
+    def __init__(self):
+        self.directory = tempfile.mkdtemp()
+
+    def teardown(self):
+        shutil.rmtree(self.directory)
+
+    def test_reap(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        broker = JobBroker(timeout=0.0, max_attempts=2)
+        broker.submit('a', abs, (-1,))
+        broker.register('w1')
+        task = broker.lease('w1')
+        assert task == ('a', abs, (-1,)), "Failure in {}".format(inspect.stack()[0][3])
+        # The worker is lost, so its task is requeued for another worker.
+        assert broker.reap() == ['w1'] and not broker.heartbeat('w1'), "Failure in {}".format(inspect.stack()[0][3])
+        assert broker.lease('w2')[0] == 'a', "Failure in {}".format(inspect.stack()[0][3])
+        # Lost a second time, it fails.
+        broker.reap()
+        (task_id, ok, error), = broker.collect(0)
+        assert task_id == 'a' and not ok and isinstance(error, RuntimeError), "Failure in {}".format(
+            inspect.stack()[0][3])
+        # A late outcome of a task already settled is dropped.
+        broker.complete('w1', 'a', True, 1)
+        assert broker.collect(0) == [], "Failure in {}".format(inspect.stack()[0][3])
+        assert broker.stats()['reassigned'] == 1 and broker.stats()['failed'] == 1, "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_run(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        with BrokerPool(timeout=1.0) as pool:
+            host = WorkerHost(pool.address, pool.authkey, processes=3, heartbeat=0.2).start()
+            processes = pool.wait_for_workers(3, timeout=30)
+            dispatcher = Dispatcher(pool, SquareWorker, processes=processes, chunksize=2)
+            results, failures = dispatcher.run([SquareJob({'n': n}) for n in range(30)])
+        host.join(timeout=10)
+        assert processes == 3 and not failures, "Failure in {}".format(inspect.stack()[0][3])
+        assert sorted(square for square, _ in results) == [n * n for n in range(30)], "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert len({pid for _, pid in results}) > 1, "Failure in {}".format(inspect.stack()[0][3])
+        assert not any(worker.is_alive() for worker in host.workers), "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_reassign(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        # One job kills the first worker that runs it. Its chunk is reassigned once the worker's heartbeats stop.
+        jobs = [SquareJob({'n': n}) for n in range(12)]
+        jobs[5] = SquareJob({'n': 5, 'crash': os.path.join(self.directory, 'crashed')})
+        with BrokerPool(timeout=1.0) as pool:
+            host = WorkerHost(pool.address, pool.authkey, processes=3, heartbeat=0.2).start()
+            pool.wait_for_workers(3, timeout=30)
+            dispatcher = Dispatcher(pool, SquareWorker, processes=3, chunksize=1)
+            results, failures = dispatcher.run(jobs)
+            stats = pool.stats()
+        host.join(timeout=10)
+        assert not failures and sorted(square for square, _ in results) == [n * n for n in range(12)], \
+            "Failure in {}".format(inspect.stack()[0][3])
+        assert stats['reassigned'] == 1 and stats['workers'] == 2, "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_configure(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        # Workers receive only the sections they read, not credentials.
+        cwd = os.getcwd()
+        os.chdir(self.directory)
+        try:
+            os.makedirs(os.path.dirname(configfile))
+            Config().write_sections({'LOGGING': {'logdir': os.path.join(self.directory, 'logs')},
+                                     'MYSQL_SERVER': {'user': 'root', 'password': 'secret'}})
+            with BrokerPool(timeout=1.0) as pool:
+                snapshot = pool.broker.register('w1')
+                # The worker host's own configuration has the sections the driver does not send, and a log directory
+                # of its own, in place of which it uses the driver's.
+                Config().write_sections({'LOGGING': {'logdir': 'host'}, 'DATASOURCE': {'bucketname': 'host-bucket'}})
+                host = WorkerHost(pool.address, pool.authkey, processes=1, heartbeat=0.2).start()
+                dispatcher = Dispatcher(pool, ConfigWorker, processes=1, chunksize=1)
+                results, failures = dispatcher.run([SquareJob({'n': 0})])
+            host.join(timeout=10)
+        finally:
+            os.chdir(cwd)
+        assert snapshot.sections() == ['LOGGING'] and snapshot.partial, "Failure in {}".format(inspect.stack()[0][3])
+        assert snapshot.logdir == os.path.join(self.directory, 'logs'), "Failure in {}".format(inspect.stack()[0][3])
+        assert not failures and results == [(snapshot.logdir, 'host-bucket')], "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+
+def test_broker():
+    logger.info(" Started Broker Tests")
+    t = BrokerTests()
+    try:
+        t.test_reap()
+        t.test_run()
+        t.test_reassign()
+        t.test_configure()
+    finally:
+        t.teardown()
+    logger.info(" Completed Broker Tests. Success!")
+
+
+if __name__ == "__main__":
+    test_broker()
+    # %%
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \test_concurrency.py                                                                                          #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 5:09:59 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 5:46:22 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+import logging
+import inspect
+import multiprocessing as mp
+
+from nlr.data.base import Job
+from nlr.process.concurrency import ConcurrencyPolicy, ConcurrencyController
+from nlr.process.dispatch import Dispatcher
+# ------------------------------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _usage(cpu: float = 50.0, iowait: float = 0.0, memory: float = 50.0) -> dict:
+    return {'cpu': cpu, 'iowait': iowait, 'memory': memory, 'available': 1 << 30}
+
+
+class EchoJob(Job):
+    def run(self) -> None:
+        pass
+
+
+class EchoWorker:
+    def __init__(self, job: Job) -> None:
+        self.job = job
+
+    def run(self) -> int:
+        return self.job.params
+
+
+class CountingPool:
+    """Wraps a pool, recording the largest number of chunks in flight."""
+
+    def __init__(self, pool) -> None:
+        self.pool = pool
+        self.inflight = 0
+        self.max_inflight = 0
+
+    def apply_async(self, func, args, callback, error_callback):
+        self.inflight += 1
+        self.max_inflight = max(self.max_inflight, self.inflight)
+
+        def done(outcomes):
+            self.inflight -= 1
+            callback(outcomes)
+
+        return self.pool.apply_async(func, args=args, callback=done, error_callback=error_callback)
+
+
+class ConcurrencyTests:
+
+    def test_controller(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        policy = ConcurrencyPolicy(min_workers=2, max_workers=6, initial_workers=4)
+        controller = ConcurrencyController(policy, processes=5, sample=_usage)
+        assert controller.workers == 4, "Failure in {}".format(inspect.stack()[0][3])
+        # CPUs underused: add workers, up to the pool size.
+        for _ in range(3):
+            controller.adjust(_usage(cpu=30.0))
+        assert controller.workers == 5, "Failure in {}".format(inspect.stack()[0][3])
+        # Near target, or waiting on the disks: hold.
+        assert controller.adjust(_usage(cpu=80.0)) == 5, "Failure in {}".format(inspect.stack()[0][3])
+        assert controller.adjust(_usage(cpu=30.0, iowait=40.0)) == 5, "Failure in {}".format(inspect.stack()[0][3])
+        # Oversubscribed or short of memory: remove workers, down to the minimum.
+        assert controller.adjust(_usage(cpu=99.0)) == 4, "Failure in {}".format(inspect.stack()[0][3])
+        for _ in range(3):
+            controller.adjust(_usage(cpu=30.0, memory=95.0))
+        assert controller.workers == 2, "Failure in {}".format(inspect.stack()[0][3])
+        assert len(controller.history) == 9, "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_dispatch(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        # A controller held at one worker keeps one chunk in flight.
+        policy = ConcurrencyPolicy(min_workers=1, max_workers=1, interval=0.01)
+        controller = ConcurrencyController(policy, processes=4, sample=lambda: _usage(cpu=99.0))
+        with mp.Pool(processes=4) as pool:
+            counting = CountingPool(pool)
+            dispatcher = Dispatcher(counting, EchoWorker, processes=4, chunksize=2, controller=controller)
+            results, failures = dispatcher.run([EchoJob(i) for i in range(20)])
+        assert sorted(results) == list(range(20)) and not failures, "Failure in {}".format(inspect.stack()[0][3])
+        assert counting.max_inflight == 1, "Failure in {}".format(inspect.stack()[0][3])
+
+        # A controller running every process of the pool, as it does from the start by default, keeps chunks
+        # prefetched beyond the workers.
+        policy = ConcurrencyPolicy(max_workers=2, interval=0.01)
+        assert policy.initial_workers == 2, "Failure in {}".format(inspect.stack()[0][3])
+        controller = ConcurrencyController(policy, processes=2, sample=lambda: _usage(cpu=80.0))
+        with mp.Pool(processes=2) as pool:
+            counting = CountingPool(pool)
+            dispatcher = Dispatcher(counting, EchoWorker, processes=2, chunksize=2, controller=controller)
+            results, failures = dispatcher.run([EchoJob(i) for i in range(20)])
+        assert sorted(results) == list(range(20)) and not failures, "Failure in {}".format(inspect.stack()[0][3])
+        assert counting.max_inflight == 4, "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+
+def test_concurrency():
+    logger.info(" Started Concurrency Tests")
+    t = ConcurrencyTests()
+    t.test_controller()
+    t.test_dispatch()
+    logger.info(" Completed Concurrency Tests. Success!")
+
+
+if __name__ == "__main__":
+    test_concurrency()
+    # %%
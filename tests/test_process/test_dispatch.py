@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \test_dispatch.py                                                                                             #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 4:50:12 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 6:02:46 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+import os
+import time
+import signal
+import logging
+import inspect
+import multiprocessing as mp
+
+from nlr.data.base import Job
+from nlr.process import dispatch
+from nlr.process.dispatch import Dispatcher, JobFailure
+from nlr.process.fairshare import FairPool
+# ------------------------------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class SquareJob(Job):
+    def run(self) -> None:
+        pass
+
+
+class SquareWorker:
+    """Minimal worker. Raises on negative numbers."""
+
+    def __init__(self, job: Job) -> None:
+        self.job = job
+
+    def run(self) -> int:
+        n = self.job.params['n']
+        if n < 0:
+            raise ValueError("Negative {}".format(n))
+        return n * n
+
+
+class KilledWorker(SquareWorker):
+    """Kills its own process on 13, as the kernel does a worker that runs out of memory."""
+
+    def run(self) -> int:
+        if self.job.params['n'] == 13:
+            os.kill(os.getpid(), signal.SIGKILL)
+        return super(KilledWorker, self).run()
+
+
+class WaitJob(Job):
+    execution = 'io'
+
+    def run(self) -> None:
+        pass
+
+
+class WhereWorker:
+    """Sleeps for I/O-bound jobs. Returns the process id it ran in."""
+
+    def __init__(self, job: Job) -> None:
+        self.job = job
+
+    def run(self) -> tuple:
+        if self.job.execution == 'io':
+            time.sleep(0.2)
+        return self.job.execution, os.getpid()
+
+
+class CountingPool:
+    """Wraps a pool, recording the largest number of chunks in flight."""
+
+    def __init__(self, pool) -> None:
+        self.pool = pool
+        self.inflight = 0
+        self.max_inflight = 0
+        self.chunks = 0
+
+    def apply_async(self, func, args, callback, error_callback):
+        self.inflight += 1
+        self.chunks += 1
+        self.max_inflight = max(self.max_inflight, self.inflight)
+
+        def done(outcomes):
+            self.inflight -= 1
+            callback(outcomes)
+
+        return self.pool.apply_async(func, args=args, callback=done, error_callback=error_callback)
+
+
+class DispatcherTests:
+
+    def test_results(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        jobs = [SquareJob({'n': n}) for n in range(-5, 95)]
+        with mp.Pool(processes=2) as pool:
+            counting = CountingPool(pool)
+            dispatcher = Dispatcher(counting, SquareWorker, processes=2, chunksize=7, max_inflight=3)
+            results, failures = dispatcher.run(jobs)
+
+        assert sorted(results) == [n * n for n in range(0, 95)], "Failure in {}".format(inspect.stack()[0][3])
+        assert len(failures) == 5, "Failure in {}".format(inspect.stack()[0][3])
+        assert all(isinstance(f, JobFailure) and 'ValueError' in f.error for f in failures), "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert {f.job_id for f in failures} == {job.id for job in jobs[:5]}, "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert counting.chunks == 15, "Failure in {}".format(inspect.stack()[0][3])
+        assert counting.max_inflight <= 3, "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_generator(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        completed = []
+        jobs = (SquareJob({'n': n}) for n in range(20))
+        with mp.Pool(processes=2) as pool:
+            dispatcher = Dispatcher(pool, SquareWorker, processes=2)
+            results, failures = dispatcher.run(jobs, on_result=completed.append)
+
+        assert sorted(completed) == sorted(results) == [n * n for n in range(20)], "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert not failures, "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_hybrid_generator(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        drawn, completed, ahead = [0], [0], [0]
+
+        def generate():
+            for n in range(80):
+                drawn[0] += 1
+                ahead[0] = max(ahead[0], drawn[0] - completed[0])
+                yield WaitJob({}) if n % 2 else SquareJob({'n': n})
+
+        def on_result(result):
+            completed[0] += 1
+
+        held = dispatch.MAX_HELD_JOBS
+        dispatch.MAX_HELD_JOBS = 8
+        try:
+            with mp.Pool(processes=2) as pool:
+                dispatcher = Dispatcher(pool, WhereWorker, processes=2, chunksize=2, max_inflight=2, io_concurrency=4)
+                results, failures = dispatcher.run(generate(), on_result=on_result, collect=False)
+        finally:
+            dispatch.MAX_HELD_JOBS = held
+
+        # Jobs were drawn from the generator only as the pool and the threads had capacity for them, and the fast
+        # pool drew at most 8 of the slow I/O-bound jobs ahead of the threads.
+        assert completed[0] == 80 and not failures, "Failure in {}".format(inspect.stack()[0][3])
+        assert ahead[0] <= 2 * 2 + 4 + 8 + 2, "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_hybrid(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        jobs = [WaitJob({}) for _ in range(40)] + [SquareJob({'n': n}) for n in range(10)]
+        with mp.Pool(processes=2) as pool:
+            dispatcher = Dispatcher(pool, WhereWorker, processes=2, io_concurrency=20)
+            start = time.perf_counter()
+            results, failures = dispatcher.run(jobs)
+            elapsed = time.perf_counter() - start
+
+        assert len(results) == 50 and not failures, "Failure in {}".format(inspect.stack()[0][3])
+        # I/O-bound jobs ran on threads in this process, 20 at a time, and the others on the pool.
+        assert all(pid == os.getpid() for execution, pid in results if execution == 'io'), "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert all(pid != os.getpid() for execution, pid in results if execution == 'cpu'), "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert elapsed < 2.0, "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_worker_lost(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        with mp.Pool(processes=2) as pool:
+            fair = FairPool(pool, processes=2)
+            for target in (pool, fair.share('project')):
+                jobs = [SquareJob({'n': n}) for n in range(20)]
+                dispatcher = Dispatcher(target, KilledWorker, processes=2, chunksize=2)
+                start = time.perf_counter()
+                results, failures = dispatcher.run(jobs)
+                elapsed = time.perf_counter() - start
+
+                # The chunk of the killed worker failed, rather than being awaited forever, and the others completed.
+                assert sorted(results) == [n * n for n in range(20) if n not in (12, 13)], "Failure in {}".format(
+                    inspect.stack()[0][3])
+                assert {f.job_id for f in failures} == {jobs[12].id, jobs[13].id}, "Failure in {}".format(
+                    inspect.stack()[0][3])
+                assert all('WorkerLost' in f.error for f in failures), "Failure in {}".format(inspect.stack()[0][3])
+                assert elapsed < 10, "Failure in {}".format(inspect.stack()[0][3])
+            # The lost task's process was returned to the shared pool.
+            assert fair.running == 0, "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+
+def test_dispatch():
+    logger.info(" Started Dispatcher Tests")
+    t = DispatcherTests()
+    t.test_results()
+    t.test_generator()
+    t.test_hybrid()
+    t.test_hybrid_generator()
+    t.test_worker_lost()
+    logger.info(" Completed Dispatcher Tests. Success!")
+
+
+if __name__ == "__main__":
+    test_dispatch()
+    # %%
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \test_fairshare.py                                                                                            #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 5:22:13 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 6:08:38 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+import time
+import logging
+import inspect
+import threading
+import multiprocessing as mp
+
+from nlr.data.base import Job
+from nlr.process.dispatch import Dispatcher, _Lane
+from nlr.process.fairshare import FairPool
+# ------------------------------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class ManualPool:
+    """Holds submitted tasks until the test completes them, one second apart."""
+
+    def __init__(self) -> None:
+        self.tasks = []
+        self.now = 0.0
+
+    def clock(self) -> float:
+        return self.now
+
+    def apply_async(self, func, args, callback, error_callback):
+        self.tasks.append((args[0], callback))
+
+    def complete(self) -> str:
+        """Completes the oldest running task and returns its label."""
+        self.now += 1.0
+        label, callback = self.tasks.pop(0)
+        callback(label)
+        return label
+
+
+class SleepJob(Job):
+    def run(self) -> None:
+        pass
+
+
+class SleepWorker:
+    def __init__(self, job: Job) -> None:
+        self.job = job
+
+    def run(self) -> float:
+        time.sleep(self.job.params['seconds'])
+        return time.monotonic()
+
+
+class FairShareTests:
+
+    def _run(self, shares: dict, completions: int) -> list:
+        """Submits each share's tasks up front to a pool of one process and returns the labels in order run."""
+        pool = ManualPool()
+        fair = FairPool(pool, processes=1, clock=pool.clock)
+        for name, (priority, weight, tasks) in shares.items():
+            share = fair.share(name, priority, weight)
+            for _ in range(tasks):
+                share.apply_async(None, args=(name,))
+        return [pool.complete() for _ in range(completions)]
+
+    def test_order(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        # Equal weights alternate. The batch project's first task was dispatched before the other share existed.
+        order = self._run({'batch': (0, 1.0, 10), 'adhoc': (0, 1.0, 3)}, 7)
+        assert order == ['batch', 'adhoc', 'batch', 'adhoc', 'batch', 'adhoc', 'batch'], "Failure in {}".format(
+            inspect.stack()[0][3])
+        # Weights of 3 to 1 give three tasks to one.
+        order = self._run({'batch': (0, 1.0, 10), 'adhoc': (0, 3.0, 10)}, 9)
+        assert order[1:].count('adhoc') == 6, "Failure in {}".format(inspect.stack()[0][3])
+        # Higher priority runs first.
+        order = self._run({'batch': (0, 1.0, 10), 'adhoc': (1, 1.0, 3)}, 5)
+        assert order == ['batch', 'adhoc', 'adhoc', 'adhoc', 'batch'], "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_latency(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        # A batch project with 4 seconds of work on 2 processes, and a short project submitted once it is running.
+        with mp.Pool(processes=2) as pool:
+            fair = FairPool(pool, processes=2)
+            batch = Dispatcher(fair.share('batch'), SleepWorker, processes=2, chunksize=1)
+            thread = threading.Thread(target=batch.run, args=([SleepJob({'seconds': 0.5}) for _ in range(16)],))
+            thread.start()
+            time.sleep(1.0)
+            submitted = time.monotonic()
+            adhoc = Dispatcher(fair.share('adhoc'), SleepWorker, processes=2, chunksize=1)
+            results, failures = adhoc.run([SleepJob({'seconds': 0.1}) for _ in range(2)])
+            elapsed = max(results) - submitted
+            thread.join()
+        assert not failures and elapsed < 2.0, "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_start(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        # A chunk queued in its share behind another project's task has not started, and cannot be a straggler.
+        pool = ManualPool()
+        fair = FairPool(pool, processes=1, clock=pool.clock)
+        fair.share('batch').apply_async(None, args=('batch',))
+        share = fair.share('adhoc')
+        lane = _Lane('adhoc', [[SleepJob({'seconds': 0})]],
+                     lambda lane, attempt: share.apply_async(None, args=('adhoc',)), limit=1)
+        lane.top_up()
+        attempt = next(iter(lane.attempts.values()))
+        assert attempt.started is not None and attempt.start() is None, "Failure in {}".format(inspect.stack()[0][3])
+        # It starts when the share hands it to the pool.
+        handed = time.monotonic()
+        pool.complete()
+        assert attempt.start() >= handed, "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+
+def test_fairshare():
+    logger.info(" Started Fair Share Tests")
+    t = FairShareTests()
+    t.test_order()
+    t.test_latency()
+    t.test_start()
+    logger.info(" Completed Fair Share Tests. Success!")
+
+
+if __name__ == "__main__":
+    test_fairshare()
+    # %%
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \test_plan.py                                                                                                 #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 5:29:43 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 5:30:45 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+import os
+import shutil
+import tempfile
+import logging
+import inspect
+from datetime import timedelta
+import numpy as np
+
+from nlr.data.base import Job, Worker, Manager, Project
+from nlr.utils.config import Config, configfile
+from nlr.utils.history import ProfileHistory, profile_record
+# ------------------------------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+MB = 2**20
+
+
+class DownloadJob(Job):
+    execution = 'io'
+
+    def run(self) -> None:
+        pass
+
+
+class BuildJob(Job):
+    def run(self) -> None:
+        pass
+
+
+class PlanWorker(Worker):
+    def _run(self) -> None:
+        return None
+
+
+class PlanProject(Project):
+    pass
+
+
+class PlanManager(Manager):
+
+    def _create_jobs(self, params: list) -> list:
+        return [DownloadJob(p) if 'download_size' in p else BuildJob(p) for p in params]
+
+
+def _record(history: ProfileHistory, job_key: str, size: float, wall_time: float, peak_rss: float,
+            write_bytes: float, net_bytes: float) -> None:
+    records = []
+    for i in range(3):
+        profile = {'job': job_key.split(':')[0], 'wall_time': timedelta(seconds=wall_time), 'rss': peak_rss}
+        usage = {'read_bytes': 0, 'write_bytes': write_bytes, 'net_bytes': net_bytes}
+        records.append(profile_record('earlier_{}'.format(i), 'PlanProject', '{}-{}'.format(job_key, i), profile,
+                                      job_key=job_key, size=size, usage=usage))
+    history.append(records)
+
+
+class PlanTests:
+
+    def __init__(self):
+        self.cwd = os.getcwd()
+        self.directory = tempfile.mkdtemp()
+        os.chdir(self.directory)
+        os.makedirs(os.path.dirname(configfile))
+        Config().write_sections({'LOGGING': {'logdir': os.path.join(self.directory, 'logs')}})
+        history = ProfileHistory()
+        _record(history, 'DownloadJob:ratings', 100 * MB, 20.0, 50 * MB, 100 * MB, 100 * MB)
+        _record(history, 'BuildJob:ratings', 1000, 10.0, 400 * MB, 10 * MB, 0)
+
+    def teardown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.directory)
+
+    def test_plan(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        params = [{'category': 'ratings', 'download_size': 100 * MB},
+                  {'category': 'reviews', 'download_size': 300 * MB}]
+        params += [{'category': 'ratings', 'n': 1000}] + [{'category': c, 'n': 2000} for c in ('a', 'b', 'c')]
+        project = PlanProject(params, PlanWorker)
+        manager = PlanManager(project)
+        plan = manager.create_jobs(plan=True)
+        jobs = plan.jobs.set_index('job_key')
+
+        # Jobs with history are estimated at its median, and others at their size times the median rate.
+        assert project.plan is plan and len(project.jobs) == 6, "Failure in {}".format(inspect.stack()[0][3])
+        assert jobs.loc['DownloadJob:ratings', 'duration'] == 20.0, "Failure in {}".format(inspect.stack()[0][3])
+        assert np.isclose(jobs.loc['DownloadJob:reviews', 'transfer_bytes'], 300 * MB), "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert np.isclose(jobs.loc['BuildJob:a', 'duration'], 20.0), "Failure in {}".format(inspect.stack()[0][3])
+        assert np.isclose(jobs.loc['BuildJob:a', 'peak_memory'], 800 * MB), "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        totals = plan.totals
+        assert totals['jobs'] == totals['estimated'] == 6, "Failure in {}".format(inspect.stack()[0][3])
+        assert np.isclose(totals['duration'], 20 + 60 + 10 + 3 * 20), "Failure in {}".format(inspect.stack()[0][3])
+        assert np.isclose(totals['transfer_bytes'], 400 * MB), "Failure in {}".format(inspect.stack()[0][3])
+        # Build jobs of 20, 20, 20 and 10 seconds take 70s on one process and 30s on two; the downloads take 60s on
+        # threads alongside.
+        assert np.isclose(plan.makespan(1), 70.0), "Failure in {}".format(inspect.stack()[0][3])
+        assert np.isclose(plan.makespan(2), 60.0), "Failure in {}".format(inspect.stack()[0][3])
+        assert np.isclose(plan.makespan(2, io_concurrency=1), 80.0), "Failure in {}".format(inspect.stack()[0][3])
+        assert np.isclose(plan.peak_memory(2), 1600 * MB), "Failure in {}".format(inspect.stack()[0][3])
+        assert list(plan.summary([1, 2, 4])['makespan']) == [70.0, 60.0, 60.0], "Failure in {}".format(
+            inspect.stack()[0][3])
+        # The project was not journaled, and the jobs can still be run.
+        assert manager._journal is None, "Failure in {}".format(inspect.stack()[0][3])
+        assert 'Plan for project PlanProject: 6 jobs' in plan.report(), "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_no_history(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        class NewProject(PlanProject):
+            pass
+
+        params = [{'category': 'ratings', 'download_size': 100 * MB}, {'category': 'ratings', 'n': 1000}]
+        project = NewProject(params, PlanWorker)
+        plan = PlanManager(project).create_jobs(plan=True)
+        jobs = plan.jobs.set_index('job_key')
+
+        # Without history, downloads are estimated from their datasource sizes, and durations are unknown.
+        assert jobs.loc['DownloadJob:ratings', 'transfer_bytes'] == 100 * MB, "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert jobs.loc['DownloadJob:ratings', 'disk_bytes'] == 100 * MB, "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert plan.totals['estimated'] == 0 and plan.makespan(4) == 0.0, "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+
+def test_plan():
+    logger.info(" Started Plan Tests")
+    t = PlanTests()
+    try:
+        t.test_plan()
+        t.test_no_history()
+    finally:
+        t.teardown()
+    logger.info(" Completed Plan Tests. Success!")
+
+
+if __name__ == "__main__":
+    test_plan()
+    # %%
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \test_reducers.py                                                                                             #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 4:51:56 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 5:00:38 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+import os
+import shutil
+import tempfile
+import logging
+import inspect
+import multiprocessing as mp
+
+from nlr.data.base import Job, Worker, Manager, Project, Reducer, TreeMerge
+from nlr.process.dispatch import Dispatcher
+# ------------------------------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class SumReducer(Reducer):
+    """Sums and counts the job results. Counts merges to check they are made inside the workers."""
+
+    def init(self) -> dict:
+        return {'sum': 0, 'count': 0, 'merges': 0}
+
+    def accumulate(self, state: dict, result: int) -> dict:
+        state['sum'] += result
+        state['count'] += 1
+        return state
+
+    def merge(self, left: dict, right: dict) -> dict:
+        return {'sum': left['sum'] + right['sum'], 'count': left['count'] + right['count'],
+                'merges': left['merges'] + right['merges'] + 1}
+
+
+class ListReducer(Reducer):
+
+    def init(self) -> list:
+        return []
+
+    def accumulate(self, state: list, result: int) -> list:
+        state.append(result)
+        return state
+
+    def merge(self, left: list, right: list) -> list:
+        return left + right
+
+
+class NumberJob(Job):
+    def run(self) -> None:
+        pass
+
+
+class NumberWorker(Worker):
+    def _run(self) -> int:
+        return self.job.params['n']
+
+
+class NumberProject(Project):
+    pass
+
+
+class NumberManager(Manager):
+
+    def _create_jobs(self, params: list) -> list:
+        return [NumberJob({'n': n}) for n in params]
+
+    def _create_reducer(self) -> Reducer:
+        return SumReducer()
+
+
+class ListManager(NumberManager):
+
+    def _create_reducer(self) -> Reducer:
+        return None
+
+
+class ReducerTests:
+
+    def __init__(self):
+        self.cwd = os.getcwd()
+        # No configuration here, so the managers log a warning rather than recording the job profiles.
+        self.directory = tempfile.mkdtemp()
+        os.chdir(self.directory)
+
+    def teardown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.directory)
+
+    def test_tree_merge(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        merge = TreeMerge(ListReducer())
+        for i in range(100):
+            merge.add([i])
+            # A binary counter holds one partial per set bit.
+            assert sum(p is not None for p in merge._levels) == bin(i + 1).count('1'), "Failure in {}".format(
+                inspect.stack()[0][3])
+        assert merge.result() == list(range(100)), "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_streaming(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        project = NumberProject(params=list(range(200)), worker=NumberWorker)
+        manager = NumberManager(project)
+        manager.create_jobs()
+        manager.begin_results()
+        with mp.Pool(processes=2) as pool:
+            dispatcher = Dispatcher(pool, NumberWorker, processes=2, chunksize=10, reducer=manager.reducer)
+            results, failures = dispatcher.run(project.jobs, on_result=manager.process_result,
+                                               on_partial=manager.process_partial, collect=False)
+        assert results == [] and failures == [], "Failure in {}".format(inspect.stack()[0][3])
+        # Held partials are bounded by the binary counter, not the number of chunks.
+        assert len(manager._partials._levels) <= 5, "Failure in {}".format(inspect.stack()[0][3])
+        manager.end_results()
+
+        assert project.results['sum'] == sum(range(200)), "Failure in {}".format(inspect.stack()[0][3])
+        assert project.results['count'] == 200, "Failure in {}".format(inspect.stack()[0][3])
+        assert project.first_job_start < project.last_job_end, "Failure in {}".format(inspect.stack()[0][3])
+        assert project.results['merges'] >= 19, "Failure in {}".format(inspect.stack()[0][3])
+        assert project.spans.export()[(project.name, 'NumberJob')][0] == 200, "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_process_results(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        # Results processed in the parent reduce the same way, and a manager without a reducer collects them.
+        for manager_class in (NumberManager, ListManager):
+            project = NumberProject(params=list(range(20)), worker=NumberWorker)
+            manager = manager_class(project)
+            manager.create_jobs()
+            manager.process_results([NumberWorker(job).run() for job in project.jobs])
+            if manager_class is NumberManager:
+                assert project.results['sum'] == sum(range(20)), "Failure in {}".format(inspect.stack()[0][3])
+            else:
+                assert [r.result for r in project.results] == list(range(20)), "Failure in {}".format(
+                    inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+
+def test_reducers():
+    logger.info(" Started Reducer Tests")
+    t = ReducerTests()
+    try:
+        t.test_tree_merge()
+        t.test_streaming()
+        t.test_process_results()
+    finally:
+        t.teardown()
+    logger.info(" Completed Reducer Tests. Success!")
+
+
+if __name__ == "__main__":
+    test_reducers()
+    # %%
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \test_schedule.py                                                                                             #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 5:00:16 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 6:06:47 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+import logging
+import inspect
+
+import pandas as pd
+
+from nlr.data.base import Job
+from nlr.process.schedule import CostModel, LPTScheduler, UNCALIBRATED_JOB_SECONDS
+# ------------------------------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class DownloadJob(Job):
+    def run(self) -> None:
+        pass
+
+
+def _history() -> pd.DataFrame:
+    # Books took 100s in past runs. Other sizes ran at 2 seconds per unit.
+    return pd.DataFrame({'job_key': ['DownloadJob:Books', 'DownloadJob:Books', 'DownloadJob:Music'],
+                         'size': [None, None, 5.0],
+                         'wall_time': [90.0, 110.0, 10.0]})
+
+
+class ScheduleTests:
+
+    def test_cost_model(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        model = CostModel(_history())
+        assert model.calibrated, "Failure in {}".format(inspect.stack()[0][3])
+        books = DownloadJob({'category': 'Books', 'download_size': 1})
+        movies = DownloadJob({'category': 'Movies', 'download_size': 20})
+        unknown = DownloadJob({'category': 'Unknown'})
+        assert books.key == 'DownloadJob:Books', "Failure in {}".format(inspect.stack()[0][3])
+        assert model.estimate(books) == 100.0, "Failure in {}".format(inspect.stack()[0][3])
+        assert model.estimate(movies) == 40.0, "Failure in {}".format(inspect.stack()[0][3])
+        assert model.estimate(unknown) is None, "Failure in {}".format(inspect.stack()[0][3])
+        assert model.costs([books, movies, unknown]) == [100.0, 40.0, 70.0], "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        # Without history, sizes give the relative costs.
+        model = CostModel()
+        assert not model.calibrated, "Failure in {}".format(inspect.stack()[0][3])
+        assert model.costs([books, movies, unknown]) == [1.0, 20.0, 10.5], "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_scheduler(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        # Many small jobs and one large job created last.
+        jobs = [DownloadJob({'n': 1}) for _ in range(40)] + [DownloadJob({'n': 20})]
+        scheduler = LPTScheduler(CostModel(), processes=4)
+        chunks = scheduler.chunks(jobs)
+        assert chunks[0] == [jobs[-1]], "Failure in {}".format(inspect.stack()[0][3])
+        assert sorted(job.id for chunk in chunks for job in chunk) == sorted(job.id for job in jobs), \
+            "Failure in {}".format(inspect.stack()[0][3])
+        # Total cost 60 on 4 processes: the large job on one, the small jobs spread over the others.
+        assert scheduler.makespan(chunks) == 20.0, "Failure in {}".format(inspect.stack()[0][3])
+        in_order = [[job] for job in jobs]
+        assert scheduler.makespan(in_order) == 30.0, "Failure in {}".format(inspect.stack()[0][3])
+        assert scheduler.predict_makespan(chunks) is None, "Failure in {}".format(inspect.stack()[0][3])
+
+        scheduler = LPTScheduler(CostModel(_history()), processes=2)
+        jobs = [DownloadJob({'category': 'Music', 'n': 5}), DownloadJob({'category': 'Books'})]
+        chunks = scheduler.chunks(jobs)
+        assert chunks[0] == [jobs[1]], "Failure in {}".format(inspect.stack()[0][3])
+        assert scheduler.predict_makespan(chunks) == 100.0, "Failure in {}".format(inspect.stack()[0][3])
+
+        # Without history, a shared pool's limit on a chunk's seconds limits its number of jobs instead.
+        jobs = [DownloadJob({}) for _ in range(40)]
+        chunks = LPTScheduler(CostModel(), processes=1).chunks(jobs)
+        assert [len(chunk) for chunk in chunks] == [10] * 4, "Failure in {}".format(inspect.stack()[0][3])
+        chunks = LPTScheduler(CostModel(), processes=1, max_chunk_cost=5 * UNCALIBRATED_JOB_SECONDS).chunks(jobs)
+        assert [len(chunk) for chunk in chunks] == [5] * 8, "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+
+def test_schedule():
+    logger.info(" Started Schedule Tests")
+    t = ScheduleTests()
+    t.test_cost_model()
+    t.test_scheduler()
+    logger.info(" Completed Schedule Tests. Success!")
+
+
+if __name__ == "__main__":
+    test_schedule()
+    # %%
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \test_service.py                                                                                              #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 5:02:24 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 5:02:24 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+import os
+import time
+import shutil
+import tempfile
+import logging
+import inspect
+
+from nlr.data.base import Job, Worker, Manager, Project
+from nlr.process.service import PoolService
+# ------------------------------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class SquareJob(Job):
+    def run(self) -> None:
+        pass
+
+
+class SquareWorker(Worker):
+    def _run(self) -> int:
+        if self.job.params['n'] < 0:
+            raise ValueError("Negative")
+        return self.job.params['n'] ** 2
+
+
+class SquareProject(Project):
+    pass
+
+
+class SquareManager(Manager):
+
+    def _create_jobs(self, params: list) -> list:
+        return [SquareJob({'n': n}) for n in params]
+
+    def _process_results(self, results: list) -> list:
+        return sorted(result.result for result in results)
+
+
+class PoolServiceTests:
+
+    def __init__(self):
+        self.cwd = os.getcwd()
+        # No configuration here, so the managers log a warning rather than recording the job profiles.
+        self.directory = tempfile.mkdtemp()
+        os.chdir(self.directory)
+        self.service = PoolService(processes=2, log=False)
+
+    def teardown(self):
+        self.service.stop()
+        os.chdir(self.cwd)
+        shutil.rmtree(self.directory)
+
+    def _project(self, params: list) -> Project:
+        project = SquareProject(params=params, worker=SquareWorker)
+        SquareManager(project).create_jobs()
+        return project
+
+    def test_submit(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        self.service.start()
+        pid = self.service.ping()
+        assert pid != os.getpid(), "Failure in {}".format(inspect.stack()[0][3])
+
+        for _ in range(2):
+            project = self.service.submit(self._project([-1] + list(range(10))))
+            assert project.results == [n * n for n in range(10)], "Failure in {}".format(inspect.stack()[0][3])
+            assert len(project.failures) == 1, "Failure in {}".format(inspect.stack()[0][3])
+        # The same service, and its warm pool, ran both projects.
+        assert self.service.ping() == pid, "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_warm(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        start = time.perf_counter()
+        self.service.submit(self._project([1]))
+        assert time.perf_counter() - start < 1.0, "Failure in {}".format(inspect.stack()[0][3])
+
+        self.service.stop()
+        assert not self.service.running, "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+
+def test_service():
+    logger.info(" Started Pool Service Tests")
+    t = PoolServiceTests()
+    try:
+        t.test_submit()
+        t.test_warm()
+    finally:
+        t.teardown()
+    logger.info(" Completed Pool Service Tests. Success!")
+
+
+if __name__ == "__main__":
+    test_service()
+    # %%
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \test_speculation.py                                                                                          #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 5:27:04 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 5:56:32 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+import os
+import time
+import logging
+import inspect
+import tempfile
+import multiprocessing as mp
+
+from nlr.data.base import Job
+from nlr.process.admission import MemoryAdmission, DEFAULT_JOB_MEMORY
+from nlr.process.dispatch import Dispatcher
+from nlr.utils.file import atomic_output
+# ------------------------------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class CopyJob(Job):
+    idempotent = True
+
+    def run(self) -> None:
+        pass
+
+
+class FetchJob(CopyJob):
+    execution = 'io'
+
+
+class StragglerWorker:
+    """Writes n to its output file. The first attempt of the straggler sleeps long, and later attempts briefly."""
+
+    def __init__(self, job: Job) -> None:
+        self.job = job
+
+    def run(self) -> int:
+        n, directory = self.job.params['n'], self.job.params['directory']
+        marker = os.path.join(directory, 'started_{}'.format(n))
+        first = not os.path.exists(marker)
+        open(marker, 'a').close()
+        time.sleep(4.0 if n == 0 and first else 0.1)
+        with atomic_output(os.path.join(directory, 'output_{}.txt'.format(n)), 'w') as fp:
+            fp.write(str(n))
+        return n
+
+
+class SpeculationTests:
+
+    def test_pool(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        with tempfile.TemporaryDirectory() as directory:
+            jobs = [CopyJob({'n': n, 'directory': directory}) for n in range(10)]
+            budget = MemoryAdmission(2**40, measure=lambda: 0)
+            with mp.Pool(processes=2) as pool:
+                dispatcher = Dispatcher(pool, StragglerWorker, processes=2, chunksize=1, speculation=2.0,
+                                        admission=budget)
+                start = time.perf_counter()
+                results, failures = dispatcher.run(jobs)
+                elapsed = time.perf_counter() - start
+                # The abandoned straggler runs on, and holds its reservation until its outcome arrives.
+                held = budget.reserved
+                deadline = time.monotonic() + 10
+                while budget.reserved and time.monotonic() < deadline:
+                    time.sleep(0.1)
+            outputs = [open(os.path.join(directory, 'output_{}.txt'.format(n))).read() for n in range(10)]
+
+        # The straggler's duplicate completed first, and its outcome was handed on once.
+        assert sorted(results) == list(range(10)) and not failures, "Failure in {}".format(inspect.stack()[0][3])
+        assert outputs == [str(n) for n in range(10)], "Failure in {}".format(inspect.stack()[0][3])
+        assert dispatcher.speculated == 1, "Failure in {}".format(inspect.stack()[0][3])
+        assert elapsed < 3.5, "Failure in {}".format(inspect.stack()[0][3])
+        assert held == DEFAULT_JOB_MEMORY and budget.reserved == 0, "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_threads(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        with tempfile.TemporaryDirectory() as directory:
+            jobs = [FetchJob({'n': n, 'directory': directory}) for n in range(10)]
+            dispatcher = Dispatcher(None, StragglerWorker, processes=2, io_concurrency=2, speculation=2.0)
+            start = time.perf_counter()
+            results, failures = dispatcher.run(jobs)
+            elapsed = time.perf_counter() - start
+
+        assert sorted(results) == list(range(10)) and not failures, "Failure in {}".format(inspect.stack()[0][3])
+        assert dispatcher.speculated == 1, "Failure in {}".format(inspect.stack()[0][3])
+        assert elapsed < 3.5, "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_not_idempotent(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        class OnceJob(FetchJob):
+            idempotent = False
+
+        with tempfile.TemporaryDirectory() as directory:
+            jobs = [OnceJob({'n': n, 'directory': directory}) for n in range(10)]
+            dispatcher = Dispatcher(None, StragglerWorker, processes=2, io_concurrency=2, speculation=2.0)
+            results, failures = dispatcher.run(jobs)
+
+        assert sorted(results) == list(range(10)) and not failures, "Failure in {}".format(inspect.stack()[0][3])
+        assert dispatcher.speculated == 0, "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_atomic_output(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, 'output.txt')
+            with atomic_output(filepath, 'w') as fp:
+                fp.write('first')
+            try:
+                with atomic_output(filepath, 'w') as fp:
+                    fp.write('partial')
+                    raise RuntimeError("Interrupted")
+            except RuntimeError:
+                pass
+            content = open(filepath).read()
+            leftovers = os.listdir(directory)
+
+        # The interrupted write left the previous file, and no temporary file.
+        assert content == 'first', "Failure in {}".format(inspect.stack()[0][3])
+        assert leftovers == ['output.txt'], "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+
+def test_speculation():
+    logger.info(" Started Speculation Tests")
+    t = SpeculationTests()
+    t.test_pool()
+    t.test_threads()
+    t.test_not_idempotent()
+    t.test_atomic_output()
+    logger.info(" Completed Speculation Tests. Success!")
+
+
+if __name__ == "__main__":
+    test_speculation()
+    # %%
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \test_credential_cache.py                                                                                     #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 4:39:40 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 4:39:40 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+import os
+import time
+import shutil
+import tempfile
+import logging
+import inspect
+
+from nlr.utils.config import Config, configfile
+from nlr.utils.security import auth, Autologin, CredentialCache, credential_cache
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class CredentialCacheTests:
+
+    def __init__(self):
+        # auth() reads the project configuration file, so run from a scratch project directory.
+        self.cwd = os.getcwd()
+        self.directory = tempfile.mkdtemp()
+        os.chdir(self.directory)
+        os.makedirs(os.path.dirname(configfile))
+        Config().write_sections({'AUTOLOGIN': {'MYSQL_SERVER': 'True'},
+                                 'MYSQL_SERVER': {'user': 'root', 'password': 'secret'}})
+        credential_cache.invalidate()
+
+    def teardown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.directory)
+        credential_cache.invalidate()
+
+    def test_ttl(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        cache = CredentialCache(ttl=0.05)
+        cache.put('MYSQL_SERVER', {'user': 'root'})
+        assert cache.get('MYSQL_SERVER') == {'user': 'root'}, "Failure in {}".format(
+            inspect.stack()[0][3])
+        time.sleep(0.1)
+        assert cache.get('MYSQL_SERVER') is None, "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1, "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_auth_hits(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        stats = credential_cache.stats()
+        for _ in range(10):
+            credentials = auth('MYSQL_SERVER')
+        assert credentials['password'] == 'secret', "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert credential_cache.stats()['misses'] - stats['misses'] == 1, "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert credential_cache.stats()['hits'] - stats['hits'] == 9, "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_invalidation(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        auth('MYSQL_SERVER')
+        Config().write_config('MYSQL_SERVER', 'password', 'changed')
+        assert auth('MYSQL_SERVER')['password'] == 'changed', "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        Autologin().off('MYSQL_SERVER')
+        assert credential_cache.stats()['size'] == 0, "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+
+def test_credential_cache():
+    logger.info(" Started Credential Cache Tests")
+    t = CredentialCacheTests()
+    try:
+        t.test_ttl()
+        t.test_auth_hits()
+        t.test_invalidation()
+    finally:
+        t.teardown()
+    logger.info(" Completed Credential Cache Tests. Success!")
+
+
+if __name__ == "__main__":
+    test_credential_cache()
+    # %%
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \test_accounting.py                                                                                           #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 5:14:52 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 5:50:30 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+import os
+import glob
+import shutil
+import tempfile
+import logging
+import inspect
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+
+from nlr.data.base import Job, Worker, Manager, Project, Results
+from nlr.utils.accounting import ResourceRates, CostLedger, GB
+from nlr.utils.config import Config, configfile
+# ------------------------------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _result(name: str, key: str, **usage) -> Results:
+    result = Results()
+    result.job_name = name
+    result.job_key = key
+    result.usage = usage
+    return result
+
+
+class FetchJob(Job):
+    def run(self) -> None:
+        pass
+
+
+class FetchWorker(Worker):
+    """Writes a file and reports the bytes it would have downloaded."""
+
+    def _run(self) -> None:
+        with open(self.job.params['filename'], 'wb') as fp:
+            fp.write(b'x' * self.job.params['size'])
+        self.net_bytes += self.job.params['size']
+
+
+class FetchProject(Project):
+    pass
+
+
+class FetchManager(Manager):
+
+    def _create_jobs(self, params: list) -> list:
+        return [FetchJob(p) for p in params]
+
+
+class AccountingTests:
+
+    def __init__(self):
+        self.cwd = os.getcwd()
+        self.directory = tempfile.mkdtemp()
+        os.chdir(self.directory)
+        os.makedirs(os.path.dirname(configfile))
+        Config().write_sections({'LOGGING': {'logdir': os.path.join(self.directory, 'logs')},
+                                 'COSTS': {'core_hour': '3.6', 'gb_transferred': '1.0'}})
+
+    def teardown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.directory)
+
+    def test_rates(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        rates = ResourceRates.from_config()
+        assert rates.core_hour == 3.6 and rates.gb_transferred == 1.0, "Failure in {}".format(inspect.stack()[0][3])
+        assert rates.gb_hour == ResourceRates().gb_hour, "Failure in {}".format(inspect.stack()[0][3])
+        rates = ResourceRates(core_hour=3.6, gb_hour=1.0, gb_read=0.0, gb_written=2.0, gb_transferred=1.0)
+        usage = {'cpu_seconds': 10.0, 'peak_rss': 2 * GB, 'wall_time': 1800.0, 'write_bytes': GB,
+                 'net_bytes': GB // 2}
+        # 0.001 per CPU second, 2GB for half an hour, 1GB written and half a GB transferred.
+        assert abs(rates.cost(usage) - (0.001 * 10 + 1.0 + 2.0 + 0.5)) < 1e-9, "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_ledger(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        ledger = CostLedger(ResourceRates(core_hour=3600.0, gb_hour=0.0, gb_transferred=0.0))
+        ledger.add(_result('ExtractJob', 'ExtractJob:books', cpu_seconds=1.0, peak_rss=100))
+        ledger.add(_result('ExtractJob', 'ExtractJob:books', cpu_seconds=2.0, peak_rss=300))
+        ledger.add(_result('ExtractJob', 'ExtractJob:music', cpu_seconds=5.0, peak_rss=200))
+        ledger.add(_result('CleanJob', 'CleanJob', cpu_seconds=0.5, peak_rss=50))
+        ledger.add(_result('CleanJob', 'CleanJob'))
+        assert ledger.jobs == 4 and ledger.cost == 8.5, "Failure in {}".format(inspect.stack()[0][3])
+        assert ledger.totals['peak_rss'] == 300, "Failure in {}".format(inspect.stack()[0][3])
+
+        summary = ledger.summary('run', 'project')
+        assert list(summary['category'].fillna('')) == ['music', 'books', ''], "Failure in {}".format(inspect.stack()[0][3])
+        books = summary[summary['category'] == 'books'].iloc[0]
+        assert books['jobs'] == 2 and books['cost'] == 3.0 and books['peak_rss'] == 300, "Failure in {}".format(
+            inspect.stack()[0][3])
+        filepath = CostLedger.save(summary)
+        assert pd.read_parquet(filepath)['cost'].sum() == 8.5, "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_project(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        params = [{'filename': os.path.join(self.directory, '{}.bin'.format(i)), 'size': 1 << 20} for i in range(3)]
+        project = FetchProject(params=params, worker=FetchWorker)
+        manager = FetchManager(project)
+        manager.create_jobs()
+        results = [FetchWorker(job).run() for job in project.jobs]
+        usage = results[0].usage
+        assert usage['net_bytes'] == 1 << 20 and usage['write_bytes'] >= 1 << 20, "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert usage['cpu_seconds'] >= 0 and usage['peak_rss'] > 0, "Failure in {}".format(inspect.stack()[0][3])
+        # A job on an I/O thread shares the process's memory with the other threads' jobs, so none is charged to it.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            threaded = executor.submit(FetchWorker(project.jobs[0]).run).result().usage
+        assert threaded['peak_rss'] is None and threaded['net_bytes'] == 1 << 20, "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert ResourceRates(gb_hour=1.0).cost(threaded) > 0, "Failure in {}".format(inspect.stack()[0][3])
+        manager.process_results(results)
+
+        assert project.usage['net_bytes'] == 3 << 20, "Failure in {}".format(inspect.stack()[0][3])
+        assert project.project_cost > 0 and project.project_duration is not None, "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert project.cost_summary['jobs'].sum() == 3, "Failure in {}".format(inspect.stack()[0][3])
+        assert glob.glob(os.path.join(self.directory, 'logs', 'costs', '*.parquet')), "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+
+def test_accounting():
+    logger.info(" Started Accounting Tests")
+    t = AccountingTests()
+    try:
+        t.test_rates()
+        t.test_ledger()
+        t.test_project()
+    finally:
+        t.teardown()
+    logger.info(" Completed Accounting Tests. Success!")
+
+
+if __name__ == "__main__":
+    test_accounting()
+    # %%
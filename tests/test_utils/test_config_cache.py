@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \test_config_cache.py                                                                                         #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 4:37:03 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 4:37:03 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+import os
+import time
+import shutil
+import tempfile
+import logging
+import inspect
+from configparser import ConfigParser
+
+import nlr.utils.config as config_module
+from nlr.utils.config import Config
+# ------------------------------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class ConfigCacheTests:
+
+    def __init__(self):
+        self.directory = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.directory, 'config.ini')
+        config = ConfigParser()
+        config['CACHE'] = {'option_0': 'value_0', 'option_1': 'value_1'}
+        with open(self.filepath, 'w') as fp:
+            config.write(fp)
+
+    def teardown(self):
+        shutil.rmtree(self.directory)
+
+    def test_parse_once(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        config = Config(self.filepath)
+        config.read_section('CACHE')
+        parsed = config_module._cache[self.filepath][1]
+        assert config.read_config('CACHE', 'option_0') == 'value_0', "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert config_module._cache[self.filepath][1] is parsed, "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_external_change(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        config = Config(self.filepath)
+        assert config.read_config('CACHE', 'option_1') == 'value_1', "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        # Modify the file behind the cache's back, as another process would.
+        time.sleep(0.01)
+        parser = ConfigParser()
+        parser.read(self.filepath)
+        parser['CACHE']['option_1'] = 'changed'
+        with open(self.filepath, 'w') as fp:
+            parser.write(fp)
+
+        assert config.read_config('CACHE', 'option_1') == 'changed', "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_write_through(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        config = Config(self.filepath)
+        config.write_config('CACHE', 'option_2', 'value_2')
+        assert Config(self.filepath).read_section('CACHE')['option_2'] == 'value_2', "Failure in {}".format(
+            inspect.stack()[0][3])
+        config.remove_option('CACHE', 'option_2')
+        assert 'option_2' not in config.read_section('CACHE'), "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+
+def test_config_cache():
+    logger.info(" Started Config Cache Tests")
+    t = ConfigCacheTests()
+    try:
+        t.test_parse_once()
+        t.test_external_change()
+        t.test_write_through()
+    finally:
+        t.teardown()
+    logger.info(" Completed Config Cache Tests. Success!")
+
+
+if __name__ == "__main__":
+    test_config_cache()
+    # %%
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \test_config_snapshot.py                                                                                      #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 4:38:54 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 4:38:54 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+import os
+import pickle
+import shutil
+import tempfile
+import logging
+import inspect
+import pytest
+
+from nlr.utils.config import Config, install_snapshot
+# ------------------------------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class ConfigSnapshotTests:
+
+    def __init__(self):
+        self.directory = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.directory, 'config.ini')
+        Config(self.filepath).write_sections({'LOGGING': {'logdir': 'logs'},
+                                              'AUTOLOGIN': {'MYSQL_SERVER': 'True'},
+                                              'MYSQL_SERVER': {'user': 'root', 'password': 'secret'}})
+
+    def teardown(self):
+        install_snapshot(None)
+        shutil.rmtree(self.directory)
+
+    def test_snapshot(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        snapshot = pickle.loads(pickle.dumps(Config(self.filepath).snapshot()))
+        assert snapshot.logdir == 'logs', "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert snapshot.autologin('MYSQL_SERVER'), "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert snapshot.credentials('MYSQL_SERVER')['user'] == 'root', "Failure in {}".format(
+            inspect.stack()[0][3])
+        with pytest.raises(AttributeError):
+            snapshot.filepath = 'other.ini'
+        with pytest.raises(TypeError):
+            snapshot.section('LOGGING')['logdir'] = 'other'
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_install_snapshot(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        config = Config(self.filepath)
+        install_snapshot(config.snapshot())
+
+        # Reads are served from the snapshot, even with the file gone.
+        shutil.move(self.filepath, self.filepath + '.bak')
+        assert config.read_section('MYSQL_SERVER')['password'] == 'secret', "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert config.exists('AUTOLOGIN'), "Failure in {}".format(
+            inspect.stack()[0][3])
+        shutil.move(self.filepath + '.bak', self.filepath)
+
+        # Writes go to the file and uninstall the snapshot.
+        config.write_config('LOGGING', 'logdir', 'other')
+        assert config.read_config('LOGGING', 'logdir') == 'other', "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+
+def test_config_snapshot():
+    logger.info(" Started Config Snapshot Tests")
+    t = ConfigSnapshotTests()
+    try:
+        t.test_snapshot()
+        t.test_install_snapshot()
+    finally:
+        t.teardown()
+    logger.info(" Completed Config Snapshot Tests. Success!")
+
+
+if __name__ == "__main__":
+    test_config_snapshot()
+    # %%
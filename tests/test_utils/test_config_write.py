@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \test_config_write.py                                                                                         #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 4:37:37 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 4:37:37 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+import os
+import shutil
+import tempfile
+import logging
+import inspect
+import multiprocessing as mp
+import pytest
+
+from nlr.utils.config import Config
+# ------------------------------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _write_options(filepath: str, writer: int, n: int) -> None:
+    config = Config(filepath)
+    for i in range(n):
+        config.write_config('CONCURRENT', 'writer_{}_option_{}'.format(writer, i), str(i))
+
+
+class ConfigWriteTests:
+
+    def __init__(self):
+        self.directory = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.directory, 'config.ini')
+
+    def teardown(self):
+        shutil.rmtree(self.directory)
+
+    def test_write_sections(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        config = Config(self.filepath)
+        config.write_sections({'BATCH_1': {'a': '1', 'b': '2'},
+                               'BATCH_2': {'c': '3'}})
+        assert config.read_section('BATCH_1') == {'a': '1', 'b': '2'}, "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert config.read_config('BATCH_2', 'c') == '3', "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_transaction_rollback(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        config = Config(self.filepath)
+        with pytest.raises(ValueError):
+            with config.transaction() as parser:
+                parser['BATCH_1']['a'] = 'changed'
+                raise ValueError()
+        assert config.read_config('BATCH_1', 'a') == '1', "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert [f for f in os.listdir(self.directory) if f.endswith('.tmp')] == [], "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_concurrent_writers(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        n_writers, n = 4, 25
+        processes = [mp.Process(target=_write_options, args=(self.filepath, w, n)) for w in range(n_writers)]
+        [p.start() for p in processes]
+        [p.join() for p in processes]
+
+        options = Config(self.filepath).read_section('CONCURRENT')
+        assert len(options) == n_writers * n, "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+
+def test_config_write():
+    logger.info(" Started Config Write Tests")
+    t = ConfigWriteTests()
+    try:
+        t.test_write_sections()
+        t.test_transaction_rollback()
+        t.test_concurrent_writers()
+    finally:
+        t.teardown()
+    logger.info(" Completed Config Write Tests. Success!")
+
+
+if __name__ == "__main__":
+    test_config_write()
+    # %%
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \test_history.py                                                                                              #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 4:48:25 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 6:06:17 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+import os
+import shutil
+import tempfile
+import logging
+import inspect
+from datetime import datetime, timedelta
+import numpy as np
+
+from nlr.utils.history import ProfileHistory, profile_record, main
+# ------------------------------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _run(history: ProfileHistory, run_id: str, start: datetime, wall_time: float, seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    records = []
+    for i in range(8):
+        profile = {'job': 'DownloadJob', 'start_time': start,
+                   'wall_time': timedelta(seconds=wall_time * rng.uniform(0.95, 1.05)),
+                   'rss': 1e8 * rng.uniform(0.95, 1.05), 'read_bytes': 1e6 * (i + 1), 'write_bytes': 1e6 * (i + 1)}
+        usage = {'read_bytes': 1e6, 'write_bytes': 1e6}
+        records.append(profile_record(run_id, 'DataSourceProject', '{}-{}'.format(run_id, i), profile, usage=usage))
+    history.append(records)
+
+
+class ProfileHistoryTests:
+
+    def __init__(self):
+        self.directory = tempfile.mkdtemp()
+        self.history = ProfileHistory(self.directory)
+        start = datetime(2021, 11, 1)
+        for day in range(3):
+            _run(self.history, 'baseline_{}'.format(day), start + timedelta(days=day), 1.0, day)
+        _run(self.history, 'steady', start + timedelta(days=3), 1.0, 3)
+        _run(self.history, 'slow', start + timedelta(days=4), 1.5, 4)
+
+    def teardown(self):
+        shutil.rmtree(self.directory)
+
+    def test_runs(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        runs = self.history.runs()
+        assert list(runs['run_id']) == ['baseline_0', 'baseline_1', 'baseline_2', 'steady', 'slow'], \
+            "Failure in {}".format(inspect.stack()[0][3])
+        assert (runs['jobs'] == 8).all(), "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_compare(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        baseline = ['baseline_0', 'baseline_1', 'baseline_2']
+        steady = self.history.compare('steady', baseline=baseline)
+        assert not steady['regression'].any(), "Failure in {}".format(inspect.stack()[0][3])
+
+        slow = self.history.compare('slow').set_index('metric')
+        assert slow.loc['wall_time', 'regression'], "Failure in {}".format(inspect.stack()[0][3])
+        assert slow.loc['wall_time', 'baseline_n'] == 32, "Failure in {}".format(inspect.stack()[0][3])
+        assert not slow.loc['peak_rss', 'regression'], "Failure in {}".format(inspect.stack()[0][3])
+        # The worker's running totals of bytes grow with each job it runs, but the job's own bytes do not.
+        assert not slow.loc['io_bytes', 'regression'] and slow.loc['io_bytes', 'median'] == 2e6, \
+            "Failure in {}".format(inspect.stack()[0][3])
+
+        assert main(['--directory', self.directory, 'compare', 'slow']) == 1, "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_record(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        profile = {'job': 'DownloadJob', 'rss': 100, 'read_bytes': 5000, 'write_bytes': 7000}
+        record = profile_record('run', 'DataSourceProject', 'job', profile, usage={'read_bytes': 10, 'write_bytes': 20})
+        assert record['io_bytes'] == 30 and record['write_bytes'] == 20, "Failure in {}".format(inspect.stack()[0][3])
+        # Without the job's usage, the process's totals are not taken for the job's.
+        record = profile_record('run', 'DataSourceProject', 'job', profile)
+        assert record['io_bytes'] is None and record['read_bytes'] is None, "Failure in {}".format(
+            inspect.stack()[0][3])
+        # The RSS at the end of an unsampled job is recorded as an estimate of its peak.
+        assert record['peak_rss'] == 100 and record['peak_rss_estimated'], "Failure in {}".format(
+            inspect.stack()[0][3])
+        record = profile_record('run', 'DataSourceProject', 'job', dict(profile, peak_rss=300))
+        assert record['peak_rss'] == 300 and not record['peak_rss_estimated'], "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_untested(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        # One job against one is too few to test, so even a large increase is reported untested and not flagged.
+        history = ProfileHistory(os.path.join(self.directory, 'untested'))
+        start = datetime(2021, 11, 1)
+        for run_id, wall_time, day in (('one', 1.0, 0), ('two', 3.0, 1)):
+            profile = {'job': 'DownloadJob', 'start_time': start + timedelta(days=day),
+                       'wall_time': timedelta(seconds=wall_time), 'rss': 1e8}
+            history.append([profile_record(run_id, 'DataSourceProject', run_id, profile)])
+        result = history.compare('two').set_index('metric')
+        assert result.loc['wall_time', 'change'] == 2.0, "Failure in {}".format(inspect.stack()[0][3])
+        assert np.isnan(result.loc['wall_time', 'p_value']) and not result['regression'].any(), \
+            "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+
+def test_history():
+    logger.info(" Started Profile History Tests")
+    t = ProfileHistoryTests()
+    try:
+        t.test_runs()
+        t.test_compare()
+        t.test_record()
+        t.test_untested()
+    finally:
+        t.teardown()
+    logger.info(" Completed Profile History Tests. Success!")
+
+
+if __name__ == "__main__":
+    test_history()
+    # %%
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \test_incremental.py                                                                                          #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 5:05:36 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 5:44:37 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+import os
+import shutil
+import tempfile
+import logging
+import inspect
+
+from nlr.data.base import Job, Worker, Manager, Project, BuilderRatings, Director
+from nlr.utils.config import Config, configfile
+from nlr.utils.incremental import StepInputs, StepCache
+# ------------------------------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _write(filepath: str, text: str) -> None:
+    with open(filepath, 'w') as fp:
+        fp.write(text)
+
+
+class CopyJob(Job):
+    def run(self) -> None:
+        pass
+
+    def inputs(self) -> StepInputs:
+        return StepInputs(files=[self.params['source']], params=self.params, version='1',
+                          outputs=[self.params['target']])
+
+
+class CopyWorker(Worker):
+    def _run(self) -> None:
+        shutil.copy(self.job.params['source'], self.job.params['target'])
+
+
+class CopyProject(Project):
+    pass
+
+
+class CopyManager(Manager):
+
+    def _create_jobs(self, params: list) -> list:
+        return [CopyJob({'source': source, 'target': source + '.copy', 'key': source}) for source in params]
+
+
+class CountingBuilder(BuilderRatings):
+    """Counts the steps run. Only the extract step declares its inputs."""
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.runs = []
+
+    def inputs(self, step: str) -> StepInputs:
+        if step == 'extract_data':
+            return StepInputs(files=[self.source], version='1', outputs=[self.source + '.extract'])
+        return None
+
+    def extract_data(self) -> None:
+        self.runs.append('extract_data')
+        shutil.copy(self.source, self.source + '.extract')
+
+    def clean_data(self) -> None:
+        self.runs.append('clean_data')
+
+
+class IncrementalTests:
+
+    def __init__(self):
+        self.cwd = os.getcwd()
+        self.directory = tempfile.mkdtemp()
+        os.chdir(self.directory)
+        os.makedirs(os.path.dirname(configfile))
+        Config().write_sections({'LOGGING': {'logdir': os.path.join(self.directory, 'logs')}})
+
+    def teardown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.directory)
+
+    def test_cache(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        source, target = os.path.join(self.directory, 'a.csv'), os.path.join(self.directory, 'b.csv')
+        _write(source, 'a')
+        _write(target, 'b')
+        inputs = StepInputs(files=[source], params={'n': 1}, version='1', outputs=[target])
+        cache = StepCache()
+        assert not cache.is_current('step', inputs), "Failure in {}".format(inspect.stack()[0][3])
+        cache.record('step', inputs)
+        cache.save()
+
+        # A new cache reads the manifest.
+        cache = StepCache()
+        assert cache.is_current('step', inputs), "Failure in {}".format(inspect.stack()[0][3])
+        assert not cache.is_current('step', StepInputs(files=[source], params={'n': 2}, version='1',
+                                                       outputs=[target])), "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert not cache.is_current('step', StepInputs(files=[source], params={'n': 1}, version='2',
+                                                       outputs=[target])), "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        # Rewriting a file with the same content leaves the step current, changing it does not.
+        _write(source, 'a')
+        assert cache.is_current('step', inputs), "Failure in {}".format(inspect.stack()[0][3])
+        _write(target, 'changed')
+        assert not cache.is_current('step', inputs), "Failure in {}".format(inspect.stack()[0][3])
+        cache.record('step', inputs)
+        os.remove(target)
+        assert not cache.is_current('step', inputs), "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_concurrent_caches(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        sources = [os.path.join(self.directory, name) for name in ('c.csv', 'd.csv', 'e.csv')]
+        for source in sources:
+            _write(source, source)
+        inputs = [StepInputs(files=[source], version='1') for source in sources]
+        first, second = StepCache(), StepCache()
+        first.record('c', inputs[0])
+        second.record('d', inputs[1])
+        first.invalidate('e')
+        second.record('e', inputs[2])
+        second.save()
+        first.save()
+
+        # Each cache's steps survive the other's save, and a step forgotten by the last to save is forgotten.
+        cache = StepCache()
+        assert cache.is_current('c', inputs[0]) and cache.is_current('d', inputs[1]), "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert not cache.is_current('e', inputs[2]), "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def _run(self, sources: list, force: bool = False) -> Project:
+        project = CopyProject(params=sources, worker=CopyWorker)
+        project.force = force
+        manager = CopyManager(project)
+        manager.create_jobs()
+        manager.process_results([CopyWorker(job).run() for job in project.jobs])
+        return project
+
+    def test_jobs(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        sources = [os.path.join(self.directory, '{}.json'.format(i)) for i in range(3)]
+        for source in sources:
+            _write(source, source)
+
+        project = self._run(sources)
+        assert len(project.jobs) == 3 and not project.skipped, "Failure in {}".format(inspect.stack()[0][3])
+        project = self._run(sources)
+        assert not project.jobs and len(project.skipped) == 3, "Failure in {}".format(inspect.stack()[0][3])
+
+        _write(sources[0], 'changed')
+        project = self._run(sources)
+        assert [job.params['source'] for job in project.jobs] == sources[:1], "Failure in {}".format(
+            inspect.stack()[0][3])
+        project = self._run(sources, force=True)
+        assert len(project.jobs) == 3, "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_director(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        source = os.path.join(self.directory, 'ratings.csv')
+        _write(source, 'ratings')
+        director = Director(resource_manager=None)
+        director.builder = CountingBuilder(source)
+        director.build_ratings_data()
+        director.build_ratings_data()
+        assert director.builder.runs == ['extract_data', 'clean_data', 'clean_data'], "Failure in {}".format(
+            inspect.stack()[0][3])
+        director.build_ratings_data(force=True)
+        assert director.builder.runs.count('extract_data') == 2, "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+
+def test_incremental():
+    logger.info(" Started Incremental Tests")
+    t = IncrementalTests()
+    try:
+        t.test_cache()
+        t.test_concurrent_caches()
+        t.test_jobs()
+        t.test_director()
+    finally:
+        t.teardown()
+    logger.info(" Completed Incremental Tests. Success!")
+
+
+if __name__ == "__main__":
+    test_incremental()
+    # %%
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \test_journal.py                                                                                              #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 5:20:32 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 6:10:45 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+import os
+import shutil
+import tempfile
+import logging
+import inspect
+
+from nlr.data.base import Job, Worker, Manager, Project, Reducer
+from nlr.process.admin import ProjectAdmin
+from nlr.process.dispatch import JobFailure, run_chunk
+from nlr.utils.config import Config, configfile
+from nlr.utils.journal import ProjectJournal, COMPLETED, SUCCEEDED
+# ------------------------------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class SumReducer(Reducer):
+
+    def init(self) -> int:
+        return 0
+
+    def accumulate(self, state: int, result: int) -> int:
+        return state + result
+
+    def merge(self, left: int, right: int) -> int:
+        return left + right
+
+
+class CountJob(Job):
+    def run(self) -> None:
+        pass
+
+
+class CountWorker(Worker):
+    """Returns its number, noting each run in a file named for it."""
+
+    def _run(self) -> int:
+        with open(os.path.join(self.job.params['directory'], str(self.job.params['n'])), 'a') as fp:
+            fp.write('run\n')
+        return self.job.params['n']
+
+
+class CountProject(Project):
+    pass
+
+
+class CountManager(Manager):
+    # Commit after every result, so that an interruption loses none.
+    journal_interval = 0
+
+    def _create_jobs(self, params: list) -> list:
+        return [CountJob({'n': n, 'directory': directory}) for n, directory in params]
+
+
+class SumManager(CountManager):
+
+    def _create_reducer(self) -> Reducer:
+        return SumReducer()
+
+
+class JournalTests:
+
+    def __init__(self):
+        self.cwd = os.getcwd()
+        self.directory = tempfile.mkdtemp()
+        os.chdir(self.directory)
+        os.makedirs(os.path.dirname(configfile))
+        Config().write_sections({'LOGGING': {'logdir': os.path.join(self.directory, 'logs')}})
+
+    def teardown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.directory)
+
+    def _runs(self, directory: str) -> dict:
+        return {int(n): len(open(os.path.join(directory, n)).readlines()) for n in os.listdir(directory)}
+
+    def _project(self, name: str, manager: type) -> Project:
+        directory = os.path.join(self.directory, name)
+        os.makedirs(directory)
+        project = CountProject(params=[(n, directory) for n in range(10)], worker=CountWorker)
+        project.journal = True
+        manager(project).create_jobs()
+        return project
+
+    def test_resume(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        project = self._project('resume', CountManager)
+        manager = project.manager
+        manager.begin_results()
+        for job in project.jobs[:4]:
+            manager.process_result(CountWorker(job).run())
+        manager.process_failure(JobFailure(project.jobs[4], ValueError('failed')))
+        # Interrupted: the process dies before the project completes.
+        manager._journal.close()
+
+        resumed = ProjectAdmin().get_project(project.id)
+        assert len(resumed.resumed) == 4 and len(resumed.jobs) == 6, "Failure in {}".format(inspect.stack()[0][3])
+        assert resumed.jobs[0].params['n'] == 4, "Failure in {}".format(inspect.stack()[0][3])
+        resumed.manager.process_results([CountWorker(job).run() for job in resumed.jobs])
+
+        # Every job ran exactly once, and the results include those of the interrupted run.
+        assert self._runs(os.path.join(self.directory, 'resume')) == {n: 1 for n in range(10)}, \
+            "Failure in {}".format(inspect.stack()[0][3])
+        assert sorted(result.result for result in resumed.results) == list(range(10)), "Failure in {}".format(
+            inspect.stack()[0][3])
+        state = {id: state for id, name, state, created, updated in ProjectJournal().projects()}
+        assert state[project.id] == COMPLETED, "Failure in {}".format(inspect.stack()[0][3])
+        # Once the project completes, its stored results are deleted and only its states are kept.
+        journal = ProjectJournal()
+        assert not os.path.exists(os.path.join(journal.directory, project.id)), "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert set(journal.job_states(project.id).values()) == {SUCCEEDED}, "Failure in {}".format(
+            inspect.stack()[0][3])
+        try:
+            ProjectAdmin().get_project(project.id)
+            raise AssertionError("Failure in {}".format(inspect.stack()[0][3]))
+        except ValueError:
+            pass
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_partials(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        project = self._project('partials', SumManager)
+        manager = project.manager
+        manager.begin_results()
+        # Chunks reduced in the workers: each chunk's partial state arrives before its jobs' results.
+        for chunk in (project.jobs[:4], project.jobs[4:7]):
+            outcomes, partial = run_chunk(CountWorker, chunk, manager.reducer)
+            manager.process_partial(partial)
+            for outcome in outcomes:
+                manager.process_result(outcome)
+        # Interrupted mid-project. The last chunk's writes were not committed with a later chunk's partial state.
+        manager._journal.close()
+
+        resumed = ProjectAdmin().get_project(project.id)
+        assert [job.params['n'] for job in resumed.jobs] == list(range(4, 10)), "Failure in {}".format(
+            inspect.stack()[0][3])
+        resumed.manager.begin_results()
+        outcomes, partial = run_chunk(CountWorker, resumed.jobs, resumed.manager.reducer)
+        resumed.manager.process_partial(partial)
+        for outcome in outcomes:
+            resumed.manager.process_result(outcome)
+        resumed.manager.end_results()
+        assert resumed.results == sum(range(10)), "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_planned(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        directory = os.path.join(self.directory, 'planned')
+        os.makedirs(directory)
+        project = CountProject(params=[(n, directory) for n in range(10)], worker=CountWorker)
+        project.journal = True
+        manager = CountManager(project)
+        manager.create_jobs(plan=True)
+        # Planning alone does not journal the project. Running it does.
+        journaled = {id for id, name, state, created, updated in ProjectJournal().projects()}
+        assert project.id not in journaled, "Failure in {}".format(inspect.stack()[0][3])
+        manager.process_results([CountWorker(job).run() for job in project.jobs])
+        state = {id: state for id, name, state, created, updated in ProjectJournal().projects()}
+        assert state[project.id] == COMPLETED, "Failure in {}".format(inspect.stack()[0][3])
+        assert set(ProjectJournal().job_states(project.id).values()) == {SUCCEEDED}, "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+
+def test_journal():
+    logger.info(" Started Journal Tests")
+    t = JournalTests()
+    try:
+        t.test_resume()
+        t.test_partials()
+        t.test_planned()
+    finally:
+        t.teardown()
+    logger.info(" Completed Journal Tests. Success!")
+
+
+if __name__ == "__main__":
+    test_journal()
+    # %%
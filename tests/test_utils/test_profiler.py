@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \test_profiler.py                                                                                             #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 4:44:29 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 5:38:36 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+import time
+import logging
+import inspect
+import pandas as pd
+
+from nlr.utils.system import Profiler
+# ------------------------------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class ProfilerTests:
+
+    def test_snapshot(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        p = Profiler('snapshot')
+        p.start()
+        p.end()
+        assert p.samples is None and p.summary() == {}, "Failure in {}".format(inspect.stack()[0][3])
+        assert p.stats['job'] == 'snapshot', "Failure in {}".format(inspect.stack()[0][3])
+        assert isinstance(p.profile, pd.DataFrame), "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_counters(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        p = Profiler('counters', snapshot=False)
+        p.start()
+        p.end()
+        # Only the counters are taken, and the open files and connections are not listed.
+        assert p.stats['job'] == 'counters' and p.stats['rss'] > 0, "Failure in {}".format(inspect.stack()[0][3])
+        assert 'num_open_files' not in p.stats, "Failure in {}".format(inspect.stack()[0][3])
+        assert p.usage()['peak_rss'] == p.stats['rss'], "Failure in {}".format(inspect.stack()[0][3])
+        assert isinstance(p.profile, pd.DataFrame), "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_sampling(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        p = Profiler('sampling', interval=0.01, capacity=8)
+        p.start()
+        data = [0] * 10 ** 6
+        time.sleep(0.2)
+        p.end()
+
+        # The ring buffer retains only the newest samples.
+        samples = p.samples
+        assert len(samples) == 8, "Failure in {}".format(inspect.stack()[0][3])
+        assert samples['time'].is_monotonic_increasing, "Failure in {}".format(inspect.stack()[0][3])
+
+        summary = p.summary()
+        assert summary['n_samples'] == 8, "Failure in {}".format(inspect.stack()[0][3])
+        assert summary['peak_rss'] >= summary['mean_rss'] > 0, "Failure in {}".format(inspect.stack()[0][3])
+        assert summary['duration'] > 0, "Failure in {}".format(inspect.stack()[0][3])
+        del data
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+
+def test_profiler():
+    logger.info(" Started Profiler Tests")
+    t = ProfilerTests()
+    t.test_snapshot()
+    t.test_counters()
+    t.test_sampling()
+    logger.info(" Completed Profiler Tests. Success!")
+
+
+if __name__ == "__main__":
+    test_profiler()
+    # %%
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \test_sharedarray.py                                                                                          #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 5:07:28 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 5:07:28 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+import os
+import pickle
+import logging
+import inspect
+import multiprocessing as mp
+
+import numpy as np
+
+from nlr.data.base import Job, Worker, Project
+from nlr.process.dispatch import Dispatcher
+from nlr.utils import sharedarray
+# ------------------------------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class MatrixJob(Job):
+    def run(self) -> None:
+        pass
+
+
+class MatrixWorker(Worker):
+    """Returns an n by 1000 matrix, filled in place or shared from a copy."""
+
+    def _run(self) -> sharedarray.ArrayHandle:
+        n = self.job.params['n']
+        if self.job.params['in_place']:
+            handle = self.allocate((n, 1000), 'float32')
+            handle.array[...] = n
+            return handle
+        return self.share(np.full((n, 1000), n, dtype='float32'))
+
+
+class SharedArrayTests:
+
+    def test_pool(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        project = Project(params=[], worker=MatrixWorker)
+        jobs = [MatrixJob({'n': n, 'in_place': n % 2 == 0}) for n in range(1, 9)]
+        for job in jobs:
+            job.project_id = project.id
+        with mp.Pool(processes=2) as pool:
+            results, failures = Dispatcher(pool, MatrixWorker, processes=2, chunksize=1).run(jobs)
+        assert not failures, "Failure in {}".format(inspect.stack()[0][3])
+
+        handles = sorted((result.result for result in results), key=lambda handle: handle.shape[0])
+        assert len(sharedarray.owned(project.id)) == 8, "Failure in {}".format(inspect.stack()[0][3])
+        for handle in handles:
+            n = handle.shape[0]
+            assert handle.kind == ('mmap' if os.name == 'nt' else 'shm'), "Failure in {}".format(
+                inspect.stack()[0][3])
+            # The parent's array is a view of the worker's memory, not a copy.
+            assert not handle.array.flags.owndata, "Failure in {}".format(inspect.stack()[0][3])
+            assert handle.array.shape == (n, 1000) and (handle.array == n).all(), "Failure in {}".format(
+                inspect.stack()[0][3])
+
+        view = handles[0].array
+        project.close()
+        assert not sharedarray.owned(project.id), "Failure in {}".format(inspect.stack()[0][3])
+        # Views taken before the project was closed remain valid.
+        assert (view == 1).all(), "Failure in {}".format(inspect.stack()[0][3])
+        if handles[0].kind == 'shm':
+            try:
+                sharedarray.shared_memory.SharedMemory(name=handles[0].name)
+                assert False, "Failure in {}".format(inspect.stack()[0][3])
+            except FileNotFoundError:
+                pass
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_mmap(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        threshold = sharedarray.MMAP_THRESHOLD
+        sharedarray.MMAP_THRESHOLD = 0
+        try:
+            with Project(params=[], worker=MatrixWorker) as project:
+                handle = sharedarray.share(np.arange(10), project.id)
+                assert handle.kind == 'mmap', "Failure in {}".format(inspect.stack()[0][3])
+                # Pickling hands the array to the unpickling process, here this one.
+                received = pickle.loads(pickle.dumps(handle))
+                assert sharedarray.owned(project.id) == [received], "Failure in {}".format(inspect.stack()[0][3])
+                assert (received.array == np.arange(10)).all(), "Failure in {}".format(inspect.stack()[0][3])
+                filepath = received.name
+            assert not os.path.exists(filepath), "Failure in {}".format(inspect.stack()[0][3])
+        finally:
+            sharedarray.MMAP_THRESHOLD = threshold
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+
+def test_sharedarray():
+    logger.info(" Started Shared Array Tests")
+    t = SharedArrayTests()
+    t.test_pool()
+    t.test_mmap()
+    logger.info(" Completed Shared Array Tests. Success!")
+
+
+if __name__ == "__main__":
+    test_sharedarray()
+    # %%
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \test_spans.py                                                                                                #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 4:45:41 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 4:45:41 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+import time
+import logging
+import inspect
+import multiprocessing as mp
+
+from nlr.utils.spans import SpanRecorder, span, recording, current_path
+# ------------------------------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@span('query')
+def _query():
+    time.sleep(0.01)
+
+
+def _job(parent: tuple) -> dict:
+    recorder = SpanRecorder()
+    with recording(recorder, parent=parent):
+        with span('Job'):
+            _query()
+            _query()
+    return recorder.export()
+
+
+class SpanTests:
+
+    def test_nesting(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        recorder = SpanRecorder()
+        with recording(recorder):
+            with span('Director'):
+                assert current_path() == ('Director',), "Failure in {}".format(inspect.stack()[0][3])
+                for _ in range(3):
+                    _query()
+        spans = recorder.export()
+        assert set(spans) == {('Director',), ('Director', 'query')}, "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert spans[('Director', 'query')][0] == 3, "Failure in {}".format(inspect.stack()[0][3])
+        assert spans[('Director',)][1] >= spans[('Director', 'query')][1] >= 0.03, "Failure in {}".format(
+            inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_workers(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        recorder = SpanRecorder()
+        with recording(recorder, parent=('Project',)):
+            parent = current_path()
+        with mp.Pool(2) as pool:
+            for spans in pool.map(_job, [parent] * 4):
+                recorder.merge(spans)
+        spans = recorder.export()
+        assert spans[('Project', 'Job')][0] == 4, "Failure in {}".format(inspect.stack()[0][3])
+        assert spans[('Project', 'Job', 'query')][0] == 8, "Failure in {}".format(inspect.stack()[0][3])
+        df = recorder.to_frame()
+        assert list(df['depth']) == [1, 2], "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+
+def test_spans():
+    logger.info(" Started Span Tests")
+    t = SpanTests()
+    t.test_nesting()
+    t.test_workers()
+    logger.info(" Completed Span Tests. Success!")
+
+
+if __name__ == "__main__":
+    test_spans()
+    # %%
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \test_stacks.py                                                                                               #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james.sf@gmail.com                                                                                       #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 4:46:43 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 4:46:43 pm                                                                         #
+# Modifier : John James (john.james.sf@gmail.com)                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+import os
+import time
+import shutil
+import tempfile
+import logging
+import inspect
+
+from nlr.data.base import Job, Worker
+from nlr.utils.stacks import StackSampler, write_collapsed, read_collapsed
+# ------------------------------------------------------------------------------------------------------------------------ #
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _hot(seconds: float) -> int:
+    n = 0
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        n += 1
+    return n
+
+
+class HotJob(Job):
+    def run(self) -> None:
+        pass
+
+
+class HotWorker(Worker):
+    def _run(self):
+        return _hot(self.job.params['seconds'])
+
+
+class StackSamplerTests:
+
+    def test_sampler(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        with StackSampler(interval=0.005) as sampler:
+            _hot(0.3)
+        assert sampler.n_samples > 10, "Failure in {}".format(inspect.stack()[0][3])
+        assert any(stack.endswith('_hot') for stack in sampler.stacks), "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert sampler.overhead < 0.05, "Failure in {}".format(inspect.stack()[0][3])
+
+        directory = tempfile.mkdtemp()
+        try:
+            filepath = write_collapsed(sampler.export(), os.path.join(directory, 'job.folded'))
+            assert read_collapsed(filepath) == sampler.stacks, "Failure in {}".format(inspect.stack()[0][3])
+        finally:
+            shutil.rmtree(directory)
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+    def test_worker(self):
+        logger.info("    Started {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+        job = HotJob({'seconds': 0.2})
+        job.stack_interval = 0.005
+        results = HotWorker(job).run()
+        assert results.stacks, "Failure in {}".format(inspect.stack()[0][3])
+        assert any(stack.endswith('test_stacks:_hot') for stack in results.stacks), "Failure in {}".format(
+            inspect.stack()[0][3])
+        assert results.spans[('HotJob',)][0] == 1, "Failure in {}".format(inspect.stack()[0][3])
+
+        logger.info("    Successfully completed {} {}".format(
+            self.__class__.__name__, inspect.stack()[0][3]))
+
+
+def test_stacks():
+    logger.info(" Started Stack Sampler Tests")
+    t = StackSamplerTests()
+    t.test_sampler()
+    t.test_worker()
+    logger.info(" Completed Stack Sampler Tests. Success!")
+
+
+if __name__ == "__main__":
+    test_stacks()
+    # %%